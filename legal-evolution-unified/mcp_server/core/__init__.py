@@ -7,10 +7,13 @@ Core components for the MCP server including configuration and server initializa
 
 from .server import LegalEvolutionMCPServer
 from .config import ServerConfig, TOOL_CONFIGS, validate_config
+from .executor import ToolExecutor, DispatchingServer
 
 __all__ = [
     'LegalEvolutionMCPServer',
     'ServerConfig',
     'TOOL_CONFIGS',
-    'validate_config'
+    'validate_config',
+    'ToolExecutor',
+    'DispatchingServer'
 ]
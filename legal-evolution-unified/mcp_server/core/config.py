@@ -33,7 +33,7 @@ class ServerConfig:
     cache_ttl: int = 3600  # 1 hour default
     cache_dir: Optional[Path] = None
     
-    # Performance tuning
+    # Performance tuning: concurrent tool calls and per-call time limit
     max_workers: int = 4
     timeout_seconds: int = 30
     
@@ -78,6 +78,12 @@ class ServerConfig:
         if cache_enabled := os.getenv('MCP_CACHE_ENABLED'):
             config.cache_enabled = cache_enabled.lower() in ('true', '1', 'yes')
         
+        if max_workers := os.getenv('MCP_MAX_WORKERS'):
+            config.max_workers = int(max_workers)
+        
+        if timeout_seconds := os.getenv('MCP_TIMEOUT_SECONDS'):
+            config.timeout_seconds = int(timeout_seconds)
+        
         return config
 
 
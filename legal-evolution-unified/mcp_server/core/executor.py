@@ -0,0 +1,174 @@
+"""
+Legal Evolution MCP Server - Tool Executor
+===========================================
+
+Runs tool handlers off the event loop so CPU-heavy NumPy/SciPy work in one
+request does not block other clients.
+
+Tool handlers are `async def` closures with synchronous bodies. Each call
+is executed on a bounded thread pool, inside a private event loop owned by
+the worker thread, and the server loop only awaits its completion. Closures
+cannot be pickled, so a thread pool is used rather than a process pool;
+NumPy, SciPy and BLAS release the GIL for the heavy kernels.
+
+A thread cannot be killed, so a timed-out call that is already running
+keeps its worker until it returns. The executor counts these abandoned
+workers and, while all of them are taken, answers new calls with a
+"server busy" error at once instead of queueing them behind work that
+nobody is waiting for.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List
+
+from mcp.types import TextContent
+
+
+ToolHandler = Callable[[str, dict], Awaitable[List[TextContent]]]
+
+
+class ToolExecutor:
+    """
+    Bounded worker pool with per-call timeouts for MCP tool handlers.
+
+    Example:
+        executor = ToolExecutor(max_workers=4, timeout_seconds=30)
+        dispatch = executor.wrap(call_calculate_jurisrank)
+        result = await dispatch("calculate_jurisrank_fitness", arguments)
+    """
+
+    def __init__(self, max_workers: int, timeout_seconds: float,
+                 logger: logging.Logger = None):
+        """
+        Args:
+            max_workers: Maximum tool calls executing at once
+            timeout_seconds: Time limit per tool call
+            logger: Logger instance
+        """
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self._lock = threading.Lock()
+        self._abandoned = 0
+
+    @property
+    def abandoned_workers(self) -> int:
+        """Workers still running calls that already timed out."""
+        with self._lock:
+            return self._abandoned
+
+    def wrap(self, handler: ToolHandler) -> ToolHandler:
+        """Return a handler that runs `handler` on the pool with the configured timeout."""
+        @functools.wraps(handler)
+        async def dispatch(name: str, arguments: dict) -> List[TextContent]:
+            return await self.run(handler, name, arguments)
+        return dispatch
+
+    async def run(self, handler: ToolHandler, name: str, arguments: dict) -> List[TextContent]:
+        """
+        Execute one tool call on the pool.
+
+        On timeout the client gets an error immediately and the call is
+        cancelled: a call still queued never starts, and a running handler
+        receives CancelledError at its next await. Synchronous work already
+        in progress cannot be interrupted and keeps its worker until it
+        returns, so at most max_workers calls ever compete for CPU. While
+        every worker is held by such abandoned work, calls are rejected
+        with a "server busy" error without being queued.
+        """
+        if self.abandoned_workers >= self.max_workers:
+            self.logger.warning(f"Tool {name} rejected: all {self.max_workers} workers "
+                                f"are still running timed-out calls")
+            return [TextContent(type="text", text=f"Error: server busy, {name} was not started "
+                                                  f"because all workers are still running timed-out calls")]
+
+        loop = asyncio.get_running_loop()
+        state: Dict[str, Any] = {}
+        future = loop.run_in_executor(self._pool, self._execute, handler, name, arguments, state)
+
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self._cancel(state)
+            self._abandon(state)
+            self.logger.error(f"Tool {name} timed out after {self.timeout_seconds}s")
+            return [TextContent(type="text", text=f"Error: {name} timed out after {self.timeout_seconds} seconds")]
+        except asyncio.CancelledError:
+            # The client went away; stop the worker as well
+            self._cancel(state)
+            self._abandon(state)
+            raise
+
+    def shutdown(self):
+        """Stop accepting calls and drop queued ones."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, handler: ToolHandler, name: str, arguments: dict,
+                 state: Dict[str, Any]) -> List[TextContent]:
+        """Worker-thread body: drive the handler coroutine on a private event loop."""
+        with self._lock:
+            state['running'] = True
+        loop = asyncio.new_event_loop()
+        try:
+            task = loop.create_task(handler(name, arguments))
+            state['loop'], state['task'] = loop, task
+            if state.get('cancelled'):
+                task.cancel()
+            return loop.run_until_complete(task)
+        finally:
+            state.pop('loop', None)
+            loop.close()
+            with self._lock:
+                state['running'] = False
+                if state.get('abandoned'):
+                    self._abandoned -= 1
+
+    def _abandon(self, state: Dict[str, Any]):
+        """Count the worker of a timed-out call as abandoned until the call returns."""
+        with self._lock:
+            if state.get('running'):
+                state['abandoned'] = True
+                self._abandoned += 1
+
+    @staticmethod
+    def _cancel(state: Dict[str, Any]):
+        """Cancel a call whether it is queued or already running."""
+        state['cancelled'] = True
+        loop, task = state.get('loop'), state.get('task')
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed: the call has finished
+
+
+class DispatchingServer:
+    """
+    Proxy for an MCP Server whose call_tool() registers handlers through a
+    ToolExecutor.
+
+    The decorated function itself is returned unchanged, so a handler that
+    awaits another handler directly (e.g. identify_hub_cases reusing
+    calculate_jurisrank_fitness) stays on the worker it is already using.
+    """
+
+    def __init__(self, server, executor: ToolExecutor):
+        self._server = server
+        self._executor = executor
+
+    def call_tool(self, *args, **kwargs):
+        register = self._server.call_tool(*args, **kwargs)
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            register(self._executor.wrap(handler))
+            return handler
+
+        return decorator
+
+    def __getattr__(self, attr):
+        return getattr(self._server, attr)
@@ -19,6 +19,7 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 from .config import ServerConfig, validate_config, TOOL_CONFIGS
+from .executor import ToolExecutor, DispatchingServer
 from ..utils.cache import CacheManager
 from ..utils.logging import setup_logging
 from ..utils.validation import ValidationError
@@ -32,6 +33,7 @@ class LegalEvolutionMCPServer:
     - Modular tool registration
     - Intelligent caching
     - Comprehensive validation
+    - Tool calls run on a bounded worker pool with timeouts
     - 98% token reduction vs traditional approach
     
     Example:
@@ -69,6 +71,14 @@ class LegalEvolutionMCPServer:
         # Create MCP server instance
         self.server = Server(self.config.name)
         
+        # CPU-bound tool bodies run on a worker pool, not the event loop
+        self.executor = ToolExecutor(
+            max_workers=self.config.max_workers,
+            timeout_seconds=self.config.timeout_seconds,
+            logger=self.logger
+        )
+        self.tool_server = DispatchingServer(self.server, self.executor)
+        
         # Register tools
         self._register_tools()
         
@@ -100,32 +110,37 @@ class LegalEvolutionMCPServer:
     def _register_cli_tools(self) -> int:
         """Register CLI Calculator tools."""
         from ..tools.cli_tools import register_cli_tools
-        return register_cli_tools(self.server, self.config, self.cache, self.logger)
+        return register_cli_tools(self.tool_server, self.config, self.cache, self.logger)
     
     def _register_jurisrank_tools(self) -> int:
         """Register JurisRank tools."""
         from ..tools.jurisrank_tools import register_jurisrank_tools
-        return register_jurisrank_tools(self.server, self.config, self.cache, self.logger)
+        return register_jurisrank_tools(self.tool_server, self.config, self.cache, self.logger)
     
     def _register_egt_tools(self) -> int:
         """Register EGT Framework tools."""
         from ..tools.egt_tools import register_egt_tools
-        return register_egt_tools(self.server, self.config, self.cache, self.logger)
+        return register_egt_tools(self.tool_server, self.config, self.cache, self.logger)
     
     def _register_workflow_tools(self) -> int:
         """Register integrated workflow tools."""
         from ..tools.workflow_tools import register_workflow_tools
-        return register_workflow_tools(self.server, self.config, self.cache, self.logger)
+        return register_workflow_tools(self.tool_server, self.config, self.cache, self.logger)
     
     async def run(self):
         """Run the MCP server via stdio."""
-        async with stdio_server() as (read_stream, write_stream):
-            self.logger.info("Server started, listening on stdio")
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                self.logger.info("Server started, listening on stdio")
+                self.logger.info(f"Tool calls: {self.config.max_workers} workers, "
+                                 f"{self.config.timeout_seconds}s timeout")
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            self.executor.shutdown()
 
 
 def main():
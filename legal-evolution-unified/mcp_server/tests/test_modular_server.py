@@ -195,6 +195,115 @@ def test_cli_calculator_integration():
     assert abs(hv_ratio - (H / V)) < 0.01
 
 
+def test_tool_executor_dispatch_and_timeout():
+    """Test that tool calls run off the event loop and time out."""
+    import asyncio
+    import threading
+    import time
+    from mcp.types import TextContent
+    from mcp_server.core import ToolExecutor
+    
+    async def slow_tool(name, arguments):
+        time.sleep(arguments["seconds"])  # CPU-bound stand-in, blocks its thread
+        return [TextContent(type="text", text=threading.current_thread().name)]
+    
+    async def scenario():
+        executor = ToolExecutor(max_workers=2, timeout_seconds=1)
+        dispatch = executor.wrap(slow_tool)
+        try:
+            start = time.perf_counter()
+            slow, fast = await asyncio.gather(
+                dispatch("slow", {"seconds": 0.5}),
+                dispatch("fast", {"seconds": 0.0})
+            )
+            elapsed = time.perf_counter() - start
+            timed_out = await dispatch("stuck", {"seconds": 1.5})
+        finally:
+            executor.shutdown()
+        return slow, fast, elapsed, timed_out
+    
+    slow, fast, elapsed, timed_out = asyncio.run(scenario())
+    
+    # Both calls ran on pool workers, concurrently
+    assert slow[0].text.startswith("mcp-tool")
+    assert fast[0].text.startswith("mcp-tool")
+    assert elapsed < 0.9
+    
+    assert "timed out" in timed_out[0].text
+
+
+def test_tool_executor_busy_after_worker_timeouts():
+    """Test that calls are rejected, not queued, while every worker runs timed-out work."""
+    import asyncio
+    import time
+    from mcp.types import TextContent
+    from mcp_server.core import ToolExecutor
+    
+    async def slow_tool(name, arguments):
+        time.sleep(arguments["seconds"])  # Synchronous body, cannot be interrupted
+        return [TextContent(type="text", text="done")]
+    
+    async def scenario():
+        executor = ToolExecutor(max_workers=2, timeout_seconds=0.3)
+        dispatch = executor.wrap(slow_tool)
+        try:
+            stuck = await asyncio.gather(
+                dispatch("stuck_1", {"seconds": 1.2}),
+                dispatch("stuck_2", {"seconds": 1.2})
+            )
+            abandoned = executor.abandoned_workers
+            
+            start = time.perf_counter()
+            busy = await dispatch("fast", {"seconds": 0.0})
+            busy_elapsed = time.perf_counter() - start
+            
+            # Once the abandoned calls return, their workers serve new calls again
+            await asyncio.sleep(1.2)
+            recovered = await dispatch("fast", {"seconds": 0.0})
+            remaining = executor.abandoned_workers
+        finally:
+            executor.shutdown()
+        return stuck, abandoned, busy, busy_elapsed, recovered, remaining
+    
+    stuck, abandoned, busy, busy_elapsed, recovered, remaining = asyncio.run(scenario())
+    
+    assert all("timed out" in result[0].text for result in stuck)
+    assert abandoned == 2
+    assert "server busy" in busy[0].text
+    assert busy_elapsed < 0.1
+    assert recovered[0].text == "done"
+    assert remaining == 0
+
+
+def test_tool_executor_partial_abandonment():
+    """Test that a free worker still serves calls while another runs timed-out work."""
+    import asyncio
+    import time
+    from mcp.types import TextContent
+    from mcp_server.core import ToolExecutor
+    
+    async def slow_tool(name, arguments):
+        time.sleep(arguments["seconds"])
+        return [TextContent(type="text", text="done")]
+    
+    async def scenario():
+        executor = ToolExecutor(max_workers=2, timeout_seconds=0.3)
+        dispatch = executor.wrap(slow_tool)
+        try:
+            stuck = await dispatch("stuck", {"seconds": 1.0})
+            fast = await dispatch("fast", {"seconds": 0.0})
+            abandoned = executor.abandoned_workers
+        finally:
+            executor.shutdown()
+        return stuck, fast, abandoned
+    
+    stuck, fast, abandoned = asyncio.run(scenario())
+    
+    assert "timed out" in stuck[0].text
+    assert fast[0].text == "done"
+    assert abandoned == 1
+
+
 def test_architecture_completeness():
     """Test that all architectural components are present."""
     import os
@@ -206,6 +315,7 @@ def test_architecture_completeness():
     assert (mcp_dir / "core" / "__init__.py").exists()
     assert (mcp_dir / "core" / "server.py").exists()
     assert (mcp_dir / "core" / "config.py").exists()
+    assert (mcp_dir / "core" / "executor.py").exists()
     
     # Check tools directory
     assert (mcp_dir / "tools" / "__init__.py").exists()
@@ -27,7 +27,8 @@ def analyze_doctrinal_competition(
     initial_prevalence: List[float],
     competition_matrix: List[List[float]],
     time_horizon: int = 50,
-    carrying_capacity: List[float] = None
+    carrying_capacity: List[float] = None,
+    ode_method: str = "lsoda"
 ) -> Dict[str, Any]:
     """
     Model competitive dynamics between legal doctrines using Lotka-Volterra.
@@ -38,6 +39,7 @@ def analyze_doctrinal_competition(
         competition_matrix: NxN matrix of competition coefficients
         time_horizon: Years to simulate
         carrying_capacity: Max prevalence for each doctrine (defaults to 1.0)
+        ode_method: Integrator ("lsoda", or "bdf"/"radau" for stiff systems)
     
     Returns:
         Dict with trajectories, equilibria, phase transitions
@@ -48,24 +50,24 @@ def analyze_doctrinal_competition(
     if carrying_capacity is None:
         carrying_capacity = [1.0] * n_doctrines
     
-    # Lotka-Volterra dynamics
-    def lotka_volterra(y, t, r, K, alpha):
-        """
-        dy/dt = r * y * (1 - (y + alpha*y_other)/K)
-        """
-        dydt = np.zeros(n_doctrines)
-        for i in range(n_doctrines):
-            competition_sum = sum(alpha[i][j] * y[j] for j in range(n_doctrines) if i != j)
-            dydt[i] = r[i] * y[i] * (1 - (y[i] + competition_sum) / K[i])
-        return dydt
+    # Lotka-Volterra dynamics: dy/dt = r * y * (1 - (y + alpha*y_other)/K),
+    # i.e. intraspecific competition coefficient 1 on the diagonal
+    alpha = np.array(competition_matrix, dtype=float)
+    np.fill_diagonal(alpha, 1.0)
     
     # Growth rates (assume 0.1 for all)
-    r = [0.1] * n_doctrines
+    r = np.full(n_doctrines, 0.1)
     
     # Simulate
-    from scipy.integrate import odeint
     t = np.linspace(0, time_horizon, time_horizon * 10)
-    solution = odeint(lotka_volterra, initial_prevalence, t, args=(r, carrying_capacity, competition_matrix))
+    solution = memespace.simulate_competition(
+        np.asarray(initial_prevalence, dtype=float),
+        alpha,
+        t,
+        growth_rates=r,
+        carrying_capacities=np.asarray(carrying_capacity, dtype=float),
+        ode_method=ode_method
+    )
     
     # Detect phase transitions (sudden changes in prevalence)
     transitions = []
@@ -14,6 +14,10 @@ from typing import Dict, List, Any
 # Initialize RootFinder instance (reusable)
 _rootfinder_instance = None
 
+# Last citation network converted to a graph. Reusing the same graph object
+# for an unchanged network lets RootFinder serve cached genealogies.
+_network_graph = (None, None)
+
 def get_rootfinder() -> RootFinder:
     """Get or create RootFinder singleton instance"""
     global _rootfinder_instance
@@ -21,6 +25,27 @@ def get_rootfinder() -> RootFinder:
         _rootfinder_instance = RootFinder()
     return _rootfinder_instance
 
+def get_network_graph(citation_network: Dict[str, List[str]]) -> nx.DiGraph:
+    """Convert a citation dict to a NetworkX graph, reusing the last graph if unchanged"""
+    global _network_graph
+    key = tuple((source, tuple(targets)) for source, targets in citation_network.items())
+    if _network_graph[0] != key:
+        G = nx.DiGraph()
+        for source, targets in citation_network.items():
+            for target in targets:
+                G.add_edge(source, target)
+        _network_graph = (key, G)
+    return _network_graph[1]
+
+def rootfinder_cache_stats() -> Dict[str, Any]:
+    """
+    Get genealogy cache statistics of the shared RootFinder.
+    
+    Returns:
+        Dict with cache size, capacity, hits, misses, hit rate, evictions and invalidations
+    """
+    return get_rootfinder().genealogy_cache.get_stats()
+
 def trace_lineage(
     case_id: str,
     citation_network: Dict[str, List[str]],
@@ -42,16 +67,13 @@ def trace_lineage(
     finder = get_rootfinder()
     
     # Convert citation dict to NetworkX graph
-    G = nx.DiGraph()
-    for source, targets in citation_network.items():
-        for target in targets:
-            G.add_edge(source, target)
+    G = get_network_graph(citation_network)
     
     # Run ABAN algorithm
     try:
-        genealogy = finder.trace_ancestry(
-            G, 
-            case_id, 
+        genealogy = finder.trace_genealogy(
+            case_id,
+            G,
             max_depth=max_depth
         )
         
@@ -19,6 +19,12 @@ class JudgeState(AgentState):
     ideological_leaning: str = "centrist"  # progressive, centrist, conservative
     citation_influence: float = 0.5  # JurisRank score
     
+    # Judicial review parameters (used by SimulationEnvironment._process_reform)
+    doctrine: str = "moderate"  # progressive, moderate, conservative
+    precedent_weight: float = 0.5  # 0.0 to 1.0
+    constitutional_interpretation: str = "flexible"  # strict, flexible
+    labor_rights_priority: float = 0.5  # 0.0 to 1.0
+    
     def __post_init__(self):
         """Initialize judge-specific beliefs"""
         super().__post_init__() if hasattr(super(), '__post_init__') else None
@@ -17,6 +17,7 @@ class LegislatorState(AgentState):
     party_affiliation: str = "centrist"  # left, center-left, centrist, center-right, right
     electoral_security: float = 0.5  # 0.0 (vulnerable) to 1.0 (safe seat)
     reform_commitment: float = 0.5  # Commitment to pushing reforms
+    ideology_flexibility: float = 0.5  # Willingness to vote against party line
     union_ties: float = 0.5  # Connection to unions
     business_ties: float = 0.5  # Connection to employers
     
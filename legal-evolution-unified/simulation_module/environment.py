@@ -12,7 +12,7 @@ Integration with EPT Theory:
 - Historical validation scenarios
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Sequence
 from dataclasses import dataclass, field
 import random
 import numpy as np
@@ -25,6 +25,11 @@ from .agents.union import Union, UnionState
 from .agents.employer import Employer, EmployerState
 from .agents.legislator import Legislator, LegislatorState
 from .agents.judge import Judge, JudgeState
+from .population import ArrayPopulation
+from .history import HistoryBuffer
+
+# Agent engines: per-object agents (agents/) or struct-of-arrays (population.py)
+ENGINES = ('object', 'array')
 
 
 @dataclass
@@ -112,6 +117,60 @@ class EnvironmentState:
         }
 
 
+class EnvironmentSnapshot:
+    """
+    Agent-facing view of EnvironmentState
+    
+    Holds a single dict that is refreshed in place from the state. It is
+    only rewritten when one of the state fields it depends on has
+    changed, so repeated reads within a timestep cost nothing.
+    """
+    
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+        self._source: Optional[Tuple] = None
+    
+    def refresh(self, state: EnvironmentState) -> Dict[str, Any]:
+        """
+        Bring the snapshot up to date with state
+        
+        Args:
+            state: Current environment state
+        
+        Returns:
+            The (shared) environment dict for agent decision-making
+        """
+        source = (
+            state.timestep, state.cli_memetic, state.cli_corporate, state.cli_oligarchic,
+            state.alpha, state.beta, state.gamma, state.mfd,
+            state.crisis_active, state.crisis_salience,
+            state.reform_proposed, state.reform_targets_ultraactivity,
+            state.government_reform_appetite, state.unemployment_rate,
+            state.informal_employment_rate
+        )
+        if source == self._source:
+            return self.values
+        
+        cli = state.cli
+        self.values.update({
+            'timestep': state.timestep,
+            'cli': cli,
+            'mfd': state.mfd,
+            'crisis_active': state.crisis_active,
+            'crisis_salience': state.crisis_salience,
+            'reform_proposed': state.reform_proposed,
+            'reform_targets_ultraactivity': state.reform_targets_ultraactivity,
+            'enforcement_level': 1.0 - cli,
+            'formal_benefits': 0.5 + 0.2 * (1.0 - cli),
+            'informal_benefits': 0.5 + 0.2 * cli,
+            'government_support': state.government_reform_appetite,
+            'unemployment_rate': state.unemployment_rate,
+            'informal_employment_rate': state.informal_employment_rate
+        })
+        self._source = source
+        return self.values
+
+
 @dataclass
 class ReformProposal:
     """Represents a reform attempt"""
@@ -151,6 +210,11 @@ class SimulationEnvironment:
     5. Process reform (legislative + judicial)
     6. Update environment state
     7. Record history
+    
+    Engines:
+    - 'object': one Python agent object per agent (default)
+    - 'array': ArrayPopulation with vectorized decisions and interactions,
+      for scenarios with hundreds of thousands of workers
     """
     
     def __init__(
@@ -170,7 +234,10 @@ class SimulationEnvironment:
         employer_coordination_range: Tuple[int, int] = (4, 7),
         crisis_probability: float = 0.05,
         reform_proposal_interval: int = 20,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        engine: str = 'object',
+        history_variables: Optional[Sequence[str]] = None,
+        history_decimation: int = 1
     ):
         """
         Initialize simulation environment
@@ -188,7 +255,14 @@ class SimulationEnvironment:
             crisis_probability: Probability of crisis per timestep
             reform_proposal_interval: Timesteps between reform proposals
             random_seed: Random seed for reproducibility
+            engine: 'object' (per-agent objects) or 'array' (ArrayPopulation)
+            history_variables: State variables to record (default: all, see history.HISTORY_VARIABLES)
+            history_decimation: Record history every k-th timestep
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Choose from {ENGINES}")
+        self.engine = engine
+        
         if random_seed is not None:
             random.seed(random_seed)
             np.random.seed(random_seed)
@@ -219,14 +293,27 @@ class SimulationEnvironment:
         self.judges: List[Judge] = []
         
         # Create agents
-        self._create_worker_population(n_workers)
-        self._create_union_population(n_unions, union_militancy_range)
-        self._create_employer_population(n_employers, employer_coordination_range)
-        self._create_legislator_population(n_legislators)
-        self._create_judge_population(n_judges)
-        
-        # History tracking
-        self.history: List[Dict[str, Any]] = []
+        self.population: Optional[ArrayPopulation] = None
+        if engine == 'array':
+            self.population = ArrayPopulation.create(
+                n_workers, n_unions, n_employers, n_legislators, n_judges,
+                union_militancy_range=union_militancy_range,
+                employer_coordination_range=employer_coordination_range,
+                random_seed=random_seed
+            )
+        else:
+            self._create_worker_population(n_workers)
+            self._create_union_population(n_unions, union_militancy_range)
+            self._create_employer_population(n_employers, employer_coordination_range)
+            self._create_legislator_population(n_legislators)
+            self._create_judge_population(n_judges)
+        
+        # Agent-facing environment view and actions chosen this timestep
+        self._snapshot = EnvironmentSnapshot()
+        self.last_actions: Dict[str, List[str]] = {}
+        
+        # History tracking (columnar; see history.HistoryBuffer)
+        self.history_buffer = HistoryBuffer(history_variables, decimation=history_decimation)
         self.reform_history: List[ReformProposal] = []
         
         # Current reform
@@ -274,8 +361,8 @@ class SimulationEnvironment:
                 party_affiliation=random.choice(['left', 'center', 'right']),
                 electoral_security=np.random.beta(3, 3),
                 ideology_flexibility=np.random.beta(2, 2),
-                union_connections=np.random.beta(2, 2),
-                business_connections=np.random.beta(2, 2)
+                union_ties=np.random.beta(2, 2),
+                business_ties=np.random.beta(2, 2)
             )
             self.legislators.append(Legislator(state))
     
@@ -315,10 +402,20 @@ class SimulationEnvironment:
         
         # 3. Agents decide actions
         environment_dict = self._get_environment_dict()
-        for agent_list in [self.workers, self.unions, self.employers, self.legislators, self.judges]:
-            for agent in agent_list:
-                action = agent.decide_action(environment_dict)
-                # Actions are stored in agent state for interaction phase
+        if self.population is not None:
+            self.population.decide_actions(environment_dict)
+        else:
+            # Recorded so aggregates reuse the actual decisions
+            self.last_actions = {
+                name: [agent.decide_action(environment_dict) for agent in agent_list]
+                for name, agent_list in [
+                    ('workers', self.workers),
+                    ('unions', self.unions),
+                    ('employers', self.employers),
+                    ('legislators', self.legislators),
+                    ('judges', self.judges)
+                ]
+            }
         
         # 4. Agent interactions (network effects)
         self._execute_agent_interactions()
@@ -333,11 +430,23 @@ class SimulationEnvironment:
         # 7. Record history
         self._record_history()
     
+    def _random(self) -> float:
+        """Uniform draw for environment events (array engine: the population's Generator)"""
+        if self.population is not None:
+            return float(self.population.rng.random())
+        return random.random()
+    
+    def _beta(self, a: float, b: float) -> float:
+        """Beta draw for environment events (array engine: the population's Generator)"""
+        if self.population is not None:
+            return float(self.population.rng.beta(a, b))
+        return np.random.beta(a, b)
+    
     def _check_crisis_events(self):
         """Check for economic/political crisis (stochastic)"""
-        if random.random() < self.crisis_probability:
+        if self._random() < self.crisis_probability:
             self.state.crisis_active = True
-            self.state.crisis_salience = np.random.beta(3, 1)  # Skewed toward high salience
+            self.state.crisis_salience = self._beta(3, 1)  # Skewed toward high salience
             self.state.government_reform_appetite += 0.3
             self.state.government_reform_appetite = min(1.0, self.state.government_reform_appetite)
         else:
@@ -350,8 +459,8 @@ class SimulationEnvironment:
     def _propose_reform(self):
         """Propose a labor market reform"""
         # Reform targeting decision
-        targets_ultraactivity = random.random() < 0.7  # 70% of reforms target ultraactivity
-        targets_constitutional = random.random() < 0.3  # 30% target constitutional provisions
+        targets_ultraactivity = self._random() < 0.7  # 70% of reforms target ultraactivity
+        targets_constitutional = self._random() < 0.3  # 30% target constitutional provisions
         
         expected_cli_reduction = 0.0
         if targets_ultraactivity:
@@ -365,7 +474,7 @@ class SimulationEnvironment:
             targets_ultraactivity=targets_ultraactivity,
             targets_constitutional=targets_constitutional,
             expected_cli_reduction=expected_cli_reduction,
-            political_cost=np.random.beta(2, 2)
+            political_cost=self._beta(2, 2)
         )
         
         self.current_reform = reform
@@ -375,6 +484,10 @@ class SimulationEnvironment:
     
     def _execute_agent_interactions(self):
         """Execute agent-to-agent interactions (network effects)"""
+        if self.population is not None:
+            self.population.execute_interactions()
+            return
+        
         # Union-Worker interactions
         for union in self.unions:
             # Each union interacts with subset of workers
@@ -415,6 +528,11 @@ class SimulationEnvironment:
         votes_for = 0
         votes_against = 0
         
+        if self.population is not None:
+            votes_for, votes_against = self.population.legislative_vote(
+                self.state.crisis_active, self.state.avg_union_militancy
+            )
+        
         for legislator in self.legislators:
             # Legislator vote depends on:
             # - Party affiliation
@@ -442,6 +560,11 @@ class SimulationEnvironment:
                 # Judges vote on constitutionality
                 judges_uphold = 0
                 judges_strike = 0
+                n_judges = len(self.judges)
+                
+                if self.population is not None:
+                    judges_uphold, judges_strike = self.population.judicial_review(reform.targets_ultraactivity)
+                    n_judges = len(self.population.judges)
                 
                 for judge in self.judges:
                     uphold_prob = self._calculate_judge_uphold_probability(judge, reform)
@@ -450,7 +573,7 @@ class SimulationEnvironment:
                     else:
                         judges_uphold += 1
                 
-                reform.judicial_review_passed = judges_strike < (len(self.judges) // 2 + 1)
+                reform.judicial_review_passed = judges_strike < (n_judges // 2 + 1)
             else:
                 # Low CLI: judicial review not triggered or passes easily
                 reform.judicial_review_passed = True
@@ -588,10 +711,19 @@ class SimulationEnvironment:
     def _update_environment_state(self):
         """Update aggregate state variables"""
         # Agent aggregates
+        if self.population is not None:
+            # Compliance from this timestep's recorded worker decisions
+            self.state.avg_worker_compliance = self.population.worker_compliance()
+            if len(self.population.unions):
+                self.state.avg_union_militancy = self.population.avg_union_militancy()
+            if len(self.population.employers):
+                self.state.avg_employer_coordination = self.population.avg_employer_coordination()
+        
         if self.workers:
-            compliances = [1.0 if w.decide_action(self._get_environment_dict()) == "comply_formal" else 0.0 
-                          for w in random.sample(self.workers, min(50, len(self.workers)))]
-            self.state.avg_worker_compliance = np.mean(compliances)
+            # Compliance from this timestep's recorded worker decisions
+            worker_actions = self.last_actions.get('workers', [])
+            if worker_actions:
+                self.state.avg_worker_compliance = worker_actions.count("comply_formal") / len(worker_actions)
         
         if self.unions:
             self.state.avg_union_militancy = np.mean([u.state.militancy for u in self.unions])
@@ -615,26 +747,22 @@ class SimulationEnvironment:
         self.state.mfd = (r_informal * e_informal * a_informal) / (r_formal * e_formal * a_formal)
     
     def _get_environment_dict(self) -> Dict[str, Any]:
-        """Get environment state as dictionary for agent decision-making"""
-        return {
-            'timestep': self.state.timestep,
-            'cli': self.state.cli,
-            'mfd': self.state.mfd,
-            'crisis_active': self.state.crisis_active,
-            'crisis_salience': self.state.crisis_salience,
-            'reform_proposed': self.state.reform_proposed,
-            'reform_targets_ultraactivity': self.state.reform_targets_ultraactivity,
-            'enforcement_level': 1.0 - self.state.cli,
-            'formal_benefits': 0.5 + 0.2 * (1.0 - self.state.cli),
-            'informal_benefits': 0.5 + 0.2 * self.state.cli,
-            'government_support': self.state.government_reform_appetite,
-            'unemployment_rate': self.state.unemployment_rate,
-            'informal_employment_rate': self.state.informal_employment_rate
-        }
+        """
+        Get environment state as dictionary for agent decision-making
+        
+        Returns the shared EnvironmentSnapshot dict, refreshed from state.
+        Treat it as read-only and copy it if it must outlive the timestep.
+        """
+        return self._snapshot.refresh(self.state)
+    
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Recorded history as a list of per-timestep dicts (built on access)"""
+        return self.history_buffer.to_records()
     
     def _record_history(self):
         """Record current state to history"""
-        self.history.append(self.state.to_dict())
+        self.history_buffer.record(self.state)
     
     def run(self, n_timesteps: int):
         """
@@ -643,6 +771,7 @@ class SimulationEnvironment:
         Args:
             n_timesteps: Number of timesteps to simulate
         """
+        self.history_buffer.reserve(self.state.timestep + n_timesteps)
         for _ in range(n_timesteps):
             self.step()
     
@@ -678,10 +807,7 @@ class SimulationEnvironment:
                 'reform_success_rate': self.state.reforms_succeeded / max(1, self.state.reforms_attempted),
                 'final_cli': self.state.cli,
                 'final_mfd': self.state.mfd,
-                'cli_trajectory': [h['cli'] for h in self.history],
-                'mfd_trajectory': [h['mfd'] for h in self.history]
-            }
-        }
-tory]
+                'cli_trajectory': self.history_buffer['cli'].tolist() if 'cli' in self.history_buffer else [],
+                'mfd_trajectory': self.history_buffer['mfd'].tolist() if 'mfd' in self.history_buffer else []
             }
         }
@@ -0,0 +1,174 @@
+"""
+HistoryBuffer - Columnar Simulation History
+===========================================
+
+Preallocated, columnar replacement for the list of state dicts that
+SimulationEnvironment used to append every timestep.
+
+Each tracked variable is one NumPy array, written in place at the current
+row. Only a configurable subset of variables needs to be tracked, and
+recording can be decimated (every k-th timestep). Exports to pandas and
+Arrow are built from the columns directly instead of per-row dicts.
+
+Usage:
+    env = SimulationEnvironment(history_variables=('cli', 'mfd'), history_decimation=5)
+    env.run(500)
+    df = env.history_buffer.to_pandas()
+    cli = env.history_buffer['cli']
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Callable, Tuple
+from operator import attrgetter
+import numpy as np
+import pandas as pd
+
+
+def _reform_success_rate(state) -> float:
+    return state.reforms_succeeded / max(1, state.reforms_attempted)
+
+
+# Trackable variables: name -> (dtype, getter on EnvironmentState).
+# Names and order match EnvironmentState.to_dict().
+HISTORY_VARIABLES: Dict[str, Tuple[type, Callable[[Any], Any]]] = {
+    'timestep': (np.int64, attrgetter('timestep')),
+    'cli_memetic': (np.float64, attrgetter('cli_memetic')),
+    'cli_corporate': (np.float64, attrgetter('cli_corporate')),
+    'cli_oligarchic': (np.float64, attrgetter('cli_oligarchic')),
+    'cli': (np.float64, attrgetter('cli')),
+    'mfd': (np.float64, attrgetter('mfd')),
+    'constitutional_rigidity': (np.float64, attrgetter('constitutional_rigidity')),
+    'ultraactivity_protection': (np.float64, attrgetter('ultraactivity_protection')),
+    'judicial_review_strength': (np.float64, attrgetter('judicial_review_strength')),
+    'gdp_per_capita': (np.float64, attrgetter('gdp_per_capita')),
+    'unemployment_rate': (np.float64, attrgetter('unemployment_rate')),
+    'informal_employment_rate': (np.float64, attrgetter('informal_employment_rate')),
+    'crisis_active': (np.bool_, attrgetter('crisis_active')),
+    'crisis_salience': (np.float64, attrgetter('crisis_salience')),
+    'reforms_attempted': (np.int64, attrgetter('reforms_attempted')),
+    'reforms_succeeded': (np.int64, attrgetter('reforms_succeeded')),
+    'reform_success_rate': (np.float64, _reform_success_rate),
+}
+
+
+class HistoryBuffer:
+    """
+    Preallocated columnar history of EnvironmentState
+
+    One NumPy array per tracked variable. 'timestep' is always tracked so
+    decimated histories stay aligned with simulation time. Capacity grows
+    geometrically if more rows are recorded than reserved.
+    """
+
+    def __init__(
+        self,
+        variables: Optional[Sequence[str]] = None,
+        decimation: int = 1,
+        capacity: int = 0
+    ):
+        """
+        Initialize history buffer
+
+        Args:
+            variables: Variables to track (default: all of HISTORY_VARIABLES)
+            decimation: Record every k-th timestep (1 = every timestep)
+            capacity: Number of rows to preallocate
+        """
+        if variables is None:
+            variables = list(HISTORY_VARIABLES)
+        unknown = [v for v in variables if v not in HISTORY_VARIABLES]
+        if unknown:
+            raise ValueError(f"Unknown history variables {unknown}. Choose from {list(HISTORY_VARIABLES)}")
+        if decimation < 1:
+            raise ValueError(f"decimation must be >= 1, got {decimation}")
+
+        self.variables: List[str] = ['timestep'] + [v for v in dict.fromkeys(variables) if v != 'timestep']
+        self.decimation = decimation
+        self._getters = [HISTORY_VARIABLES[v][1] for v in self.variables]
+        self._columns: Dict[str, np.ndarray] = {
+            v: np.empty(capacity, dtype=HISTORY_VARIABLES[v][0]) for v in self.variables
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, variable: str) -> bool:
+        return variable in self._columns
+
+    def __getitem__(self, variable: str) -> np.ndarray:
+        """View of the recorded values for one variable"""
+        return self._columns[variable][:self._size]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns['timestep'])
+
+    def reserve(self, n_timesteps: int):
+        """
+        Make room for the rows produced by timesteps up to n_timesteps
+
+        Args:
+            n_timesteps: Last timestep that will be recorded
+        """
+        needed = n_timesteps // self.decimation + 1
+        if needed > self.capacity:
+            self._resize(needed)
+
+    def _resize(self, capacity: int):
+        for v, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[v] = grown
+
+    def record(self, state):
+        """
+        Record state if its timestep falls on the decimation grid
+
+        Args:
+            state: EnvironmentState
+        """
+        if state.timestep % self.decimation:
+            return
+        if self._size == self.capacity:
+            self._resize(max(16, 2 * self.capacity))
+        row = self._size
+        for v, getter in zip(self.variables, self._getters):
+            self._columns[v][row] = getter(state)
+        self._size += 1
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Views of all recorded columns (no copy)"""
+        return {v: self[v] for v in self.variables}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """History as a list of per-timestep dicts (legacy format)"""
+        lists = {v: self[v].tolist() for v in self.variables}
+        return [
+            {v: lists[v][i] for v in self.variables}
+            for i in range(self._size)
+        ]
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        History as a DataFrame indexed by timestep
+
+        Columns are handed to pandas without an explicit copy, but pandas
+        may still copy when it consolidates same-dtype columns, so sharing
+        memory with the buffer is best-effort. Copy the frame before
+        modifying it in place.
+        """
+        columns = self.columns()
+        index = pd.Index(columns.pop('timestep'), name='timestep')
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def to_arrow(self):
+        """
+        History as a pyarrow.Table (non-boolean numeric columns are wrapped without copying)
+
+        Requires pyarrow.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow required for Arrow export. Install with: pip install pyarrow")
+        return pa.table({v: pa.array(self[v]) for v in self.variables})
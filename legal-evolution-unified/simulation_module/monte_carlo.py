@@ -6,8 +6,11 @@ Parallel execution of multiple simulation runs with statistical analysis.
 
 Features:
 - Multi-core parallel processing
+- Chunked dispatch with shared-memory trajectory aggregation
+- Sequential (wave-based) runs with convergence-based early stopping
 - Robust statistical analysis (mean, median, std, confidence intervals)
 - Sensitivity analysis for parameter exploration
+- Multi-parameter sensitivity designs (factorial, LHS, Sobol) with checkpoint/resume
 - Publication-ready results with uncertainty quantification
 
 Usage:
@@ -21,10 +24,15 @@ Usage:
     print(f"95% CI: [{results.reform_success_rate_ci[0]:.3f}, {results.reform_success_rate_ci[1]:.3f}]")
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Callable
+from typing import Dict, Any, List, Optional, Tuple, Callable, Union, Sequence
 from dataclasses import dataclass, field
 import numpy as np
+from scipy import stats
+from scipy.stats import qmc
+import itertools
+import copy
 from multiprocessing import Pool, cpu_count
+from multiprocessing import shared_memory
 from functools import partial
 import json
 from pathlib import Path
@@ -35,6 +43,29 @@ from .environment import SimulationEnvironment
 from .scenarios import ScenarioLibrary, ScenarioConfig
 
 
+# Dispatch modes: one pool task per run, or seed batches per task with
+# trajectories written to shared memory
+DISPATCH_MODES = ('task', 'chunked')
+
+# Quantities monitored by MonteCarloRunner.run_adaptive
+CONVERGENCE_METRICS = ('reform_success_rate', 'final_cli', 'final_mfd')
+
+# Sensitivity designs for MonteCarloRunner.sensitivity_grid
+SENSITIVITY_DESIGNS = ('factorial', 'lhs', 'sobol')
+
+# Scenario parameters that take integer values (rounded in sampled designs)
+_INTEGER_PARAMETERS = {
+    'union_militancy_min', 'union_militancy_max',
+    'employer_coordination_min', 'employer_coordination_max'
+}
+
+# (min, max) parameter pairs describing one scenario range
+_RANGE_PARAMETERS = (
+    ('union_militancy_min', 'union_militancy_max'),
+    ('employer_coordination_min', 'employer_coordination_max')
+)
+
+
 @dataclass
 class MonteCarloResults:
     """
@@ -51,24 +82,24 @@ class MonteCarloResults:
     n_converged: int
     
     # Reform success statistics
-    mean_reform_success_rate: float
-    median_reform_success_rate: float
-    std_reform_success_rate: float
-    reform_success_rate_ci: Tuple[float, float]  # 95% CI
+    mean_reform_success_rate: float = 0.0
+    median_reform_success_rate: float = 0.0
+    std_reform_success_rate: float = 0.0
+    reform_success_rate_ci: Tuple[float, float] = (0.0, 0.0)  # 95% CI
     reform_success_rates: List[float] = field(default_factory=list)
     
     # CLI evolution statistics
-    mean_final_cli: float
-    median_final_cli: float
-    std_final_cli: float
-    final_cli_ci: Tuple[float, float]
+    mean_final_cli: float = 0.0
+    median_final_cli: float = 0.0
+    std_final_cli: float = 0.0
+    final_cli_ci: Tuple[float, float] = (0.0, 0.0)
     final_cli_values: List[float] = field(default_factory=list)
     
     # MFD statistics
-    mean_final_mfd: float
-    median_final_mfd: float
-    std_final_mfd: float
-    final_mfd_ci: Tuple[float, float]
+    mean_final_mfd: float = 0.0
+    median_final_mfd: float = 0.0
+    std_final_mfd: float = 0.0
+    final_mfd_ci: Tuple[float, float] = (0.0, 0.0)
     final_mfd_values: List[float] = field(default_factory=list)
     
     # Trajectory statistics (timestep-by-timestep)
@@ -84,6 +115,10 @@ class MonteCarloResults:
     # Raw results for detailed analysis
     all_results: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Sequential runs (run_adaptive): per-wave running means and CI half-widths
+    convergence_history: List[Dict[str, Any]] = field(default_factory=list)
+    precision_reached: Optional[bool] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -113,7 +148,8 @@ class MonteCarloResults:
                 'ci_95': [round(x, 2) for x in self.final_mfd_ci]
             },
             
-            'execution_time_seconds': round(self.execution_time_seconds, 2)
+            'execution_time_seconds': round(self.execution_time_seconds, 2),
+            'precision_reached': self.precision_reached
         }
     
     def save_json(self, filepath: str):
@@ -165,42 +201,21 @@ def _run_single_simulation(args: Tuple[ScenarioConfig, int, int]) -> Dict[str, A
     scenario, iteration, seed = args
     
     try:
-        # Create environment with triple capture decomposition
-        env = SimulationEnvironment(
-            n_workers=scenario.n_workers,
-            n_unions=scenario.n_unions,
-            n_employers=scenario.n_employers,
-            n_legislators=scenario.n_legislators,
-            n_judges=scenario.n_judges,
-            initial_cli=scenario.initial_cli,
-            initial_mfd=scenario.initial_mfd,
-            # Triple capture components (if provided in scenario)
-            initial_cli_memetic=scenario.initial_cli_memetic,
-            initial_cli_corporate=scenario.initial_cli_corporate,
-            initial_cli_oligarchic=scenario.initial_cli_oligarchic,
-            union_militancy_range=scenario.union_militancy_range,
-            employer_coordination_range=scenario.employer_coordination_range,
-            crisis_probability=scenario.crisis_probability,
-            reform_proposal_interval=scenario.reform_proposal_interval,
-            random_seed=seed
-        )
-        
-        # Run simulation
-        env.run(scenario.n_timesteps)
+        env = _simulate(scenario, seed)
         
-        # Get results
-        results = env.get_results()
+        # Get results (trajectories stay NumPy columns to keep pickling cheap)
+        final_state = env.state.to_dict()
         
         return {
             'iteration': iteration,
             'success': True,
-            'reform_success_rate': results['summary_stats']['reform_success_rate'],
-            'final_cli': results['final_state']['cli'],
-            'final_mfd': results['final_state']['mfd'],
-            'cli_trajectory': results['summary_stats']['cli_trajectory'],
-            'mfd_trajectory': results['summary_stats']['mfd_trajectory'],
-            'reforms_attempted': results['summary_stats']['reforms_attempted'],
-            'reforms_succeeded': results['summary_stats']['reforms_succeeded']
+            'reform_success_rate': final_state['reform_success_rate'],
+            'final_cli': final_state['cli'],
+            'final_mfd': final_state['mfd'],
+            'cli_trajectory': env.history_buffer['cli'],
+            'mfd_trajectory': env.history_buffer['mfd'],
+            'reforms_attempted': env.state.reforms_attempted,
+            'reforms_succeeded': env.state.reforms_succeeded
         }
     
     except Exception as e:
@@ -211,6 +226,125 @@ def _run_single_simulation(args: Tuple[ScenarioConfig, int, int]) -> Dict[str, A
         }
 
 
+def _run_scalar_simulation(args: Tuple[int, ScenarioConfig, int, int]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run single simulation for a sensitivity job, returning scalars only
+    
+    Args:
+        args: Tuple of (point_index, scenario_config, iteration_number, random_seed)
+    
+    Returns:
+        (point_index, result dictionary without trajectories)
+    """
+    point_index, scenario, iteration, seed = args
+    result = _run_single_simulation((scenario, iteration, seed))
+    result.pop('cli_trajectory', None)
+    result.pop('mfd_trajectory', None)
+    return point_index, result
+
+
+def _simulate(scenario: ScenarioConfig, seed: Optional[int]) -> SimulationEnvironment:
+    """Build and run one environment for scenario (records cli/mfd history only)"""
+    # Create environment with triple capture decomposition
+    env = SimulationEnvironment(
+        n_workers=scenario.n_workers,
+        n_unions=scenario.n_unions,
+        n_employers=scenario.n_employers,
+        n_legislators=scenario.n_legislators,
+        n_judges=scenario.n_judges,
+        initial_cli=scenario.initial_cli,
+        initial_mfd=scenario.initial_mfd,
+        # Triple capture components (if provided in scenario)
+        initial_cli_memetic=scenario.initial_cli_memetic,
+        initial_cli_corporate=scenario.initial_cli_corporate,
+        initial_cli_oligarchic=scenario.initial_cli_oligarchic,
+        union_militancy_range=scenario.union_militancy_range,
+        employer_coordination_range=scenario.employer_coordination_range,
+        crisis_probability=scenario.crisis_probability,
+        reform_proposal_interval=scenario.reform_proposal_interval,
+        random_seed=seed,
+        # Only the trajectories aggregated by MonteCarloRunner are recorded
+        history_variables=('cli', 'mfd')
+    )
+    
+    # Run simulation
+    env.run(scenario.n_timesteps)
+    return env
+
+
+# Per-process state for chunked dispatch (set by _init_chunk_worker)
+_chunk_scenario: Optional[ScenarioConfig] = None
+_chunk_shm: Optional[shared_memory.SharedMemory] = None
+_chunk_trajectories: Optional[np.ndarray] = None
+
+
+def _init_chunk_worker(scenario: ScenarioConfig, shm_name: str, shape: Tuple[int, int, int]):
+    """
+    Pool initializer for chunked dispatch
+    
+    Receives the scenario once per worker process and attaches the shared
+    trajectory matrix of shape (2, n_runs, n_timesteps): [0] = CLI, [1] = MFD.
+    """
+    global _chunk_scenario, _chunk_shm, _chunk_trajectories
+    _chunk_scenario = scenario
+    _chunk_shm = shared_memory.SharedMemory(name=shm_name)
+    _chunk_trajectories = np.ndarray(shape, dtype=np.float64, buffer=_chunk_shm.buf)
+
+
+def _run_simulation_chunk(chunk: List[Tuple[int, int, Optional[int]]]) -> List[Dict[str, Any]]:
+    """
+    Run a batch of seeds for chunked dispatch
+    
+    Trajectories are written into the shared matrix at `row`; only scalar
+    summaries are returned.
+    
+    Args:
+        chunk: List of (row, iteration_number, random_seed)
+    
+    Returns:
+        List of scalar result dictionaries
+    """
+    results = []
+    for row, iteration, seed in chunk:
+        try:
+            env = _simulate(_chunk_scenario, seed)
+            final_state = env.state.to_dict()
+            
+            cli = env.history_buffer['cli']
+            _chunk_trajectories[0, row, :len(cli)] = cli
+            _chunk_trajectories[1, row, :len(cli)] = env.history_buffer['mfd']
+            
+            results.append({
+                'row': row,
+                'iteration': iteration,
+                'success': True,
+                'reform_success_rate': final_state['reform_success_rate'],
+                'final_cli': final_state['cli'],
+                'final_mfd': final_state['mfd'],
+                'trajectory_length': len(cli),
+                'reforms_attempted': env.state.reforms_attempted,
+                'reforms_succeeded': env.state.reforms_succeeded
+            })
+        except Exception as e:
+            results.append({
+                'row': row,
+                'iteration': iteration,
+                'success': False,
+                'error': str(e)
+            })
+    return results
+
+
+def _release_chunk_worker():
+    """Detach in-process chunked-dispatch state (sequential chunked mode)"""
+    global _chunk_scenario, _chunk_shm, _chunk_trajectories
+    _chunk_trajectories = None
+    if _chunk_shm is not None:
+        _chunk_shm.close()
+    _chunk_shm = None
+    _chunk_scenario = None
+
+
 class MonteCarloRunner:
     """
     Monte Carlo simulation runner with parallel processing
@@ -233,7 +367,9 @@ class MonteCarloRunner:
         n_iterations: int = 1000,
         n_jobs: int = -1,
         random_seed: Optional[int] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        dispatch: str = 'task',
+        chunk_size: Optional[int] = None
     ):
         """
         Initialize Monte Carlo runner
@@ -243,11 +379,20 @@ class MonteCarloRunner:
             n_jobs: Number of parallel jobs (-1 = all CPUs, 1 = sequential)
             random_seed: Random seed for reproducibility
             verbose: Show progress bars and messages
+            dispatch: 'task' (one pool task per run) or 'chunked' (scenario
+                sent once per worker, seed batches per task, trajectories
+                returned through shared memory)
+            chunk_size: Runs per task in chunked mode (default: ~4 chunks per job)
         """
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch '{dispatch}'. Choose from {DISPATCH_MODES}")
+        
         self.n_iterations = n_iterations
         self.n_jobs = cpu_count() if n_jobs == -1 else n_jobs
         self.random_seed = random_seed
         self.verbose = verbose
+        self.dispatch = dispatch
+        self.chunk_size = chunk_size
         
         self.scenario_library = ScenarioLibrary()
         
@@ -285,39 +430,221 @@ class MonteCarloRunner:
         else:
             seeds = [None] * n_iter
         
-        # Prepare arguments for parallel execution
-        args_list = [(scenario, i, seeds[i]) for i in range(n_iter)]
+        results_list = self._execute(scenario, seeds, show_progress=self.verbose)
+        
+        execution_time = time.time() - start_time
+        
+        # Process results
+        return self._process_results(
+            scenario_name=scenario_name,
+            results_list=results_list,
+            execution_time=execution_time
+        )
+    
+    def run_adaptive(
+        self,
+        scenario_name: str,
+        precision: Union[float, Dict[str, float]] = 0.01,
+        max_iterations: Optional[int] = None,
+        min_iterations: int = 50,
+        wave_size: Optional[int] = None,
+        confidence: float = 0.95
+    ) -> MonteCarloResults:
+        """
+        Run Monte Carlo in waves until the estimates are precise enough
+        
+        After each wave, the running mean and the confidence interval of the
+        mean (Student t) are computed for reform_success_rate, final_cli and
+        final_mfd. Sampling stops once every CI half-width is within its
+        target, or when max_iterations runs have been used. Seeds follow the
+        same sequence as run_scenario, so an adaptive run is a prefix of the
+        corresponding fixed-size run.
+        
+        Args:
+            scenario_name: Name of scenario from library
+            precision: Target CI half-width of the mean, either one value for
+                all metrics or a dict {metric: half_width} over CONVERGENCE_METRICS
+            max_iterations: Iteration budget (default: self.n_iterations)
+            min_iterations: Runs before convergence is first checked
+            wave_size: Runs per wave (default: max(min_iterations, 4 * n_jobs))
+            confidence: Confidence level for the intervals
+        
+        Returns:
+            MonteCarloResults with convergence_history and precision_reached
+        """
+        if isinstance(precision, dict):
+            unknown = set(precision) - set(CONVERGENCE_METRICS)
+            if unknown:
+                raise ValueError(f"Unknown metrics {sorted(unknown)}. Choose from {CONVERGENCE_METRICS}")
+            targets = dict(precision)
+        else:
+            targets = {metric: precision for metric in CONVERGENCE_METRICS}
+        
+        scenario = self.scenario_library.get_scenario(scenario_name)
+        budget = max_iterations if max_iterations is not None else self.n_iterations
+        wave = wave_size or max(min_iterations, 4 * max(1, self.n_jobs))
+        
+        if self.verbose:
+            print(f"Running adaptive Monte Carlo analysis: {scenario_name}")
+            print(f"Targets (CI half-width): {targets}, budget: {budget} iterations")
+            print()
+        
+        start_time = time.time()
+        results_list: List[Dict[str, Any]] = []
+        history: List[Dict[str, Any]] = []
+        reached = False
+        
+        while len(results_list) < budget:
+            n_done = len(results_list)
+            n_next = min(max(wave, min_iterations - n_done), budget - n_done)
+            
+            if self.random_seed is not None:
+                seeds = [self.random_seed + n_done + i for i in range(n_next)]
+            else:
+                seeds = [None] * n_next
+            results_list.extend(self._execute(scenario, seeds, first_iteration=n_done))
+            
+            successful = [r for r in results_list if r.get('success', False)]
+            if len(successful) < 2:
+                continue
+            
+            diagnostics = {'n_iterations': len(results_list), 'n_converged': len(successful)}
+            for metric in CONVERGENCE_METRICS:
+                mean, half_width = self._mean_confidence_half_width(
+                    [r[metric] for r in successful], confidence
+                )
+                diagnostics[f'mean_{metric}'] = mean
+                diagnostics[f'ci_half_width_{metric}'] = half_width
+            history.append(diagnostics)
+            
+            if self.verbose:
+                widths = ", ".join(f"{m}={diagnostics[f'ci_half_width_{m}']:.4f}" for m in targets)
+                print(f"  {len(results_list)} iterations: {widths}")
+            
+            if len(successful) >= min_iterations and all(
+                diagnostics[f'ci_half_width_{metric}'] <= target
+                for metric, target in targets.items()
+            ):
+                reached = True
+                break
+        
+        results = self._process_results(
+            scenario_name=scenario_name,
+            results_list=results_list,
+            execution_time=time.time() - start_time
+        )
+        results.convergence_history = history
+        results.precision_reached = reached
+        return results
+    
+    @staticmethod
+    def _mean_confidence_half_width(
+        values: List[float],
+        confidence: float = 0.95
+    ) -> Tuple[float, float]:
+        """Running mean and Student-t confidence half-width of the mean"""
+        n = len(values)
+        mean = float(np.mean(values))
+        sem = float(np.std(values, ddof=1)) / np.sqrt(n)
+        return mean, float(stats.t.ppf(0.5 + confidence / 2, n - 1) * sem)
+    
+    def _execute(
+        self,
+        scenario: ScenarioConfig,
+        seeds: List[Optional[int]],
+        first_iteration: int = 0,
+        show_progress: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one simulation per seed with the configured dispatch mode
+        
+        Args:
+            scenario: Scenario configuration
+            seeds: Random seed per run
+            first_iteration: Iteration number of the first run
+            show_progress: Show a progress bar
+        
+        Returns:
+            Result dictionaries in iteration order
+        """
+        if self.dispatch == 'chunked':
+            return self._execute_chunked(scenario, seeds, first_iteration, show_progress)
+        
+        n_runs = len(seeds)
+        args_list = [(scenario, first_iteration + i, seeds[i]) for i in range(n_runs)]
         
         # Run simulations in parallel
         if self.n_jobs > 1:
             with Pool(self.n_jobs) as pool:
-                if self.verbose:
+                if show_progress:
                     # With progress bar
-                    results_list = list(tqdm(
+                    return list(tqdm(
                         pool.imap(_run_single_simulation, args_list),
-                        total=n_iter,
+                        total=n_runs,
                         desc="Simulations"
                     ))
-                else:
-                    results_list = pool.map(_run_single_simulation, args_list)
-        else:
-            # Sequential execution
-            if self.verbose:
-                results_list = [
-                    _run_single_simulation(args)
-                    for args in tqdm(args_list, desc="Simulations")
-                ]
-            else:
-                results_list = [_run_single_simulation(args) for args in args_list]
+                return pool.map(_run_single_simulation, args_list)
         
-        execution_time = time.time() - start_time
+        # Sequential execution
+        return [
+            _run_single_simulation(args)
+            for args in tqdm(args_list, desc="Simulations", disable=not show_progress)
+        ]
+    
+    def _execute_chunked(
+        self,
+        scenario: ScenarioConfig,
+        seeds: List[Optional[int]],
+        first_iteration: int = 0,
+        show_progress: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Chunked dispatch: workers receive the scenario once through the pool
+        initializer, run batches of seeds, and write CLI/MFD trajectories into
+        a shared-memory matrix. Only scalar summaries cross the process
+        boundary; trajectories are attached here as rows of one array.
+        """
+        n_runs = len(seeds)
+        shape = (2, n_runs, max(1, scenario.n_timesteps))
+        n_jobs = max(1, self.n_jobs)
+        chunk_size = self.chunk_size or max(1, -(-n_runs // (4 * n_jobs)))
         
-        # Process results
-        return self._process_results(
-            scenario_name=scenario_name,
-            results_list=results_list,
-            execution_time=execution_time
-        )
+        jobs = [(row, first_iteration + row, seeds[row]) for row in range(n_runs)]
+        chunks = [jobs[i:i + chunk_size] for i in range(0, n_runs, chunk_size)]
+        
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            progress = tqdm(total=n_runs, desc="Simulations", disable=not show_progress)
+            scalar_results = []
+            if n_jobs > 1:
+                with Pool(n_jobs, initializer=_init_chunk_worker, initargs=(scenario, shm.name, shape)) as pool:
+                    for chunk_results in pool.imap_unordered(_run_simulation_chunk, chunks):
+                        scalar_results.extend(chunk_results)
+                        progress.update(len(chunk_results))
+            else:
+                _init_chunk_worker(scenario, shm.name, shape)
+                try:
+                    for chunk in chunks:
+                        chunk_results = _run_simulation_chunk(chunk)
+                        scalar_results.extend(chunk_results)
+                        progress.update(len(chunk_results))
+                finally:
+                    _release_chunk_worker()
+            progress.close()
+            
+            trajectories = np.array(np.ndarray(shape, dtype=np.float64, buffer=shm.buf))
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        scalar_results.sort(key=lambda r: r['row'])
+        for r in scalar_results:
+            row = r.pop('row')
+            if r['success']:
+                length = r.pop('trajectory_length')
+                r['cli_trajectory'] = trajectories[0, row, :length]
+                r['mfd_trajectory'] = trajectories[1, row, :length]
+        return scalar_results
     
     def _process_results(
         self,
@@ -475,6 +802,232 @@ class MonteCarloRunner:
             'results': results
         }
     
+    def sensitivity_grid(
+        self,
+        scenario_name: str,
+        parameters: Dict[str, Sequence[float]],
+        design: str = 'factorial',
+        n_points: Optional[int] = None,
+        n_iterations_per_point: int = 100,
+        checkpoint_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Multi-parameter sensitivity analysis
+        
+        All (parameter point x seed) runs are flattened into one job pool.
+        Each point is summarised as soon as its last run finishes and, if
+        checkpoint_path is given, appended to a JSON-lines checkpoint. A
+        rerun with the same arguments resumes from the checkpoint and only
+        runs the missing points.
+        
+        Every point uses the same seeds (common random numbers), as in
+        sensitivity_analysis.
+        
+        Args:
+            scenario_name: Base scenario name
+            parameters: For 'factorial', {parameter: values}; for 'lhs' and
+                'sobol', {parameter: (low, high)} bounds
+            design: 'factorial', 'lhs' (Latin hypercube) or 'sobol'
+            n_points: Number of sampled points (required for 'lhs' and 'sobol')
+            n_iterations_per_point: Monte Carlo iterations per point
+            checkpoint_path: JSON-lines file for checkpoint/resume
+        
+        Returns:
+            Dictionary with the design and per-point summary statistics
+        """
+        scenario = self.scenario_library.get_scenario(scenario_name)
+        points = self._sensitivity_design(parameters, design, n_points)
+        
+        # Plain floats/ints so the header is JSON-serializable (e.g. NumPy values)
+        header = {
+            'scenario': scenario_name,
+            'design': design,
+            'parameters': {name: [float(v) for v in values] for name, values in parameters.items()},
+            'n_points': len(points),
+            'n_iterations_per_point': n_iterations_per_point,
+            'random_seed': None if self.random_seed is None else int(self.random_seed)
+        }
+        header_line = json.dumps({'header': header})
+        completed = self._load_sensitivity_checkpoint(checkpoint_path, header)
+        resume = completed is not None
+        completed = completed or {}
+        pending = [i for i in range(len(points)) if i not in completed]
+        
+        if self.verbose:
+            print(f"Sensitivity grid ({design}): {list(parameters)}")
+            print(f"Base scenario: {scenario_name}")
+            print(f"{len(points)} points x {n_iterations_per_point} iterations "
+                  f"({len(completed)} points restored from checkpoint)")
+            print()
+        
+        if self.random_seed is not None:
+            seeds = [self.random_seed + i + 100000 for i in range(n_iterations_per_point)]
+        else:
+            seeds = [None] * n_iterations_per_point
+        
+        args_list = []
+        for point_index in pending:
+            modified = copy.deepcopy(scenario)
+            for parameter, value in points[point_index].items():
+                self._apply_scenario_parameter(modified, parameter, value)
+            args_list.extend(
+                (point_index, modified, i, seeds[i]) for i in range(n_iterations_per_point)
+            )
+        
+        point_results: Dict[int, List[Dict[str, Any]]] = {i: [] for i in pending}
+        checkpoint = None
+        if checkpoint_path is not None:
+            checkpoint = open(checkpoint_path, 'a' if resume else 'w', encoding='utf-8')
+        try:
+            if checkpoint is not None:
+                if resume:
+                    # Terminate a line truncated by an interruption
+                    with open(checkpoint_path, 'rb') as f:
+                        f.seek(-1, 2)
+                        if f.read(1) != b"\n":
+                            checkpoint.write("\n")
+                else:
+                    checkpoint.write(header_line + "\n")
+                checkpoint.flush()
+            
+            if self.n_jobs > 1 and args_list:
+                chunk_size = max(1, len(args_list) // (4 * self.n_jobs))
+                pool = Pool(self.n_jobs)
+                job_results = pool.imap_unordered(_run_scalar_simulation, args_list, chunksize=chunk_size)
+            else:
+                pool = None
+                job_results = map(_run_scalar_simulation, args_list)
+            
+            try:
+                for point_index, result in tqdm(job_results, total=len(args_list),
+                                                desc="Sensitivity runs", disable=not self.verbose):
+                    point_results[point_index].append(result)
+                    if len(point_results[point_index]) < n_iterations_per_point:
+                        continue
+                    
+                    summary = self._summarise_sensitivity_point(
+                        point_index, points[point_index], point_results.pop(point_index)
+                    )
+                    completed[point_index] = summary
+                    if checkpoint is not None:
+                        checkpoint.write(json.dumps(summary) + "\n")
+                        checkpoint.flush()
+            finally:
+                if pool is not None:
+                    pool.terminate()
+                    pool.join()
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        
+        return {
+            'base_scenario': scenario_name,
+            'design': design,
+            'parameters': list(parameters),
+            'n_points': len(points),
+            'n_iterations_per_point': n_iterations_per_point,
+            'n_restored': len(points) - len(pending),
+            'results': [completed[i] for i in range(len(points))]
+        }
+    
+    def _sensitivity_design(
+        self,
+        parameters: Dict[str, Sequence[float]],
+        design: str,
+        n_points: Optional[int]
+    ) -> List[Dict[str, float]]:
+        """Parameter points for a sensitivity design"""
+        if design not in SENSITIVITY_DESIGNS:
+            raise ValueError(f"Unknown design '{design}'. Choose from {SENSITIVITY_DESIGNS}")
+        names = list(parameters)
+        
+        if design == 'factorial':
+            grid = itertools.product(*(parameters[name] for name in names))
+            return [dict(zip(names, (float(v) for v in values))) for values in grid]
+        
+        if not n_points:
+            raise ValueError(f"n_points is required for the '{design}' design")
+        bounds = np.array([parameters[name] for name in names], dtype=float)
+        if bounds.shape != (len(names), 2):
+            raise ValueError(f"'{design}' design needs (low, high) bounds for every parameter")
+        
+        if design == 'lhs':
+            sampler = qmc.LatinHypercube(d=len(names), seed=self.random_seed)
+        else:
+            sampler = qmc.Sobol(d=len(names), scramble=True, seed=self.random_seed)
+        samples = qmc.scale(sampler.random(n_points), bounds[:, 0], bounds[:, 1])
+        
+        # Sampled independently, a (min, max) pair can cross: order each sample
+        for low, high in _RANGE_PARAMETERS:
+            if low in names and high in names:
+                pair = [names.index(low), names.index(high)]
+                samples[:, pair] = np.sort(samples[:, pair], axis=1)
+        
+        return [
+            {
+                name: float(round(value)) if name in _INTEGER_PARAMETERS else float(value)
+                for name, value in zip(names, row)
+            }
+            for row in samples
+        ]
+    
+    def _load_sensitivity_checkpoint(
+        self,
+        checkpoint_path: Optional[str],
+        header: Dict[str, Any]
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Completed point summaries from a checkpoint written for the same design
+        
+        Returns None if there is no checkpoint to resume from (missing file or
+        no complete header line).
+        """
+        if checkpoint_path is None or not Path(checkpoint_path).exists():
+            return None
+        
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            lines = f.read().split("\n")
+        
+        try:
+            stored_header = json.loads(lines[0])['header']
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+        if stored_header != json.loads(json.dumps(header)):
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was written for a different sensitivity design"
+            )
+        
+        completed = {}
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Empty or truncated by an interruption
+                continue
+            completed[record['point_index']] = record
+        return completed
+    
+    def _summarise_sensitivity_point(
+        self,
+        point_index: int,
+        point: Dict[str, float],
+        results_list: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Summary statistics for one sensitivity point"""
+        # Pool results arrive unordered; sort for reproducible sums
+        results_list = sorted(results_list, key=lambda r: r['iteration'])
+        successful = [r for r in results_list if r.get('success', False)]
+        summary = {
+            'point_index': point_index,
+            'parameter_values': point,
+            'n_converged': len(successful)
+        }
+        for metric in CONVERGENCE_METRICS:
+            values = [r[metric] for r in successful]
+            summary[f'mean_{metric}'] = float(np.mean(values)) if values else None
+            summary[f'std_{metric}'] = float(np.std(values)) if values else None
+        return summary
+    
     def _modify_scenario_parameter(
         self,
         scenario: ScenarioConfig,
@@ -482,28 +1035,43 @@ class MonteCarloRunner:
         value: float
     ) -> ScenarioConfig:
         """Create modified copy of scenario with parameter changed"""
-        import copy
         modified = copy.deepcopy(scenario)
+        self._apply_scenario_parameter(modified, parameter, value)
+        return modified
+    
+    def _apply_scenario_parameter(
+        self,
+        modified: ScenarioConfig,
+        parameter: str,
+        value: float
+    ):
+        """
+        Set parameter on scenario in place
         
+        Setting one end of a (min, max) range past the other end moves the
+        other end along, so the range never inverts.
+        """
         # Handle different parameter types
         if parameter == 'initial_cli':
             modified.initial_cli = value
         elif parameter == 'initial_mfd':
             modified.initial_mfd = value
         elif parameter == 'union_militancy_min':
-            modified.union_militancy_range = (int(value), modified.union_militancy_range[1])
+            low = int(value)
+            modified.union_militancy_range = (low, max(low, modified.union_militancy_range[1]))
         elif parameter == 'union_militancy_max':
-            modified.union_militancy_range = (modified.union_militancy_range[0], int(value))
+            high = int(value)
+            modified.union_militancy_range = (min(modified.union_militancy_range[0], high), high)
         elif parameter == 'employer_coordination_min':
-            modified.employer_coordination_range = (int(value), modified.employer_coordination_range[1])
+            low = int(value)
+            modified.employer_coordination_range = (low, max(low, modified.employer_coordination_range[1]))
         elif parameter == 'employer_coordination_max':
-            modified.employer_coordination_range = (modified.employer_coordination_range[0], int(value))
+            high = int(value)
+            modified.employer_coordination_range = (min(modified.employer_coordination_range[0], high), high)
         elif parameter == 'crisis_probability':
             modified.crisis_probability = value
         else:
             raise ValueError(f"Unknown parameter: {parameter}")
-        
-        return modified
     
     def _run_monte_carlo_direct(
         self,
@@ -518,20 +1086,7 @@ class MonteCarloRunner:
         else:
             seeds = [None] * n_iterations
         
-        args_list = [(scenario, i, seeds[i]) for i in range(n_iterations)]
-        
-        # Run simulations
-        if self.n_jobs > 1:
-            with Pool(self.n_jobs) as pool:
-                if show_progress:
-                    results_list = list(tqdm(
-                        pool.imap(_run_single_simulation, args_list),
-                        total=n_iterations
-                    ))
-                else:
-                    results_list = pool.map(_run_single_simulation, args_list)
-        else:
-            results_list = [_run_single_simulation(args) for args in args_list]
+        results_list = self._execute(scenario, seeds, show_progress=show_progress)
         
         return self._process_results(
             scenario_name=scenario.name,
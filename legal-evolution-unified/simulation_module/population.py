@@ -0,0 +1,503 @@
+"""
+ArrayPopulation - Struct-of-Arrays Agent Engine
+===============================================
+
+Array-backed alternative to the per-object agent model in agents/.
+
+Each agent type keeps its state in NumPy columns (one array per attribute,
+one row per agent) instead of one Python object with a beliefs dict per
+agent. Decisions, belief updates, interactions and votes are computed as
+vectorized batches over whole populations, which makes 100k-1M worker
+scenarios tractable.
+
+Behavioral rules mirror Worker/Union/Employer/Legislator/Judge and the
+voting logic in SimulationEnvironment. Differences from the object model:
+- All randomness, including the environment's crisis and reform draws,
+  comes from one np.random.Generator (ArrayPopulation.rng), so runs are
+  bit-for-bit reproducible under a seed (but do not reproduce the
+  object model's random stream).
+- Worker-worker peer learning is applied synchronously per timestep:
+  every sampled pair reads its partner's beliefs from the start of the
+  batch.
+- Interactions with no state effect in the object model (union/employer
+  lobbying of legislators) are not materialized.
+
+Usage:
+    env = SimulationEnvironment(n_workers=500_000, engine='array', random_seed=42)
+    env.run(200)
+"""
+
+from typing import Dict, Any, Tuple, Optional
+from dataclasses import dataclass
+import numpy as np
+
+
+# Action vocabularies (column values are indices into these tuples)
+WORKER_ACTIONS = ("comply_formal", "use_informal")
+UNION_ACTIONS = ("strike", "mobilize", "negotiate", "lobby", "organize")
+EMPLOYER_ACTIONS = ("lobby_reform", "coordinate", "negotiate", "litigate", "comply")
+LEGISLATOR_ACTIONS = ("support_reform", "oppose_reform", "abstain")
+JUDGE_ACTIONS = ("uphold_reform", "strike_down_reform", "narrow_interpretation", "no_case")
+
+# Categorical attribute vocabularies
+PARTIES = ('left', 'center', 'right')
+JUDGE_DOCTRINES = ('progressive', 'conservative', 'moderate')
+JUDGE_LEANINGS = ('progressive', 'centrist', 'conservative')
+FIRM_SIZES = ('small', 'medium', 'large')
+SECTORS = ('manufacturing', 'services', 'agriculture')
+
+# Lookup tables matching SimulationEnvironment vote probabilities
+_PARTY_BASE_VOTE = np.array([0.2, 0.5, 0.7])            # left, center, right
+_DOCTRINE_BASE_UPHOLD = np.array([0.3, 0.7, 0.5])       # progressive, conservative, moderate
+_PARTY_IDEOLOGY_SHIFT = np.array([-0.2, 0.0, 0.2])      # Legislator.decide_action party term
+_LEANING_RULING_SHIFT = np.array([-0.2, 0.0, 0.2])      # Judge.decide_action leaning term
+
+
+@dataclass
+class WorkerArrays:
+    """Worker state columns (see agents.worker.WorkerState)"""
+    income_level: np.ndarray
+    risk_aversion: np.ndarray
+    compliance_cost: np.ndarray
+    memetic_alignment: np.ndarray
+    belief_formal_benefit: np.ndarray
+    belief_informal_benefit: np.ndarray
+    belief_enforcement: np.ndarray
+    union_membership: np.ndarray  # (n_workers, n_unions) bool, replaces network_connections
+    action: np.ndarray            # int8 index into WORKER_ACTIONS
+
+    def __len__(self) -> int:
+        return len(self.income_level)
+
+
+@dataclass
+class UnionArrays:
+    """Union state columns (see agents.union.UnionState)"""
+    militancy: np.ndarray
+    member_count: np.ndarray
+    strike_capacity: np.ndarray
+    political_connections: np.ndarray
+    memetic_alignment: np.ndarray
+    belief_ultraactivity_value: np.ndarray
+    belief_reform_threat: np.ndarray
+    belief_mobilization_success: np.ndarray
+    action: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.militancy)
+
+
+@dataclass
+class EmployerArrays:
+    """Employer state columns (see agents.employer.EmployerState)"""
+    coordination_capacity: np.ndarray
+    firm_size: np.ndarray  # index into FIRM_SIZES
+    sector: np.ndarray     # index into SECTORS
+    lobbying_budget: np.ndarray
+    memetic_alignment: np.ndarray
+    belief_reform_benefit: np.ndarray
+    belief_union_strength: np.ndarray
+    action: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.coordination_capacity)
+
+
+@dataclass
+class LegislatorArrays:
+    """Legislator state columns (see agents.legislator.LegislatorState)"""
+    party: np.ndarray  # index into PARTIES
+    electoral_security: np.ndarray
+    ideology_flexibility: np.ndarray
+    union_ties: np.ndarray
+    business_ties: np.ndarray
+    memetic_alignment: np.ndarray
+    action: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.party)
+
+
+@dataclass
+class JudgeArrays:
+    """Judge state columns (see agents.judge.JudgeState)"""
+    doctrine: np.ndarray  # index into JUDGE_DOCTRINES
+    ideological_leaning: np.ndarray  # index into JUDGE_LEANINGS
+    precedent_weight: np.ndarray
+    strict_interpretation: np.ndarray  # bool
+    labor_rights_priority: np.ndarray
+    doctrine_adherence: np.ndarray
+    action: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.doctrine)
+
+
+class ArrayPopulation:
+    """
+    Struct-of-arrays agent population for SimulationEnvironment(engine='array')
+
+    Holds one *Arrays dataclass per agent type and a private Generator.
+    All per-agent loops of the object engine are replaced by batched
+    NumPy operations over those columns.
+    """
+
+    def __init__(
+        self,
+        workers: WorkerArrays,
+        unions: UnionArrays,
+        employers: EmployerArrays,
+        legislators: LegislatorArrays,
+        judges: JudgeArrays,
+        rng: np.random.Generator
+    ):
+        self.workers = workers
+        self.unions = unions
+        self.employers = employers
+        self.legislators = legislators
+        self.judges = judges
+        self.rng = rng
+
+    @classmethod
+    def create(
+        cls,
+        n_workers: int,
+        n_unions: int,
+        n_employers: int,
+        n_legislators: int,
+        n_judges: int,
+        union_militancy_range: Tuple[int, int] = (4, 7),
+        employer_coordination_range: Tuple[int, int] = (4, 7),
+        random_seed: Optional[int] = None
+    ) -> 'ArrayPopulation':
+        """
+        Sample heterogeneous populations with the same distributions as
+        SimulationEnvironment._create_*_population
+
+        Args:
+            n_workers, n_unions, n_employers, n_legislators, n_judges: Population sizes
+            union_militancy_range: (min, max) militancy for unions (inclusive)
+            employer_coordination_range: (min, max) coordination for employers (inclusive)
+            random_seed: Seed for the population's Generator
+
+        Returns:
+            ArrayPopulation
+        """
+        rng = np.random.default_rng(random_seed)
+
+        workers = WorkerArrays(
+            income_level=rng.lognormal(0, 0.5, n_workers),
+            risk_aversion=rng.beta(2, 2, n_workers),
+            compliance_cost=rng.uniform(0.1, 0.5, n_workers),
+            memetic_alignment=rng.beta(2, 2, n_workers),
+            belief_formal_benefit=np.full(n_workers, 0.5),
+            belief_informal_benefit=np.full(n_workers, 0.5),
+            belief_enforcement=np.full(n_workers, 0.3),
+            union_membership=np.zeros((n_workers, n_unions), dtype=bool),
+            action=np.zeros(n_workers, dtype=np.int8)
+        )
+
+        militancy = rng.integers(union_militancy_range[0], union_militancy_range[1] + 1, n_unions)
+        unions = UnionArrays(
+            militancy=militancy,
+            member_count=rng.integers(50, 501, n_unions),
+            strike_capacity=rng.beta(2, 2, n_unions),
+            political_connections=rng.beta(2, 2, n_unions),
+            memetic_alignment=np.maximum(0.1, 1.0 - militancy / 12.0),
+            belief_ultraactivity_value=np.full(n_unions, 0.8),
+            belief_reform_threat=np.full(n_unions, 0.5),
+            belief_mobilization_success=np.full(n_unions, 0.6),
+            action=np.zeros(n_unions, dtype=np.int8)
+        )
+
+        coordination = rng.integers(employer_coordination_range[0], employer_coordination_range[1] + 1, n_employers)
+        employers = EmployerArrays(
+            coordination_capacity=coordination,
+            firm_size=rng.integers(0, len(FIRM_SIZES), n_employers),
+            sector=rng.integers(0, len(SECTORS), n_employers),
+            lobbying_budget=rng.beta(2, 2, n_employers),
+            memetic_alignment=0.5 + coordination / 20.0,
+            belief_reform_benefit=np.full(n_employers, 0.7),
+            belief_union_strength=np.full(n_employers, 0.5),
+            action=np.zeros(n_employers, dtype=np.int8)
+        )
+
+        party = rng.integers(0, len(PARTIES), n_legislators)
+        legislators = LegislatorArrays(
+            party=party,
+            electoral_security=rng.beta(3, 3, n_legislators),
+            ideology_flexibility=rng.beta(2, 2, n_legislators),
+            union_ties=rng.beta(2, 2, n_legislators),
+            business_ties=rng.beta(2, 2, n_legislators),
+            memetic_alignment=np.array([0.2, 0.5, 0.8])[party],
+            action=np.zeros(n_legislators, dtype=np.int8)
+        )
+
+        judges = JudgeArrays(
+            doctrine=rng.integers(0, len(JUDGE_DOCTRINES), n_judges),
+            ideological_leaning=np.full(n_judges, JUDGE_LEANINGS.index('centrist')),
+            precedent_weight=rng.beta(3, 2, n_judges),
+            strict_interpretation=rng.random(n_judges) < 0.5,
+            labor_rights_priority=rng.beta(2, 2, n_judges),
+            doctrine_adherence=np.full(n_judges, 0.7),
+            action=np.zeros(n_judges, dtype=np.int8)
+        )
+
+        return cls(workers, unions, employers, legislators, judges, rng)
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def decide_actions(self, environment: Dict[str, Any]):
+        """
+        Batched decide_action for every agent; results go to the action columns
+
+        Args:
+            environment: Dict from SimulationEnvironment._get_environment_dict()
+        """
+        self._decide_workers(environment)
+        self._decide_unions(environment)
+        self._decide_employers(environment)
+        self._decide_legislators(environment)
+        self._decide_judges(environment)
+
+    def _decide_workers(self, environment: Dict[str, Any]):
+        """Vectorized Worker.decide_action"""
+        w = self.workers
+        enforcement_level = environment.get('enforcement_level', 0.3)
+        formal_benefits = environment.get('formal_benefits', 0.5)
+        informal_benefits = environment.get('informal_benefits', 0.5)
+
+        formal_utility = (
+            formal_benefits * w.belief_formal_benefit -
+            w.compliance_cost +
+            enforcement_level * 0.5
+        )
+        informal_utility = (
+            informal_benefits * w.belief_informal_benefit -
+            enforcement_level * w.risk_aversion * 0.5
+        )
+        if environment.get('crisis_active', False):
+            informal_utility = informal_utility - w.risk_aversion * 0.3
+
+        noise = self.rng.normal(0, 0.1, len(w))
+        w.action = np.where(formal_utility > informal_utility + noise, 0, 1).astype(np.int8)
+
+    def _decide_unions(self, environment: Dict[str, Any]):
+        """Vectorized Union.decide_action (also sets the reform_threat belief)"""
+        u = self.unions
+        sensitivity = (
+            0.20 * environment.get('cli_memetic', 0.5) +
+            0.60 * environment.get('cli_corporate', 0.5) +
+            0.20 * environment.get('cli_oligarchic', 0.5)
+        )
+
+        threat = np.zeros(len(u))
+        if environment.get('reform_proposed', False):
+            threat += 0.5
+        if environment.get('reform_targets_ultraactivity', False):
+            threat += 0.5 * u.belief_ultraactivity_value
+        threat = threat * (1.0 - sensitivity)
+        u.belief_reform_threat = threat
+
+        m = u.militancy
+        u.action = np.select(
+            [
+                (threat > 0.7) & (m >= 7),
+                (threat > 0.7) & (m >= 4),
+                threat > 0.7,
+                (threat > 0.3) & (m >= 6),
+                threat > 0.3,
+            ],
+            [0, 1, 2, 3, 2],
+            default=4
+        ).astype(np.int8)
+
+    def _decide_employers(self, environment: Dict[str, Any]):
+        """Vectorized Employer.decide_action (also sets the union_strength belief)"""
+        e = self.employers
+        reform_opportunity = environment.get('reform_opportunity', False)
+        union_strength = environment.get('union_strength', 0.5)
+        government_pro_business = environment.get('government_pro_business', 0.5)
+
+        e.belief_union_strength = np.full(len(e), union_strength)
+
+        c = e.coordination_capacity
+        if reform_opportunity:
+            high = 0
+        elif union_strength < 0.4:
+            high = 3
+        else:
+            high = 1
+        medium = 0 if (reform_opportunity and government_pro_business > 0.6) else 2
+        low = 4 if union_strength > 0.7 else 2
+        e.action = np.select([c >= 7, c >= 4], [high, medium], default=low).astype(np.int8)
+
+    def _decide_legislators(self, environment: Dict[str, Any]):
+        """Vectorized Legislator.decide_action"""
+        l = self.legislators
+        score = np.full(len(l), 0.3 if environment.get('crisis_active', False) else 0.0)
+        score += environment.get('business_pressure', 0.5) * l.business_ties * 0.4
+        score -= environment.get('union_mobilization', 0.5) * l.union_ties * 0.5
+        score += (environment.get('public_support_reform', 0.5) - 0.5) * 0.3
+        score = np.where(l.electoral_security < 0.4, score * 0.5, score)
+        score += _PARTY_IDEOLOGY_SHIFT[l.party]
+
+        l.action = np.select([score > 0.2, score < -0.2], [0, 1], default=2).astype(np.int8)
+
+    def _decide_judges(self, environment: Dict[str, Any]):
+        """Vectorized Judge.decide_action"""
+        j = self.judges
+        if not environment.get('reform_before_court', False):
+            j.action = np.full(len(j), 3, dtype=np.int8)
+            return
+
+        sensitivity = (
+            0.40 * environment.get('cli_memetic', 0.5) +
+            0.10 * environment.get('cli_corporate', 0.5) +
+            0.50 * environment.get('cli_oligarchic', 0.5)
+        )
+        score = (
+            environment.get('precedent_support_reform', 0.3) * j.doctrine_adherence * 0.6 +
+            environment.get('constitutional_text_clear', 0.5) * 0.3 +
+            _LEANING_RULING_SHIFT[j.ideological_leaning] +
+            (environment.get('public_pressure', 0.5) - 0.5) * 0.1 -
+            sensitivity * 0.3
+        )
+        j.action = np.select([score > 0.3, score < -0.1], [0, 1], default=2).astype(np.int8)
+
+    # ------------------------------------------------------------------
+    # Belief updates
+    # ------------------------------------------------------------------
+
+    def update_worker_beliefs(self, observations: Dict[str, Any], mask: Optional[np.ndarray] = None):
+        """
+        Vectorized Worker.update_beliefs
+
+        Args:
+            observations: Same keys as Worker.update_beliefs; values may be
+                scalars or arrays aligned with the (masked) workers
+            mask: Optional boolean selector of workers to update (default: all)
+        """
+        w = self.workers
+        sel = slice(None) if mask is None else mask
+
+        if 'enforcement_observed' in observations:
+            w.belief_enforcement[sel] = 0.7 * w.belief_enforcement[sel] + 0.3 * observations['enforcement_observed']
+        if 'formal_outcome' in observations:
+            w.belief_formal_benefit[sel] = 0.8 * w.belief_formal_benefit[sel] + 0.2 * observations['formal_outcome']
+        if 'informal_outcome' in observations:
+            w.belief_informal_benefit[sel] = 0.8 * w.belief_informal_benefit[sel] + 0.2 * observations['informal_outcome']
+
+        belief_diff = w.belief_formal_benefit[sel] - w.belief_informal_benefit[sel]
+        w.memetic_alignment[sel] = np.clip(0.5 + 0.5 * belief_diff, 0.0, 1.0)
+
+    # ------------------------------------------------------------------
+    # Interactions
+    # ------------------------------------------------------------------
+
+    def execute_interactions(self):
+        """
+        Batched equivalent of SimulationEnvironment._execute_agent_interactions
+
+        - Union-Worker mobilization: each union samples up to 20 workers,
+          raising their informal benefit belief by militancy/100 and
+          recording membership.
+        - Worker-Worker peer learning: n_workers // 4 random pairs, w1
+          moves 20% toward w2 on both benefit beliefs.
+        """
+        w = self.workers
+        n_workers = len(w)
+        if n_workers == 0:
+            return
+
+        # Union-Worker mobilization
+        k = min(20, n_workers)
+        for union_idx, militancy in enumerate(self.unions.militancy):
+            sample = self.rng.choice(n_workers, size=k, replace=False)
+            w.belief_informal_benefit[sample] = np.minimum(
+                1.0, w.belief_informal_benefit[sample] + militancy / 10.0 * 0.1
+            )
+            w.union_membership[sample, union_idx] = True
+
+        # Worker-Worker peer effects (synchronous update)
+        n_pairs = n_workers // 4
+        if n_pairs == 0 or n_workers < 2:
+            return
+        w1 = self.rng.integers(0, n_workers, n_pairs)
+        w2 = (w1 + self.rng.integers(1, n_workers, n_pairs)) % n_workers  # w2 != w1
+
+        for belief in (w.belief_formal_benefit, w.belief_informal_benefit):
+            delta = 0.2 * (belief[w2] - belief[w1])
+            np.add.at(belief, w1, delta)
+
+    # ------------------------------------------------------------------
+    # Reform processing
+    # ------------------------------------------------------------------
+
+    def legislative_vote(self, crisis_active: bool, avg_union_militancy: float) -> Tuple[int, int]:
+        """
+        Vectorized legislative vote (SimulationEnvironment._calculate_legislator_vote_probability)
+
+        Returns:
+            (votes_for, votes_against)
+        """
+        l = self.legislators
+        vote_prob = (
+            _PARTY_BASE_VOTE[l.party] +
+            (0.3 if crisis_active else 0.0) -
+            0.2 * l.union_ties * (avg_union_militancy / 10.0) +
+            0.2 * l.business_ties +
+            l.electoral_security * 0.2
+        )
+        vote_prob = np.clip(vote_prob, 0.0, 1.0)
+        votes_for = int(np.count_nonzero(self.rng.random(len(l)) < vote_prob))
+        return votes_for, len(l) - votes_for
+
+    def judicial_review(self, targets_ultraactivity: bool) -> Tuple[int, int]:
+        """
+        Vectorized judicial vote (SimulationEnvironment._calculate_judge_uphold_probability)
+
+        Returns:
+            (judges_uphold, judges_strike), counted exactly as in the object engine
+        """
+        j = self.judges
+        uphold_prob = _DOCTRINE_BASE_UPHOLD[j.doctrine].copy()
+        if targets_ultraactivity:
+            uphold_prob -= j.labor_rights_priority * 0.3
+        uphold_prob = np.clip(uphold_prob - j.precedent_weight * 0.2, 0.0, 1.0)
+        judges_strike = int(np.count_nonzero(self.rng.random(len(j)) < uphold_prob))
+        return len(j) - judges_strike, judges_strike
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def worker_compliance(self) -> float:
+        """Share of workers whose last decision was comply_formal"""
+        if len(self.workers) == 0:
+            return 0.5
+        return float(np.mean(self.workers.action == 0))
+
+    def avg_union_militancy(self) -> Optional[float]:
+        """Mean union militancy (None if there are no unions)"""
+        return float(np.mean(self.unions.militancy)) if len(self.unions) else None
+
+    def avg_employer_coordination(self) -> Optional[float]:
+        """Mean employer coordination capacity (None if there are no employers)"""
+        return float(np.mean(self.employers.coordination_capacity)) if len(self.employers) else None
+
+    def action_counts(self) -> Dict[str, Dict[str, int]]:
+        """Histogram of current actions per agent type"""
+        result = {}
+        for name, arrays, vocabulary in [
+            ('workers', self.workers, WORKER_ACTIONS),
+            ('unions', self.unions, UNION_ACTIONS),
+            ('employers', self.employers, EMPLOYER_ACTIONS),
+            ('legislators', self.legislators, LEGISLATOR_ACTIONS),
+            ('judges', self.judges, JUDGE_ACTIONS),
+        ]:
+            counts = np.bincount(arrays.action, minlength=len(vocabulary))
+            result[name] = {action: int(c) for action, c in zip(vocabulary, counts)}
+        return result
@@ -50,7 +50,6 @@ __author__ = "Ignacio A. Lerer"
 from .g_function import (
     GFunction,
     ScalarGFunction,
-    VectorGFunction,
     FrequencyGFunction,
     LotkaVolterraGFunction,
 )
@@ -102,7 +101,6 @@ __all__ = [
     # G-function classes
     "GFunction",
     "ScalarGFunction",
-    "VectorGFunction",
     "FrequencyGFunction",
     "LotkaVolterraGFunction",
     
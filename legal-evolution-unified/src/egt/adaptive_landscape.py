@@ -28,11 +28,15 @@ Vince (2005), Chapter 8: "Evolutionary Branching and Speciation"
 
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Callable, Sequence, Any
 from dataclasses import dataclass
+from multiprocessing import Pool, cpu_count
+import pickle
+import warnings
 
 from .g_function import GFunction, LotkaVolterraGFunction
-from .ess_solver import ESSResult
+from .ess_solver import ESSResult, ESSSolver
+from .darwinian_dynamics import TimescaleParams
 
 
 @dataclass
@@ -89,7 +93,7 @@ class AdaptiveLandscape:
             v_range = (u_flat.min() - margin, u_flat.max() + margin)
         
         v_grid = np.linspace(v_range[0], v_range[1], n_points)
-        G_star = np.array([self.g_function.evaluate(v, u, x) for v in v_grid])
+        G_star = self.g_function.evaluate_many(v_grid, u, x)
         
         # Extract CLI if available
         cli_score = None
@@ -224,6 +228,80 @@ class LandscapeVisualizer:
         return fig
 
 
+class LazyLandscapes(Sequence):
+    """
+    Sequence of LandscapeData computed on first access.
+    
+    A sweep only stores (cli, u_ess, x_ess) per point; the 500-point
+    landscape G*(v) is built from them when an element is requested and
+    then cached. Works anywhere a List[LandscapeData] is expected
+    (e.g. LandscapeVisualizer.plot_bifurcation).
+    """
+    
+    def __init__(self, g_function_constructor: Callable[[float], GFunction],
+                 cli_values: np.ndarray, ess_values: List[np.ndarray],
+                 x_values: List[np.ndarray], **compute_kwargs):
+        self.g_function_constructor = g_function_constructor
+        self.cli_values = cli_values
+        self.ess_values = ess_values
+        self.x_values = x_values
+        self.compute_kwargs = compute_kwargs
+        self._cache: Dict[int, LandscapeData] = {}
+    
+    def __len__(self) -> int:
+        return len(self.cli_values)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("landscape index out of range")
+        if index not in self._cache:
+            g_func = self.g_function_constructor(self.cli_values[index])
+            self._cache[index] = AdaptiveLandscape(g_func).compute(
+                self.ess_values[index], self.x_values[index], **self.compute_kwargs
+            )
+        return self._cache[index]
+
+
+def _solve_cli_chain(args: Tuple[Callable, np.ndarray, np.ndarray, Optional[np.ndarray],
+                                 Dict[str, Any], str, bool]) -> List[Dict[str, Any]]:
+    """
+    Solve the ESS along a contiguous run of CLI values (pool worker).
+    
+    With continuation, each point is warm-started from the previous
+    point's ESS; the first point starts from (u0, x0).
+    """
+    constructor, cli_values, u0, x0, solver_kwargs, integrator, continuation = args
+    solve_kwargs = {'verify_cs': False, 'verify_maximum': False, 'verbose': False, **solver_kwargs}
+    timescale_params = TimescaleParams(sigma_sq=1.0, tau_eco=10.0, tau_evo=1000.0)
+    
+    points = []
+    u_start, x_start = u0, x0
+    for cli in cli_values:
+        g_func = constructor(cli)
+        if x_start is not None:
+            # Re-seed extinct species so branches can reappear downstream
+            x_start = np.where(x_start > 1e-10, x_start, g_func.params.K_max / len(x_start))
+        solver = ESSSolver(g_func, timescale_params, integrator=integrator)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = solver.solve(u_start, x_start, **solve_kwargs)
+        points.append({
+            'cli': float(cli),
+            'u_ess': result.u_ess,
+            'x_ess': result.x_ess,
+            'stability_type': result.stability_type,
+            'converged': result.converged,
+        })
+        if continuation:
+            u_start, x_start = result.u_ess, result.x_ess
+    
+    return points
+
+
 class BifurcationAnalyzer:
     """
     Bifurcation analysis with CLI as bifurcation parameter.
@@ -303,6 +381,138 @@ class BifurcationAnalyzer:
             'landscapes': landscapes,
         }
     
+    def sweep(self, cli_range: np.ndarray, u0: np.ndarray,
+              x0: Optional[np.ndarray] = None,
+              n_jobs: int = -1,
+              continuation: bool = True,
+              max_refinements: int = 3,
+              jump_tol: float = 0.1,
+              integrator: str = 'adaptive',
+              **solver_kwargs) -> Dict:
+        """
+        Fast bifurcation sweep: parallel, warm-started, adaptively refined.
+        
+        Compared to analyze():
+        1. CLI values are split into contiguous chunks solved in a process
+           pool (one chunk per worker).
+        2. Within a chunk, numerical continuation warm-starts each point
+           from its neighbour's ESS instead of the same cold u0.
+        3. Intervals where the regime switches (number of strategies,
+           stability type, or an ESS jump > jump_tol) are bisected up to
+           max_refinements times, warm-started from the left endpoint.
+        4. Landscapes are returned lazily (LazyLandscapes) and only
+           computed for the points that are actually accessed.
+        
+        Parameters
+        ----------
+        cli_range : np.ndarray
+            CLI values to analyze
+        u0 : np.ndarray
+            Initial strategy guess (cold start for each chunk)
+        x0 : np.ndarray, optional
+            Initial density guess
+        n_jobs : int
+            Worker processes (-1 = all cores, 1 = serial). Falls back to
+            serial if the G-function constructor cannot be pickled
+            (e.g. a lambda).
+        continuation : bool
+            If True, warm-start each point from the previous ESS
+        max_refinements : int
+            Maximum bisection rounds near detected branch switches
+        jump_tol : float
+            ESS change between neighbours that counts as a branch switch
+        integrator : str
+            Darwinian Dynamics backend ('adaptive' or 'fixed')
+        **solver_kwargs
+            Arguments for ESSSolver.solve (e.g. t_max)
+            
+        Returns
+        -------
+        dict
+            Same keys as analyze() plus 'x_values', 'converged' and
+            'branch_points' (list of (cli_left, cli_right) intervals).
+            'landscapes' is a LazyLandscapes sequence.
+        """
+        cli_range = np.sort(np.asarray(cli_range, dtype=float))
+        n_jobs = cpu_count() if n_jobs == -1 else max(1, n_jobs)
+        if n_jobs > 1 and not self._constructor_picklable():
+            warnings.warn("g_function_constructor is not picklable; running sweep serially")
+            n_jobs = 1
+        
+        # Stage 1: contiguous chunks with continuation inside each chunk
+        n_chunks = min(n_jobs, len(cli_range)) if continuation else min(len(cli_range), n_jobs * 4)
+        chunks = [c for c in np.array_split(cli_range, max(n_chunks, 1)) if len(c)]
+        tasks = [(self.g_function_constructor, chunk, u0, x0, solver_kwargs, integrator, continuation)
+                 for chunk in chunks]
+        points = [p for chunk_points in self._map(_solve_cli_chain, tasks, n_jobs)
+                  for p in chunk_points]
+        
+        # Stage 2: bisect intervals where the regime switches
+        for _ in range(max_refinements):
+            switches = [i for i in range(len(points) - 1)
+                        if self._is_branch_switch(points[i], points[i + 1], jump_tol)]
+            if not switches:
+                break
+            tasks = []
+            for i in switches:
+                left = points[i]
+                mid = 0.5 * (left['cli'] + points[i + 1]['cli'])
+                u_start, x_start = (left['u_ess'], left['x_ess']) if continuation else (u0, x0)
+                tasks.append((self.g_function_constructor, np.array([mid]), u_start,
+                              x_start, solver_kwargs, integrator, False))
+            new_points = [p for chunk_points in self._map(_solve_cli_chain, tasks, n_jobs)
+                          for p in chunk_points]
+            points = sorted(points + new_points, key=lambda p: p['cli'])
+        
+        branch_points = [(points[i]['cli'], points[i + 1]['cli'])
+                         for i in range(len(points) - 1)
+                         if self._is_branch_switch(points[i], points[i + 1], jump_tol)]
+        
+        cli_values = np.array([p['cli'] for p in points])
+        ess_values = [p['u_ess'] for p in points]
+        x_values = [p['x_ess'] for p in points]
+        
+        return {
+            'cli_values': cli_values,
+            'ess_values': ess_values,
+            'x_values': x_values,
+            'stability_types': [p['stability_type'] for p in points],
+            'n_ess': np.array([int(np.sum(x > 1e-10)) for x in x_values]),
+            'converged': np.array([p['converged'] for p in points]),
+            'branch_points': branch_points,
+            'landscapes': LazyLandscapes(self.g_function_constructor, cli_values,
+                                         ess_values, x_values),
+        }
+    
+    @staticmethod
+    def _is_branch_switch(left: Dict[str, Any], right: Dict[str, Any], jump_tol: float) -> bool:
+        """Detect a regime change between two neighbouring sweep points."""
+        alive_left = left['x_ess'] > 1e-10
+        alive_right = right['x_ess'] > 1e-10
+        if alive_left.sum() != alive_right.sum():
+            return True
+        if left['stability_type'] != right['stability_type']:
+            return True
+        u_left = np.sort(np.asarray(left['u_ess'])[alive_left].ravel())
+        u_right = np.sort(np.asarray(right['u_ess'])[alive_right].ravel())
+        return u_left.size > 0 and np.max(np.abs(u_left - u_right)) > jump_tol
+    
+    def _constructor_picklable(self) -> bool:
+        """Check whether the constructor can be shipped to worker processes."""
+        try:
+            pickle.dumps(self.g_function_constructor)
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _map(func: Callable, tasks: List, n_jobs: int) -> List:
+        """Run tasks serially or in a process pool."""
+        if n_jobs == 1 or len(tasks) <= 1:
+            return [func(task) for task in tasks]
+        with Pool(min(n_jobs, len(tasks))) as pool:
+            return pool.map(func, tasks)
+    
     def plot_bifurcation_diagram(self, bifurcation_data: Dict,
                                 figsize: Tuple[int, int] = (12, 8)) -> plt.Figure:
         """
@@ -368,4 +578,5 @@ __all__ = [
     'LandscapeVisualizer',
     'BifurcationAnalyzer',
     'LandscapeData',
+    'LazyLandscapes',
 ]
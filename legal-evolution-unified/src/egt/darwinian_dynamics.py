@@ -51,9 +51,17 @@ from typing import Callable, Optional, Tuple, List
 from dataclasses import dataclass
 import warnings
 
+from scipy.integrate import solve_ivp
+from scipy.interpolate import interp1d
+from scipy.optimize import root
+
 from .g_function import GFunction, GFunctionParams
 
 
+# Integrator backends accepted by DarwinianDynamics
+INTEGRATORS = ('fixed', 'adaptive')
+
+
 @dataclass
 class TimescaleParams:
     """
@@ -139,9 +147,9 @@ class PopulationDynamics:
         ns = len(u)
         H = np.zeros(ns)
         
-        for i in range(ns):
-            if x[i] > 1e-10:  # Only compute for non-extinct populations
-                H[i] = self.g_function.evaluate(u[i], u, x)
+        alive = x > 1e-10  # Only compute for non-extinct populations
+        if np.any(alive):
+            H[alive] = self.g_function.evaluate_many(u[alive], u, x)
         
         return H
     
@@ -240,6 +248,60 @@ class PopulationDynamics:
             Equilibrium densities x*
         """
         return self.g_function.ecological_equilibrium(u, x0, tol, max_iter)
+    
+    def quasi_steady_state(self, u: np.ndarray, x_guess: np.ndarray,
+                           community: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Solve H_i(u, x) = 0 for the surviving species by root finding.
+        
+        This is the quasi-steady-state elimination of the fast variables
+        used by the adaptive integrator: instead of relaxing x(t) with
+        thousands of small exponential steps, the equilibrium is found
+        directly with a Newton-type solver warm-started from x_guess.
+        If the interior root is infeasible, the species with the most
+        negative density is dropped and the reduced community re-solved.
+        Falls back to equilibrium() if the solver itself fails.
+        
+        Parameters
+        ----------
+        u : np.ndarray
+            Resident strategies
+        x_guess : np.ndarray
+            Warm-start densities
+        community : np.ndarray, optional
+            Boolean mask of species allowed in the equilibrium
+            (default: x_guess > 1e-10). Species absent from x_guess but in
+            the community may re-enter if they can grow.
+            
+        Returns
+        -------
+        np.ndarray
+            Equilibrium densities x*(u)
+        """
+        ns = len(u)
+        support = (x_guess > 1e-10) if community is None else community.copy()
+        default_guess = self.g_function.params.K_max / ns
+        
+        while np.any(support):
+            def residual(x_support: np.ndarray) -> np.ndarray:
+                x = np.zeros(ns)
+                x[support] = x_support
+                return self.g_function.evaluate_many(u[support], u, x)
+            
+            guess = np.where(x_guess[support] > 1e-10, x_guess[support], default_guess)
+            sol = root(residual, guess, method='hybr')
+            if not sol.success:
+                return self.equilibrium(u, x0=np.where(x_guess > 1e-10, x_guess, 0.0))
+            
+            if np.all(sol.x > 1e-10):
+                x = np.zeros(ns)
+                x[support] = sol.x
+                return x
+            
+            # Infeasible root: remove the species with the most negative density
+            support[np.flatnonzero(support)[np.argmin(sol.x)]] = False
+        
+        return np.zeros(ns)
 
 
 class StrategyDynamics:
@@ -292,19 +354,18 @@ class StrategyDynamics:
             Selection gradients (ns, dim)
         """
         ns = len(u)
+        alive = x > 1e-10
         
         # Handle scalar vs vector strategies
         if u.ndim == 1:
             grad = np.zeros(ns)
-            for i in range(ns):
-                if x[i] > 1e-10:
-                    grad[i] = self.g_function.gradient(u[i], u, x)[0]
+            if np.any(alive):
+                grad[alive] = self.g_function.gradient_many(u[alive], u, x)[:, 0]
         else:
             dim = u.shape[1]
             grad = np.zeros((ns, dim))
-            for i in range(ns):
-                if x[i] > 1e-10:
-                    grad[i] = self.g_function.gradient(u[i], u, x)
+            if np.any(alive):
+                grad[alive] = self.g_function.gradient_many(u[alive], u, x)
         
         return grad
     
@@ -362,7 +423,8 @@ class DarwinianDynamics:
     - ESS stability: Lock-in persists even if reform intensity fluctuates wildly
     """
     
-    def __init__(self, g_function: GFunction, timescale_params: TimescaleParams):
+    def __init__(self, g_function: GFunction, timescale_params: TimescaleParams,
+                 integrator: str = 'fixed'):
         """
         Initialize coupled Darwinian Dynamics.
         
@@ -372,11 +434,19 @@ class DarwinianDynamics:
             G-function defining fitness
         timescale_params : TimescaleParams
             Timescale parameters (sigma², tau_eco, tau_evo)
+        integrator : str
+            Default integrator backend:
+            - 'fixed': fixed-dt stepping (dt_pop ecological steps per dt_strat)
+            - 'adaptive': scipy solve_ivp with stiff methods, quasi-steady-state
+              elimination of x, and an ESS convergence event
         """
         timescale_params.validate()
+        if integrator not in INTEGRATORS:
+            raise ValueError(f"integrator must be one of {INTEGRATORS}, got {integrator!r}")
         
         self.g_function = g_function
         self.params = timescale_params
+        self.integrator = integrator
         
         self.pop_dynamics = PopulationDynamics(g_function)
         self.strat_dynamics = StrategyDynamics(g_function, timescale_params.sigma_sq)
@@ -384,10 +454,22 @@ class DarwinianDynamics:
     def integrate_coupled(self, u0: np.ndarray, x0: np.ndarray,
                          t_max: float, dt_pop: float = 0.01, 
                          dt_strat: float = 1.0,
-                         use_quasi_equilibrium: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                         use_quasi_equilibrium: bool = True,
+                         integrator: Optional[str] = None,
+                         method: str = 'LSODA',
+                         rtol: float = 1e-6, atol: float = 1e-9,
+                         dense_output: bool = False) -> Tuple[np.ndarray, ...]:
         """
         Integrate coupled population-strategy dynamics.
         
+        With integrator='adaptive' the step size is chosen by scipy's
+        solve_ivp instead of dt_pop/dt_strat, so the cost no longer grows
+        with tau_evo/tau_eco. If use_quasi_equilibrium is True the fast
+        variables are eliminated (x = x*(u) by root finding) and only the
+        slow strategy ODE is integrated; otherwise the full stiff system
+        [x, u] is integrated. Integration stops at an ESS via a terminal
+        event on |du/dt|, mirroring the fixed-step convergence check.
+        
         Parameters
         ----------
         u0 : np.ndarray
@@ -403,6 +485,14 @@ class DarwinianDynamics:
         use_quasi_equilibrium : bool
             If True, use quasi-equilibrium assumption (x ≈ x* always)
             If False, integrate full coupled system (much slower)
+        integrator : str, optional
+            'fixed' or 'adaptive' (defaults to the instance integrator)
+        method : str
+            solve_ivp method for the adaptive backend ('LSODA', 'BDF', 'Radau')
+        rtol, atol : float
+            Tolerances for the adaptive backend
+        dense_output : bool
+            If True, also return a callable sol(t) -> (u(t), x(t))
             
         Returns
         -------
@@ -412,7 +502,32 @@ class DarwinianDynamics:
             Strategy trajectories
         x_trajectory : np.ndarray
             Density trajectories
+        dense : callable
+            Only if dense_output=True: continuous solution sol(t) -> (u, x)
         """
+        integrator = integrator or self.integrator
+        if integrator not in INTEGRATORS:
+            raise ValueError(f"integrator must be one of {INTEGRATORS}, got {integrator!r}")
+        
+        if integrator == 'adaptive':
+            t, u_trajectory, x_trajectory, dense, _ = self._integrate_adaptive(
+                u0, x0, t_max, dt_strat, use_quasi_equilibrium, method, rtol, atol
+            )
+            if dense_output:
+                return t, u_trajectory, x_trajectory, dense
+            return t, u_trajectory, x_trajectory
+        
+        t, u_trajectory, x_trajectory = self._integrate_fixed(
+            u0, x0, t_max, dt_pop, dt_strat, use_quasi_equilibrium
+        )
+        if dense_output:
+            return t, u_trajectory, x_trajectory, self._interpolant(t, u_trajectory, x_trajectory)
+        return t, u_trajectory, x_trajectory
+    
+    def _integrate_fixed(self, u0: np.ndarray, x0: np.ndarray, t_max: float,
+                         dt_pop: float, dt_strat: float,
+                         use_quasi_equilibrium: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fixed-step backend: dt_strat/dt_pop ecological steps per strategy step."""
         nt_strat = int(t_max / dt_strat)
         ns = len(u0)
         
@@ -451,9 +566,124 @@ class DarwinianDynamics:
         
         return t, u_trajectory, x_trajectory
     
+    def _integrate_adaptive(self, u0: np.ndarray, x0: np.ndarray, t_max: float,
+                            dt_strat: float, use_quasi_equilibrium: bool,
+                            method: str, rtol: float, atol: float,
+                            tol: float = 1e-6) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Callable, bool]:
+        """
+        Adaptive-step backend built on solve_ivp.
+        
+        Returns (t, u_trajectory, x_trajectory, dense, converged) where
+        converged is True if the ESS event (|du/dt| below tol / (10 dt_strat))
+        fired.
+        """
+        u_shape = u0.shape
+        n_u = u0.size
+        ns = len(u0)
+        sigma_sq = self.params.sigma_sq
+        
+        # Same stopping rule as the fixed-step loop: |u(t) - u(t - 10 dt)| < tol
+        gradient_tol = tol / (10 * dt_strat)
+        
+        if use_quasi_equilibrium:
+            # Fast variables eliminated: integrate du/dt = sigma² ∂G/∂v at x*(u)
+            community = x0 > 1e-10
+            x_cache = {'x': np.where(community, x0, 0.0)}
+            
+            def x_star(u: np.ndarray) -> np.ndarray:
+                x_cache['x'] = self.pop_dynamics.quasi_steady_state(
+                    u, x_cache['x'], community)
+                return x_cache['x']
+            
+            def rhs(t: float, y: np.ndarray) -> np.ndarray:
+                u = y.reshape(u_shape)
+                grad = self.strat_dynamics.selection_gradient(u, x_star(u))
+                return (sigma_sq * grad).reshape(-1)
+            
+            y0 = u0.astype(float).reshape(-1)
+            
+            def split(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+                return y.reshape(u_shape), None
+        else:
+            # Full stiff system y = [x, u]
+            def rhs(t: float, y: np.ndarray) -> np.ndarray:
+                x = np.maximum(y[:ns], 0.0)
+                u = y[ns:].reshape(u_shape)
+                dx = x * self.pop_dynamics.growth_rate(u, x)
+                du = sigma_sq * self.strat_dynamics.selection_gradient(u, x)
+                return np.concatenate([dx, du.reshape(-1)])
+            
+            y0 = np.concatenate([x0.astype(float), u0.astype(float).reshape(-1)])
+            
+            def split(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+                return y[ns:].reshape(u_shape), np.maximum(y[:ns], 0.0)
+        
+        def ess_event(t: float, y: np.ndarray) -> float:
+            return np.linalg.norm(rhs(t, y)[-n_u:]) - gradient_tol
+        ess_event.terminal = True
+        ess_event.direction = -1
+        
+        # Already stationary: the terminal event can never cross zero, so
+        # integrate a single strategy step instead of running to t_max
+        at_ess = ess_event(0.0, y0) < 0
+        t_end = min(dt_strat, t_max) if at_ess else t_max
+        
+        sol = solve_ivp(rhs, (0.0, t_end), y0, method=method, rtol=rtol, atol=atol,
+                        events=None if at_ess else ess_event, dense_output=True)
+        if sol.status == -1:
+            warnings.warn(f"Adaptive integration failed: {sol.message}")
+        
+        t = sol.t
+        u_trajectory = np.array([split(y)[0] for y in sol.y.T])
+        if use_quasi_equilibrium:
+            # Recover x*(u) along the accepted steps, warm-starting each solve
+            x_trajectory = np.zeros((len(t), ns))
+            x_trajectory[0] = x0
+            x_prev = np.where(community, x0, 0.0)
+            for i in range(1, len(t)):
+                x_prev = self.pop_dynamics.quasi_steady_state(
+                    u_trajectory[i], x_prev, community)
+                x_trajectory[i] = x_prev
+        else:
+            x_trajectory = np.array([split(y)[1] for y in sol.y.T])
+        
+        converged = at_ess or sol.status == 1
+        
+        def dense(t_query):
+            t_arr = np.atleast_1d(t_query)
+            us = np.array([split(y)[0] for y in sol.sol(t_arr).T])
+            if use_quasi_equilibrium:
+                # Warm-start x*(u) from the nearest accepted step
+                idx = np.clip(np.searchsorted(t, t_arr), 0, len(t) - 1)
+                xs = np.array([self.pop_dynamics.quasi_steady_state(
+                    u_k, x_trajectory[k], community) for u_k, k in zip(us, idx)])
+            else:
+                xs = np.array([split(y)[1] for y in sol.sol(t_arr).T])
+            if np.ndim(t_query) == 0:
+                return us[0], xs[0]
+            return us, xs
+        
+        return t, u_trajectory, x_trajectory, dense, converged
+    
+    @staticmethod
+    def _interpolant(t: np.ndarray, u_trajectory: np.ndarray,
+                     x_trajectory: np.ndarray) -> Callable:
+        """Piecewise-linear dense output for the fixed-step backend."""
+        if len(t) < 2:
+            return lambda t_query: (u_trajectory[0], x_trajectory[0])
+        u_interp = interp1d(t, u_trajectory, axis=0, bounds_error=False,
+                            fill_value=(u_trajectory[0], u_trajectory[-1]))
+        x_interp = interp1d(t, x_trajectory, axis=0, bounds_error=False,
+                            fill_value=(x_trajectory[0], x_trajectory[-1]))
+        return lambda t_query: (u_interp(t_query), x_interp(t_query))
+    
     def find_ess(self, u0: np.ndarray, x0: Optional[np.ndarray] = None,
                  t_max: float = 10000.0, dt_strat: float = 1.0,
-                 tol: float = 1e-6) -> Tuple[np.ndarray, np.ndarray, bool]:
+                 tol: float = 1e-6,
+                 integrator: Optional[str] = None,
+                 method: str = 'LSODA',
+                 rtol: float = 1e-6,
+                 atol: float = 1e-9) -> Tuple[np.ndarray, np.ndarray, bool]:
         """
         Find ESS by integrating Darwinian Dynamics until convergence.
         
@@ -471,6 +701,12 @@ class DarwinianDynamics:
             Strategy time step
         tol : float
             Convergence tolerance
+        integrator : str, optional
+            'fixed' or 'adaptive' (defaults to the instance integrator)
+        method : str
+            solve_ivp method for the adaptive backend ('LSODA', 'BDF', 'Radau')
+        rtol, atol : float
+            solve_ivp tolerances for the adaptive backend
             
         Returns
         -------
@@ -484,8 +720,20 @@ class DarwinianDynamics:
         if x0 is None:
             x0 = np.ones(len(u0)) * self.g_function.params.K_max / len(u0)
         
+        integrator = integrator or self.integrator
+        if integrator == 'adaptive':
+            t, u_traj, x_traj, _, converged = self._integrate_adaptive(
+                u0, x0, t_max, dt_strat, True, method, rtol, atol, tol=tol
+            )
+            if not converged:
+                # Ran to t_max: accept if the trajectory is stationary anyway
+                grad = self.strat_dynamics.selection_gradient(u_traj[-1], x_traj[-1])
+                converged = np.linalg.norm(self.params.sigma_sq * grad) * dt_strat < tol
+            return u_traj[-1], x_traj[-1], converged
+        
         t, u_traj, x_traj = self.integrate_coupled(
-            u0, x0, t_max, dt_strat=dt_strat, use_quasi_equilibrium=True
+            u0, x0, t_max, dt_strat=dt_strat, use_quasi_equilibrium=True,
+            integrator='fixed'
         )
         
         # Check if converged
@@ -500,7 +748,7 @@ class DarwinianDynamics:
             x_ess = x_traj[-1]
             
             # Check if close to stationary
-            du_final = np.linalg.norm(u_traj[-1] - u_traj[-100])
+            du_final = np.linalg.norm(u_traj[-1] - u_traj[-min(100, len(u_traj))])
             converged = du_final < tol
         
         return u_ess, x_ess, converged
@@ -632,6 +880,7 @@ class TimescaleSeparation:
 
 # Export main classes
 __all__ = [
+    'INTEGRATORS',
     'DarwinianDynamics',
     'PopulationDynamics',
     'StrategyDynamics',
@@ -55,11 +55,14 @@ Vince (2005), Section 8.2: "Disruptive Selection and Evolutionary Branching"
 """
 
 import numpy as np
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from multiprocessing import Pool, cpu_count
 import warnings
 
+from scipy.spatial import cKDTree
+
 from .g_function import GFunction
 from .darwinian_dynamics import DarwinianDynamics, TimescaleParams
 
@@ -255,7 +258,9 @@ class ConvergentStability:
     def test(g_function: GFunction, u_candidate: np.ndarray, 
              x_candidate: np.ndarray, timescale_params: TimescaleParams,
              n_trials: int = 5, perturbation: float = 0.1,
-             t_max: float = 5000.0) -> Tuple[bool, List[np.ndarray]]:
+             t_max: float = 5000.0,
+             integrator: str = 'fixed', method: str = 'LSODA',
+             rtol: float = 1e-6, atol: float = 1e-9) -> Tuple[bool, List[np.ndarray]]:
         """
         Test convergent stability by perturbed simulations.
         
@@ -275,6 +280,12 @@ class ConvergentStability:
             Size of perturbation (fraction of u_candidate)
         t_max : float
             Maximum integration time
+        integrator : str
+            Darwinian Dynamics backend ('fixed' or 'adaptive')
+        method : str
+            solve_ivp method when the integrator is 'adaptive'
+        rtol, atol : float
+            solve_ivp tolerances when the integrator is 'adaptive'
             
         Returns
         -------
@@ -283,7 +294,7 @@ class ConvergentStability:
         trajectories : List[np.ndarray]
             Strategy trajectories from each trial
         """
-        dynamics = DarwinianDynamics(g_function, timescale_params)
+        dynamics = DarwinianDynamics(g_function, timescale_params, integrator=integrator)
         
         trajectories = []
         converged_count = 0
@@ -297,7 +308,8 @@ class ConvergentStability:
             
             # Integrate dynamics
             u_final, x_final, converged = dynamics.find_ess(
-                u0, x_candidate, t_max=t_max, tol=1e-5
+                u0, x_candidate, t_max=t_max, tol=1e-5,
+                method=method, rtol=rtol, atol=atol
             )
             
             trajectories.append(u_final)
@@ -365,10 +377,7 @@ class MaximumPrinciple:
         
         # Sample adaptive landscape
         v_grid = np.linspace(v_range[0], v_range[1], n_points)
-        G_star = np.zeros(n_points)
-        
-        for i, v in enumerate(v_grid):
-            G_star[i] = g_function.evaluate(v, u, x)
+        G_star = g_function.evaluate_many(v_grid, u, x)
         
         # Find global maximum
         i_max = np.argmax(G_star)
@@ -399,6 +408,151 @@ class MaximumPrinciple:
         return is_maximum and fitness_near_zero, landscape_data
 
 
+class ESSIndex:
+    """
+    Nearest-neighbour index over ESS coalitions for deduplication.
+    
+    Each coalition is reduced to a canonical key (surviving strategies,
+    sorted, flattened) so that species order does not matter. Keys of the
+    same length share a KD-tree; new keys go to a small linear buffer
+    that is merged into the tree every `rebuild_every` inserts, so both
+    lookup and insertion are O(log n) amortized instead of the O(n) scan
+    over all previous results.
+    """
+    
+    def __init__(self, tol: float = 0.01, rebuild_every: int = 64):
+        """
+        Parameters
+        ----------
+        tol : float
+            Euclidean distance below which two keys are the same ESS
+        rebuild_every : int
+            Buffer size that triggers a KD-tree rebuild
+        """
+        self.tol = tol
+        self.rebuild_every = rebuild_every
+        self.items: List[Any] = []
+        # key length -> {'tree', 'tree_ids', 'tree_keys', 'buffer_keys', 'buffer_ids'}
+        self._groups: Dict[int, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def key(u: np.ndarray, x: Optional[np.ndarray] = None) -> np.ndarray:
+        """Canonical, order-invariant key for a coalition (u, x)."""
+        u = np.asarray(u, dtype=float)
+        rows = u.reshape(len(u), -1)
+        if x is not None:
+            rows = rows[np.asarray(x) > 1e-10]
+        if len(rows) == 0:
+            return np.zeros(0)
+        order = np.lexsort(rows.T[::-1])
+        return rows[order].ravel()
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def query(self, key: np.ndarray, tol: Optional[float] = None) -> Optional[int]:
+        """Return the id of a stored key within tol of `key`, or None."""
+        tol = self.tol if tol is None else tol
+        group = self._groups.get(len(key))
+        if group is None:
+            return None
+        if group['tree'] is not None:
+            dist, pos = group['tree'].query(key, distance_upper_bound=tol)
+            if np.isfinite(dist):
+                return group['tree_ids'][pos]
+        for buffered_key, item_id in zip(group['buffer_keys'], group['buffer_ids']):
+            if np.linalg.norm(buffered_key - key) <= tol:
+                return item_id
+        return None
+    
+    def add(self, key: np.ndarray, item: Any = None) -> bool:
+        """Insert `key` unless a duplicate exists. Returns True if inserted."""
+        if self.query(key) is not None:
+            return False
+        
+        group = self._groups.setdefault(len(key), {
+            'tree': None, 'tree_ids': [], 'tree_keys': [],
+            'buffer_keys': [], 'buffer_ids': [],
+        })
+        self.items.append(item)
+        group['buffer_keys'].append(np.asarray(key, dtype=float))
+        group['buffer_ids'].append(len(self.items) - 1)
+        
+        if len(group['buffer_keys']) >= self.rebuild_every:
+            group['tree_keys'].extend(group['buffer_keys'])
+            group['tree_ids'].extend(group['buffer_ids'])
+            group['buffer_keys'], group['buffer_ids'] = [], []
+            if len(key) > 0:
+                group['tree'] = cKDTree(np.array(group['tree_keys']))
+        return True
+    
+    def keys(self) -> List[np.ndarray]:
+        """All stored keys (used to ship a snapshot to worker processes)."""
+        out = []
+        for group in self._groups.values():
+            out.extend(group['tree_keys'])
+            out.extend(group['buffer_keys'])
+        return out
+
+
+def _multistart_batch(args: Tuple['ESSSolver', List[np.ndarray], List[np.ndarray],
+                                  Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run a batch of initial conditions (pool worker for find_all_ess).
+    
+    Each start is integrated in segments; between segments the state is
+    checked against the known ESS keys and abandoned early once it lies
+    inside a known basin (within basin_tol of a found ESS).
+    """
+    solver, starts, known_keys, settings, solve_kwargs = args
+    dedup_tol = settings['dedup_tol']
+    basin_tol = settings['basin_tol']
+    segment = settings['segment']
+    t_max = settings['t_max']
+    
+    local_index = ESSIndex(tol=dedup_tol)
+    for key in known_keys:
+        local_index.add(key)
+    
+    results = []
+    n_early_stopped = 0
+    n_unconverged = 0
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for u0 in starts:
+            u, x = np.asarray(u0, dtype=float), None
+            converged = False
+            stopped_early = False
+            t = 0.0
+            while t < t_max and not converged:
+                u, x, converged = solver.dynamics.find_ess(u, x, t_max=min(segment, t_max - t))
+                t += segment
+                if not converged and basin_tol is not None:
+                    if local_index.query(ESSIndex.key(u, x), basin_tol) is not None:
+                        stopped_early = True
+                        break
+            
+            if stopped_early:
+                n_early_stopped += 1
+                continue
+            if not converged:
+                n_unconverged += 1
+                continue
+            if local_index.query(ESSIndex.key(u, x)) is not None:
+                continue  # Duplicate of a known ESS, skip classification
+            
+            result = solver.solve(u, x, **solve_kwargs)
+            if result.converged and local_index.add(ESSIndex.key(result.u_ess, result.x_ess)):
+                results.append(result)
+    
+    return {
+        'results': results,
+        'n_early_stopped': n_early_stopped,
+        'n_unconverged': n_unconverged,
+    }
+
+
 class ESSSolver:
     """
     Complete ESS solver implementing Vince (2005) framework.
@@ -412,7 +566,8 @@ class ESSSolver:
     5. Classify: ESS, CSS, or REPELLOR
     """
     
-    def __init__(self, g_function: GFunction, timescale_params: TimescaleParams):
+    def __init__(self, g_function: GFunction, timescale_params: TimescaleParams,
+                 integrator: str = 'fixed'):
         """
         Initialize ESS solver.
         
@@ -422,14 +577,20 @@ class ESSSolver:
             G-function defining fitness landscape
         timescale_params : TimescaleParams
             Timescale parameters for dynamics
+        integrator : str
+            Darwinian Dynamics backend: 'fixed' (default) or 'adaptive'
+            (solve_ivp + quasi-steady-state; use inside calibration loops)
         """
         self.g_function = g_function
         self.timescale_params = timescale_params
-        self.dynamics = DarwinianDynamics(g_function, timescale_params)
+        self.integrator = integrator
+        self.dynamics = DarwinianDynamics(g_function, timescale_params, integrator=integrator)
+        self.last_search_stats: Dict[str, int] = {}
     
     def solve(self, u0: np.ndarray, x0: Optional[np.ndarray] = None,
               t_max: float = 10000.0, verify_cs: bool = True,
-              verify_maximum: bool = True) -> ESSResult:
+              verify_maximum: bool = True, verbose: bool = True,
+              method: str = 'LSODA', rtol: float = 1e-6, atol: float = 1e-9) -> ESSResult:
         """
         Solve for ESS and perform complete stability analysis.
         
@@ -445,49 +606,59 @@ class ESSSolver:
             If True, verify convergent stability with perturbed simulations
         verify_maximum : bool
             If True, verify Maximum Principle
+        verbose : bool
+            If True, print progress for each analysis step
+        method : str
+            solve_ivp method when the integrator is 'adaptive'
+        rtol, atol : float
+            solve_ivp tolerances when the integrator is 'adaptive'
             
         Returns
         -------
         ESSResult
             Complete ESS analysis result
         """
+        log = print if verbose else (lambda *args, **kwargs: None)
+        
         # Step 1: Find candidate ESS via Darwinian Dynamics
-        print("Step 1: Finding candidate ESS via Darwinian Dynamics...")
-        u_ess, x_ess, converged = self.dynamics.find_ess(u0, x0, t_max=t_max)
+        log("Step 1: Finding candidate ESS via Darwinian Dynamics...")
+        u_ess, x_ess, converged = self.dynamics.find_ess(
+            u0, x0, t_max=t_max, method=method, rtol=rtol, atol=atol
+        )
         
         if not converged:
             warnings.warn("Darwinian Dynamics did not converge. ESS may be invalid.")
         
         # Step 2: Test Invasion Resistance
-        print("Step 2: Testing Invasion Resistance (Hessian analysis)...")
+        log("Step 2: Testing Invasion Resistance (Hessian analysis)...")
         invasion_resistant, hessian_eigs = InvasionResistance.test(
             self.g_function, u_ess, x_ess
         )
         
         curvature = InvasionResistance.classify_curvature(hessian_eigs)
-        print(f"  Curvature: {curvature}")
-        print(f"  Invasion Resistant: {invasion_resistant}")
+        log(f"  Curvature: {curvature}")
+        log(f"  Invasion Resistant: {invasion_resistant}")
         
         # Step 3: Test Convergent Stability (optional, expensive)
         convergent_stable = True  # Assume true if dynamics converged
         if verify_cs:
-            print("Step 3: Testing Convergent Stability (perturbed simulations)...")
+            log("Step 3: Testing Convergent Stability (perturbed simulations)...")
             convergent_stable, _ = ConvergentStability.test(
-                self.g_function, u_ess, x_ess, self.timescale_params
+                self.g_function, u_ess, x_ess, self.timescale_params,
+                integrator=self.integrator, method=method, rtol=rtol, atol=atol
             )
-            print(f"  Convergent Stable: {convergent_stable}")
+            log(f"  Convergent Stable: {convergent_stable}")
         
         # Step 4: Verify Maximum Principle (optional)
         if verify_maximum:
-            print("Step 4: Verifying Maximum Principle...")
+            log("Step 4: Verifying Maximum Principle...")
             is_maximum, _ = MaximumPrinciple.verify(self.g_function, u_ess, x_ess)
-            print(f"  Is Global Maximum: {is_maximum}")
+            log(f"  Is Global Maximum: {is_maximum}")
         
         # Step 5: Compute fitness (should be ≈ 0 for ESS)
-        fitness = np.array([
-            self.g_function.evaluate(u_ess[i], u_ess, x_ess) 
-            for i in range(len(u_ess)) if x_ess[i] > 1e-10
-        ])
+        fitness = self.g_function.evaluate_many(
+            u_ess[x_ess > 1e-10], u_ess, x_ess
+        )
         
         # Step 6: Classify stability type
         if invasion_resistant and convergent_stable:
@@ -499,7 +670,7 @@ class ESSSolver:
         else:
             stability_type = StabilityType.UNKNOWN
         
-        print(f"\nFinal Classification: {stability_type.value}")
+        log(f"\nFinal Classification: {stability_type.value}")
         
         return ESSResult(
             u_ess=u_ess,
@@ -513,18 +684,37 @@ class ESSSolver:
         )
     
     def find_all_ess(self, u_grid: np.ndarray, n_trials: int = 10,
+                     n_jobs: int = 1, batch_size: Optional[int] = None,
+                     dedup_tol: float = 0.01, basin_tol: Optional[float] = None,
+                     segment: float = 500.0,
                      **solve_kwargs) -> List[ESSResult]:
         """
-        Find all ESS in strategy space by grid search.
+        Find all ESS in strategy space by multi-start search.
         
         Useful for detecting multiple ESS (coalitions) or bifurcations.
         
+        Initial conditions are split into batches and run in waves across a
+        process pool. Found ESS are deduplicated with an ESSIndex (KD-tree,
+        O(log n) per lookup), and with basin_tol set, starts whose
+        trajectory enters the neighbourhood of an already-known ESS are
+        terminated early instead of integrated to convergence.
+        
         Parameters
         ----------
         u_grid : np.ndarray
             Grid of initial strategies to try
         n_trials : int
             Number of trials per grid point
+        n_jobs : int
+            Worker processes (1 = serial, -1 = all cores)
+        batch_size : int, optional
+            Starts per task (default: spread evenly, 4 tasks per worker)
+        dedup_tol : float
+            Distance below which two ESS are considered identical
+        basin_tol : float, optional
+            Early-termination radius around known ESS (None = disabled)
+        segment : float
+            Integration time between basin checks
         **solve_kwargs
             Arguments passed to solve()
             
@@ -533,28 +723,54 @@ class ESSSolver:
         List[ESSResult]
             All unique ESS found
         """
-        ess_list = []
-        
-        for u0 in u_grid:
-            result = self.solve(u0, **solve_kwargs)
-            
-            # Check if this ESS is new (not duplicate)
-            is_duplicate = False
-            for prev_result in ess_list:
-                if np.allclose(result.u_ess, prev_result.u_ess, rtol=0.01):
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate and result.converged:
-                ess_list.append(result)
-        
-        return ess_list
+        solve_kwargs.setdefault('verbose', n_jobs == 1)
+        t_max = solve_kwargs.pop('t_max', 10000.0)
+        starts = list(u_grid)
+        n_jobs = cpu_count() if n_jobs == -1 else max(1, n_jobs)
+        if batch_size is None:
+            batch_size = max(1, int(np.ceil(len(starts) / (n_jobs * 4))))
+        batches = [starts[k:k + batch_size] for k in range(0, len(starts), batch_size)]
+        
+        settings = {
+            'dedup_tol': dedup_tol,
+            'basin_tol': basin_tol,
+            'segment': segment,
+            't_max': t_max,
+        }
+        solve_kwargs['t_max'] = t_max
+        
+        index = ESSIndex(tol=dedup_tol)
+        stats = {'n_starts': len(starts), 'n_early_stopped': 0, 'n_unconverged': 0}
+        
+        def merge(batch_outputs: List[Dict[str, Any]]) -> None:
+            for output in batch_outputs:
+                stats['n_early_stopped'] += output['n_early_stopped']
+                stats['n_unconverged'] += output['n_unconverged']
+                for result in output['results']:
+                    index.add(ESSIndex.key(result.u_ess, result.x_ess), result)
+        
+        # Waves of n_jobs batches: each wave sees the ESS found by earlier waves
+        waves = [batches[k:k + n_jobs] for k in range(0, len(batches), n_jobs)]
+        if n_jobs == 1:
+            for wave in waves:
+                merge([_multistart_batch((self, batch, index.keys(), settings, solve_kwargs))
+                       for batch in wave])
+        else:
+            with Pool(n_jobs) as pool:
+                for wave in waves:
+                    known = index.keys()
+                    merge(pool.map(_multistart_batch,
+                                   [(self, batch, known, settings, solve_kwargs) for batch in wave]))
+        
+        self.last_search_stats = stats
+        return list(index.items)
 
 
 # Export main classes
 __all__ = [
     'ESSSolver',
     'ESSResult',
+    'ESSIndex',
     'StabilityType',
     'InvasionResistance',
     'ConvergentStability',
@@ -97,6 +97,13 @@ class GFunction(ABC):
     1. evaluate(v, u, x) → fitness value
     2. gradient(v, u, x) → ∂G/∂v (for strategy dynamics)
     3. hessian(v, u, x) → ∂²G/∂v² (for ESS stability test)
+    
+    Batched evaluation:
+    -------------------
+    evaluate_many(v_array, u, x) and gradient_many(v_array, u, x) evaluate
+    many virtual strategies against the SAME resident community (u, x) and
+    return one NumPy array. The defaults below fall back to per-strategy
+    calls; subclasses with closed-form G override them with array kernels.
     """
     
     def __init__(self, params: GFunctionParams):
@@ -156,6 +163,51 @@ class GFunction(ABC):
         """
         pass
     
+    def evaluate_many(self, v_array: np.ndarray, u: np.ndarray,
+                      x: np.ndarray) -> np.ndarray:
+        """
+        Evaluate G(v, u, x) for a batch of virtual strategies.
+        
+        Parameters
+        ----------
+        v_array : np.ndarray
+            Virtual strategies (m,) or (m, strategy_dim)
+        u : np.ndarray
+            Resident strategies (ns x strategy_dim)
+        x : np.ndarray
+            Population densities (ns,)
+            
+        Returns
+        -------
+        np.ndarray
+            Fitness values (m,), one per virtual strategy
+        """
+        return np.array([self.evaluate(v, u, x) for v in v_array], dtype=float)
+    
+    def gradient_many(self, v_array: np.ndarray, u: np.ndarray,
+                      x: np.ndarray) -> np.ndarray:
+        """
+        Compute ∂G/∂v for a batch of virtual strategies.
+        
+        Parameters
+        ----------
+        v_array : np.ndarray
+            Virtual strategies (m,) or (m, strategy_dim)
+        u : np.ndarray
+            Resident strategies
+        x : np.ndarray
+            Population densities
+            
+        Returns
+        -------
+        np.ndarray
+            Gradient vectors (m, strategy_dim)
+        """
+        grads = [np.atleast_1d(self.gradient(v, u, x)) for v in v_array]
+        if not grads:
+            return np.zeros((0, 1))
+        return np.array(grads, dtype=float)
+    
     @abstractmethod
     def hessian(self, v: np.ndarray, u: np.ndarray, x: np.ndarray) -> np.ndarray:
         """
@@ -215,8 +267,8 @@ class GFunction(ABC):
         
         x = x0.copy()
         for iteration in range(max_iter):
-            # Compute fitness for each species
-            H = np.array([self.evaluate(u[i], u, x) for i in range(ns)])
+            # Compute fitness for each species (one batched call)
+            H = self.evaluate_many(u, u, x)
             
             # Update population densities (implicit Euler)
             x_new = x * np.exp(H * 0.01)  # Small time step
@@ -279,6 +331,11 @@ class ScalarGFunction(GFunction):
         diff = v - u_j - self.params.beta
         return ((diff**2 / sigma_a2**2 - 1 / sigma_a2) * self.a(v, u_j))
     
+    @staticmethod
+    def _as_scalar_strategies(s: np.ndarray) -> np.ndarray:
+        """Flatten (n,) or (n, 1) strategy arrays to a float vector (n,)."""
+        return np.asarray(s, dtype=float).reshape(-1)
+    
     def evaluate(self, v: Union[float, np.ndarray], 
                  u: np.ndarray, 
                  x: np.ndarray) -> float:
@@ -294,10 +351,74 @@ class ScalarGFunction(GFunction):
         if K_v < 1e-12:
             return -np.inf  # Strategy v is not viable
         
-        competition = np.sum([x[j] * self.a(v, u[j]) for j in range(len(u))])
+        u_flat = self._as_scalar_strategies(u)
+        competition = np.dot(np.asarray(x, dtype=float), self.a(v, u_flat))
         
         return self.params.r * (K_v - competition) / K_v
     
+    def _competition_matrix(self, v: np.ndarray, u: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Competition coefficients a(v_k, u_j) for all (k, j) pairs.
+        
+        Returns
+        -------
+        diff : np.ndarray
+            v_k - u_j - beta, shape (m, ns)
+        A : np.ndarray
+            a(v_k, u_j), shape (m, ns)
+        """
+        diff = v[:, None] - u[None, :] - self.params.beta
+        A = np.exp(-diff**2 / (2 * self.params.sigma_alpha**2))
+        return diff, A
+    
+    def evaluate_many(self, v_array: np.ndarray, u: np.ndarray,
+                      x: np.ndarray) -> np.ndarray:
+        """
+        Evaluate G(v, u, x) for all v in v_array at once.
+        
+        Builds the (m, ns) competition matrix a(v_k, u_j) in one shot and
+        contracts it with x, so the cost is a single BLAS matrix-vector
+        product instead of m * ns Python calls.
+        """
+        v = self._as_scalar_strategies(v_array)
+        u_flat = self._as_scalar_strategies(u)
+        x = np.asarray(x, dtype=float)
+        
+        K_v = self.K(v)
+        _, A = self._competition_matrix(v, u_flat)
+        competition = A @ x
+        
+        G = np.full(v.shape, -np.inf)
+        viable = K_v >= 1e-12  # Non-viable strategies get -inf, as in evaluate()
+        G[viable] = self.params.r * (K_v[viable] - competition[viable]) / K_v[viable]
+        
+        return G
+    
+    def gradient_many(self, v_array: np.ndarray, u: np.ndarray,
+                      x: np.ndarray) -> np.ndarray:
+        """
+        Compute ∂G/∂v for all v in v_array at once.
+        
+        Returns
+        -------
+        np.ndarray
+            Gradients (m, 1)
+        """
+        v = self._as_scalar_strategies(v_array)
+        u_flat = self._as_scalar_strategies(u)
+        x = np.asarray(x, dtype=float)
+        
+        K_v = self.K(v)
+        dK_v = self.dK_dv(v)
+        
+        diff, A = self._competition_matrix(v, u_flat)
+        sum_a = A @ x
+        sum_da = (-diff / self.params.sigma_alpha**2 * A) @ x
+        
+        grad = self.params.r * (dK_v * sum_a - K_v * sum_da) / (K_v**2)
+        
+        return grad[:, None]
+    
     def gradient(self, v: Union[float, np.ndarray], 
                  u: np.ndarray, 
                  x: np.ndarray) -> np.ndarray:
@@ -312,8 +433,9 @@ class ScalarGFunction(GFunction):
         K_v = self.K(v)
         dK_v = self.dK_dv(v)
         
-        sum_a = np.sum([x[j] * self.a(v, u[j]) for j in range(len(u))])
-        sum_da = np.sum([x[j] * self.da_dv(v, u[j]) for j in range(len(u))])
+        u_flat = self._as_scalar_strategies(u)
+        sum_a = np.dot(x, self.a(v, u_flat))
+        sum_da = np.dot(x, self.da_dv(v, u_flat))
         
         grad = self.params.r * (dK_v * sum_a - K_v * sum_da) / (K_v**2)
         
@@ -336,9 +458,10 @@ class ScalarGFunction(GFunction):
         dK_v = self.dK_dv(v)
         d2K_v = self.d2K_dv2(v)
         
-        sum_a = np.sum([x[j] * self.a(v, u[j]) for j in range(len(u))])
-        sum_da = np.sum([x[j] * self.da_dv(v, u[j]) for j in range(len(u))])
-        sum_d2a = np.sum([x[j] * self.d2a_dv2(v, u[j]) for j in range(len(u))])
+        u_flat = self._as_scalar_strategies(u)
+        sum_a = np.dot(x, self.a(v, u_flat))
+        sum_da = np.dot(x, self.da_dv(v, u_flat))
+        sum_d2a = np.dot(x, self.d2a_dv2(v, u_flat))
         
         # Product rule + chain rule (derived in Vince Ch 7)
         numerator = (d2K_v * sum_a + 2 * dK_v * sum_da - 
@@ -401,8 +524,7 @@ class FrequencyGFunction(ScalarGFunction):
         
         In frequency dynamics, dp_i/dt ∝ [G_i - G_avg].
         """
-        return np.sum([p[i] * self.evaluate_frequency(u[i], u, p, N) 
-                      for i in range(len(u))])
+        return np.dot(p, self.evaluate_many(u, u, p * N))
 
 
 class LotkaVolterraGFunction(ScalarGFunction):
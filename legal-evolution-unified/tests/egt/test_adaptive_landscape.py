@@ -0,0 +1,62 @@
+"""
+Bifurcation Sweep Tests
+=======================
+
+BifurcationAnalyzer.sweep must give the same ESS whether it runs
+serially or in a process pool, and continuation (warm starts) must not
+change the ESS found from a cold start.
+"""
+
+import numpy as np
+
+from src.egt.g_function import GFunctionParams, LotkaVolterraGFunction
+from src.egt.adaptive_landscape import BifurcationAnalyzer
+
+
+def _constructor(cli):
+    """Module-level so the pool can pickle it."""
+    return LotkaVolterraGFunction(GFunctionParams(r=0.25, K_max=100.0, sigma_alpha=2.0, beta=0.0),
+                                  cli_score=cli)
+
+
+CLI_GRID = np.linspace(0.1, 0.9, 6)
+U0 = np.array([0.8])
+SWEEP_KWARGS = dict(max_refinements=0, integrator='fixed', t_max=2000.0)
+
+
+def _assert_same_points(left, right, atol):
+    np.testing.assert_allclose(left['cli_values'], right['cli_values'])
+    for u_left, u_right in zip(left['ess_values'], right['ess_values']):
+        np.testing.assert_allclose(u_left, u_right, atol=atol)
+    for x_left, x_right in zip(left['x_values'], right['x_values']):
+        np.testing.assert_allclose(x_left, x_right, rtol=atol, atol=atol)
+    np.testing.assert_array_equal(left['n_ess'], right['n_ess'])
+
+
+def test_sweep_accepts_solver_overrides():
+    """verify_maximum etc. in solver_kwargs override the sweep defaults."""
+    data = BifurcationAnalyzer(_constructor).sweep(
+        CLI_GRID[:2], U0, n_jobs=1, verify_maximum=True, verbose=False, **SWEEP_KWARGS
+    )
+    assert len(data['cli_values']) == 2
+
+
+def test_sweep_serial_matches_pool():
+    """n_jobs=1 and a process pool solve the same points."""
+    analyzer = BifurcationAnalyzer(_constructor)
+    serial = analyzer.sweep(CLI_GRID, U0, n_jobs=1, continuation=False, **SWEEP_KWARGS)
+    pooled = analyzer.sweep(CLI_GRID, U0, n_jobs=2, continuation=False, **SWEEP_KWARGS)
+
+    _assert_same_points(serial, pooled, atol=1e-12)
+    assert serial['stability_types'] == pooled['stability_types']
+
+
+def test_continuation_matches_cold_start():
+    """Warm-starting from the neighbouring ESS reaches the same ESS."""
+    analyzer = BifurcationAnalyzer(_constructor)
+    warm = analyzer.sweep(CLI_GRID, U0, n_jobs=1, continuation=True, **SWEEP_KWARGS)
+    cold = analyzer.sweep(CLI_GRID, U0, n_jobs=1, continuation=False, **SWEEP_KWARGS)
+
+    assert warm['converged'].all() and cold['converged'].all()
+    _assert_same_points(warm, cold, atol=1e-3)
+    assert warm['stability_types'] == cold['stability_types']
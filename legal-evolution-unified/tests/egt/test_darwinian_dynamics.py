@@ -0,0 +1,71 @@
+"""
+Darwinian Dynamics Integrator Tests
+===================================
+
+The adaptive (solve_ivp) backend must reach the same ESS as the
+fixed-step loop, with its solver options passed through find_ess and
+ESSSolver.solve.
+"""
+
+import pytest
+import numpy as np
+
+from src.egt.g_function import GFunctionParams, ScalarGFunction
+from src.egt.darwinian_dynamics import DarwinianDynamics, TimescaleParams
+from src.egt.ess_solver import ESSSolver
+
+
+def _dynamics():
+    g_func = ScalarGFunction(GFunctionParams(r=0.25, K_max=100.0, sigma_k=2.0, sigma_alpha=4.0, beta=0.0))
+    return DarwinianDynamics(g_func, TimescaleParams(sigma_sq=0.5))
+
+
+@pytest.mark.parametrize("method", ['LSODA', 'BDF', 'Radau'])
+def test_fixed_and_adaptive_reach_same_ess(method):
+    """Both integrators converge to the carrying-capacity peak u = 0."""
+    dynamics = _dynamics()
+    u0 = np.array([1.5])
+
+    u_fixed, x_fixed, conv_fixed = dynamics.find_ess(u0, t_max=2000.0, integrator='fixed')
+    u_adaptive, x_adaptive, conv_adaptive = dynamics.find_ess(
+        u0, t_max=2000.0, integrator='adaptive', method=method, rtol=1e-8, atol=1e-10
+    )
+
+    assert conv_fixed and conv_adaptive
+    np.testing.assert_allclose(u_adaptive, u_fixed, atol=1e-3)
+    np.testing.assert_allclose(u_adaptive, [0.0], atol=1e-3)
+    np.testing.assert_allclose(x_adaptive, x_fixed, rtol=1e-3)
+
+
+def test_adaptive_event_threshold_follows_tol():
+    """A looser find_ess tol stops the adaptive integration earlier."""
+    dynamics = _dynamics()
+    u0 = np.array([1.5])
+
+    t_tight = dynamics._integrate_adaptive(u0, np.array([50.0]), 2000.0, 1.0, True,
+                                           'LSODA', 1e-8, 1e-10, tol=1e-8)[0]
+    t_loose = dynamics._integrate_adaptive(u0, np.array([50.0]), 2000.0, 1.0, True,
+                                           'LSODA', 1e-8, 1e-10, tol=1e-2)[0]
+
+    assert t_loose[-1] < t_tight[-1] < 2000.0
+
+
+def test_solve_forwards_solver_options_to_convergent_stability(monkeypatch):
+    """verify_cs runs its perturbed find_ess calls with the method and tolerances of step 1."""
+    calls = []
+    find_ess = DarwinianDynamics.find_ess
+
+    def recording_find_ess(self, *args, **kwargs):
+        calls.append((self.integrator, kwargs.get('method'), kwargs.get('rtol'), kwargs.get('atol')))
+        return find_ess(self, *args, **kwargs)
+
+    monkeypatch.setattr(DarwinianDynamics, 'find_ess', recording_find_ess)
+    dynamics = _dynamics()
+    solver = ESSSolver(dynamics.g_function, dynamics.params, integrator='adaptive')
+    result = solver.solve(np.array([1.5]), t_max=2000.0, verify_cs=True, verify_maximum=False,
+                          verbose=False, method='BDF', rtol=1e-7, atol=1e-10)
+
+    # Step 1 plus the default five perturbed trials
+    assert len(calls) == 6
+    assert set(calls) == {('adaptive', 'BDF', 1e-7, 1e-10)}
+    np.testing.assert_allclose(result.u_ess, [0.0], atol=1e-3)
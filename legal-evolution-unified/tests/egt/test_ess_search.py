@@ -0,0 +1,99 @@
+"""
+Multi-Start ESS Search Tests
+============================
+
+find_all_ess (waves, basin_tol early stopping, ESSIndex deduplication)
+must find the same ESS set as a plain serial loop over solve().
+"""
+
+import pytest
+import numpy as np
+
+from src.egt.g_function import GFunctionParams, ScalarGFunction
+from src.egt.darwinian_dynamics import TimescaleParams
+from src.egt.ess_solver import ESSSolver, ESSIndex
+
+
+class BimodalGFunction(ScalarGFunction):
+    """Carrying capacity with two peaks at ±2: two single-strategy ESS."""
+
+    def K(self, v):
+        s2 = self.params.sigma_k**2
+        return self.params.K_max * (np.exp(-(v - 2)**2 / (2 * s2)) + np.exp(-(v + 2)**2 / (2 * s2)))
+
+    def dK_dv(self, v):
+        s2 = self.params.sigma_k**2
+        return -self.params.K_max * ((v - 2) / s2 * np.exp(-(v - 2)**2 / (2 * s2))
+                                     + (v + 2) / s2 * np.exp(-(v + 2)**2 / (2 * s2)))
+
+    def d2K_dv2(self, v):
+        s2 = self.params.sigma_k**2
+        return self.params.K_max * sum(((v - c)**2 / s2**2 - 1 / s2) * np.exp(-(v - c)**2 / (2 * s2))
+                                       for c in (2, -2))
+
+
+SOLVE_KWARGS = dict(t_max=3000.0, verify_cs=False, verify_maximum=False, verbose=False)
+U_GRID = np.concatenate([np.linspace(-3.5, -0.5, 6), np.linspace(0.5, 3.5, 6)])[:, None]
+
+
+def _solver():
+    g_func = BimodalGFunction(GFunctionParams(r=0.25, K_max=100.0, sigma_k=0.7, sigma_alpha=2.0, beta=0.0))
+    return ESSSolver(g_func, TimescaleParams(sigma_sq=0.5), integrator='adaptive')
+
+
+def _serial_multistart(solver):
+    """Reference: solve every start to convergence, keep distinct ESS."""
+    found = []
+    for u0 in U_GRID:
+        result = solver.solve(u0, **SOLVE_KWARGS)
+        if result.converged and not any(np.allclose(result.u_ess, r.u_ess, atol=0.01) for r in found):
+            found.append(result)
+    return sorted(float(r.u_ess[0]) for r in found)
+
+
+@pytest.fixture(scope="module")
+def reference():
+    ess = _serial_multistart(_solver())
+    np.testing.assert_allclose(ess, [-2.0, 2.0], atol=0.05)
+    return ess
+
+
+@pytest.mark.parametrize("n_jobs,basin_tol", [(1, None), (1, 0.2), (2, None), (2, 0.2)])
+def test_find_all_ess_matches_serial_multistart(reference, n_jobs, basin_tol):
+    """Same ESS set for every worker count, with and without early stopping."""
+    solver = _solver()
+    results = solver.find_all_ess(U_GRID, n_jobs=n_jobs, batch_size=2, basin_tol=basin_tol,
+                                  segment=20.0, **SOLVE_KWARGS)
+
+    np.testing.assert_allclose(sorted(float(r.u_ess[0]) for r in results), reference, atol=0.01)
+    stats = solver.last_search_stats
+    assert stats['n_starts'] == len(U_GRID)
+    if basin_tol is None:
+        assert stats['n_early_stopped'] == 0
+    elif n_jobs == 1:
+        # Later waves start inside the basins found by the first wave
+        assert stats['n_early_stopped'] > 0
+
+
+def test_ess_index_deduplicates_across_tree_and_buffer():
+    """Duplicates are caught whether the stored key sits in the KD-tree or the buffer."""
+    index = ESSIndex(tol=0.01, rebuild_every=3)
+    keys = [np.array([k * 0.5]) for k in range(5)]
+    for k, key in enumerate(keys):
+        assert index.add(key, k)
+
+    # keys[:3] were merged into the tree, keys[3:] are still buffered
+    assert index._groups[1]['tree'] is not None
+    assert not index.add(keys[1] + 0.005)
+    assert not index.add(keys[4] - 0.005)
+    assert index.query(keys[4] + 0.1) is None
+    assert index.query(keys[2], tol=0.6) is not None
+    assert len(index) == 5
+
+
+def test_ess_index_key_is_order_invariant():
+    """Species order and extinct species do not change the key."""
+    u = np.array([[1.0], [-2.0], [5.0]])
+    x = np.array([10.0, 20.0, 0.0])
+    np.testing.assert_array_equal(ESSIndex.key(u, x), ESSIndex.key(u[[1, 0, 2]], x[[1, 0, 2]]))
+    np.testing.assert_array_equal(ESSIndex.key(u, x), [-2.0, 1.0])
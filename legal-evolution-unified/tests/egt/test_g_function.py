@@ -0,0 +1,67 @@
+"""
+G-Function Batch Evaluation Tests
+=================================
+
+evaluate_many / gradient_many must reproduce the per-strategy
+evaluate / gradient calls they replace.
+"""
+
+import pytest
+import numpy as np
+
+from src.egt.g_function import GFunctionParams, ScalarGFunction, LotkaVolterraGFunction
+
+
+def _g_functions():
+    return [
+        ScalarGFunction(GFunctionParams(r=0.25, K_max=100.0, sigma_k=2.0, sigma_alpha=1.5, beta=0.3)),
+        LotkaVolterraGFunction(GFunctionParams(r=0.4, K_max=50.0, sigma_alpha=1.0, beta=-0.2), cli_score=0.87),
+    ]
+
+
+@pytest.mark.parametrize("g_func", _g_functions())
+def test_evaluate_many_matches_loop(g_func):
+    """Batched fitness equals evaluate() for each strategy."""
+    u = np.array([[-0.5], [0.2], [1.1]])
+    x = np.array([12.0, 30.0, 5.0])
+    v_array = np.linspace(-3.0, 3.0, 41)
+
+    batched = g_func.evaluate_many(v_array, u, x)
+    looped = np.array([g_func.evaluate(np.array([v]), u, x) for v in v_array])
+
+    assert batched.shape == (len(v_array),)
+    np.testing.assert_allclose(batched, looped, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("g_func", _g_functions())
+def test_gradient_many_matches_loop(g_func):
+    """Batched gradients equal gradient() for each strategy."""
+    u = np.array([[-0.5], [0.2], [1.1]])
+    x = np.array([12.0, 30.0, 5.0])
+    v_array = np.linspace(-2.0, 2.0, 21)[:, None]
+
+    batched = g_func.gradient_many(v_array, u, x)
+    looped = np.array([g_func.gradient(v, u, x) for v in v_array])
+
+    assert batched.shape == (len(v_array), 1)
+    np.testing.assert_allclose(batched, looped, rtol=1e-12, atol=1e-12)
+
+
+def test_evaluate_many_non_viable_strategies():
+    """Strategies with K(v) < 1e-12 get -inf, as evaluate() returns."""
+    # CLI 1.0 → sigma_k = 0.5, so K(v) falls below the viability cutoff for |v| > 4
+    g_func = LotkaVolterraGFunction(GFunctionParams(K_max=100.0), cli_score=1.0)
+    u = np.array([0.0, 0.4])
+    x = np.array([40.0, 20.0])
+    v_array = np.array([-6.0, -3.0, 0.0, 0.5, 3.0, 6.0])
+
+    assert g_func.K(6.0) < 1e-12 and g_func.K(0.5) >= 1e-12
+
+    batched = g_func.evaluate_many(v_array, u, x)
+    looped = np.array([g_func.evaluate(v, u, x) for v in v_array])
+
+    non_viable = g_func.K(v_array) < 1e-12
+    assert non_viable.any() and not non_viable.all()
+    assert np.all(np.isneginf(batched[non_viable]))
+    assert np.all(np.isneginf(looped[non_viable]))
+    np.testing.assert_allclose(batched[~non_viable], looped[~non_viable], rtol=1e-12)
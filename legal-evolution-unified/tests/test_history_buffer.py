@@ -0,0 +1,116 @@
+"""
+Unit tests for the columnar simulation history
+Author: Ignacio Adrián Lerer
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation_module.environment import SimulationEnvironment, EnvironmentState
+from simulation_module.history import HistoryBuffer, HISTORY_VARIABLES
+
+
+# Digits EnvironmentState.to_dict() rounds to; the buffer keeps full precision
+LEGACY_DIGITS = {'mfd': 2, 'gdp_per_capita': 2}
+
+
+def _legacy_round(record):
+    return {k: round(v, LEGACY_DIGITS.get(k, 3)) if isinstance(v, float) else v
+            for k, v in record.items()}
+
+
+class LegacyHistoryEnvironment(SimulationEnvironment):
+    """Also keeps the list-of-dicts history the environment used to append"""
+
+    def __init__(self, *args, **kwargs):
+        self.legacy_history = []
+        super().__init__(*args, **kwargs)
+
+    def _record_history(self):
+        super()._record_history()
+        self.legacy_history.append(self.state.to_dict())
+
+
+@pytest.fixture(scope="module")
+def env():
+    env = LegacyHistoryEnvironment(n_workers=100, random_seed=5, crisis_probability=0.2)
+    env.run(30)
+    env.run(25)  # second run() grows a reserved buffer
+    return env
+
+
+class TestRoundTrip:
+    """HistoryBuffer exports reproduce the legacy history."""
+
+    def test_variables_match_state_dict(self):
+        assert list(HISTORY_VARIABLES) == list(EnvironmentState().to_dict())
+
+    def test_to_records_matches_legacy(self, env):
+        records = env.history_buffer.to_records()
+        assert [_legacy_round(r) for r in records] == env.legacy_history
+        assert env.history == records
+        # Plain Python scalars of the same kind (bool / int / float)
+        for r, l in zip(records, env.legacy_history):
+            for k in r:
+                assert type(r[k]) in (bool, int, float)
+                assert isinstance(r[k], bool) == isinstance(l[k], bool)
+                assert isinstance(r[k], int) == isinstance(l[k], int)
+
+    def test_to_pandas_matches_legacy(self, env):
+        expected = pd.DataFrame(env.legacy_history).set_index('timestep')
+        df = env.history_buffer.to_pandas()
+        pd.testing.assert_index_equal(df.index, expected.index)
+        pd.testing.assert_index_equal(df.columns, expected.columns)
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False, atol=5e-3, rtol=0)
+        assert df['crisis_active'].dtype == bool
+
+    def test_columns_match_legacy(self, env):
+        for variable in env.history_buffer.variables:
+            np.testing.assert_allclose(env.history_buffer[variable],
+                                       [row[variable] for row in env.legacy_history], atol=5e-3, rtol=0)
+
+
+class TestHistoryBuffer:
+    """Capacity, decimation and variable selection."""
+
+    def _states(self, n):
+        for t in range(1, n + 1):
+            yield EnvironmentState(timestep=t, cli_memetic=t / 100, reforms_attempted=t // 3)
+
+    def test_reserve_preallocates(self):
+        buffer = HistoryBuffer()
+        buffer.reserve(40)
+        assert buffer.capacity == 41
+        for state in self._states(40):
+            buffer.record(state)
+        assert buffer.capacity == 41 and len(buffer) == 40
+
+    def test_growth_keeps_rows(self):
+        buffer = HistoryBuffer(capacity=2)
+        states = list(self._states(50))
+        for state in states:
+            buffer.record(state)
+        assert [_legacy_round(r) for r in buffer.to_records()] == [s.to_dict() for s in states]
+
+    def test_decimation_and_subset(self):
+        buffer = HistoryBuffer(('cli', 'reforms_attempted'), decimation=5)
+        states = list(self._states(23))
+        for state in states:
+            buffer.record(state)
+        assert buffer.variables == ['timestep', 'cli', 'reforms_attempted']
+        np.testing.assert_array_equal(buffer['timestep'], [5, 10, 15, 20])
+        expected = [{k: s.to_dict()[k] for k in buffer.variables} for s in states if s.timestep % 5 == 0]
+        assert [_legacy_round(r) for r in buffer.to_records()] == expected
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            HistoryBuffer(('not_a_variable',))
+        with pytest.raises(ValueError):
+            HistoryBuffer(decimation=0)
@@ -12,7 +12,10 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from jurisrank.jurisrank import JurisRank
+from jurisrank.jurisrank import JurisRank, citation_matrix_from_edges, SOLVERS
+from jurisrank.weighting import (WeightingPipeline, CitationWeight, TemporalDecayWeight,
+                                 CourtHierarchyWeight, DoctrinalClusteringWeight, DoctrinalIndex)
+from scipy.sparse import csr_matrix, issparse
 
 class TestJurisRank:
     """Test suite for JurisRank algorithm."""
@@ -156,6 +159,157 @@ class TestJurisRank:
         
         # Should be sorted by fitness (descending)
         assert leaders[0][1] >= leaders[1][1]
+    
+    def test_sparse_input_matches_dense(self):
+        """Test sparse and edge-list citation inputs give the dense result."""
+        dense_results = self.jr.calculate_jurisrank(self.citation_matrix, self.sample_cases)
+        sparse_results = self.jr.calculate_jurisrank(csr_matrix(self.citation_matrix), self.sample_cases)
+        edge_matrix = citation_matrix_from_edges([(1, 0), (2, 1)], n_cases=3)
+        edge_results = self.jr.calculate_jurisrank(edge_matrix, self.sample_cases)
+        
+        for case_id, score in dense_results.items():
+            assert abs(sparse_results[case_id] - score) < 1e-12
+            assert abs(edge_results[case_id] - score) < 1e-12
+    
+    def test_sparse_normalization_keeps_dangling_rows_empty(self):
+        """Test sparse normalization does not materialize dangling rows."""
+        normalized = self.jr._normalize_matrix(csr_matrix(self.citation_matrix))
+        
+        assert issparse(normalized)
+        assert normalized.nnz == 2
+        assert normalized[0, :].sum() == 0.0
+    
+    def test_weighting_pipeline_composition(self):
+        """Test a composed pipeline matches the individual weighting steps."""
+        pipeline = WeightingPipeline([TemporalDecayWeight(self.jr.temporal_decay), CourtHierarchyWeight()])
+        weighted = pipeline.apply(csr_matrix(self.citation_matrix), self.sample_cases)
+        
+        expected = self.jr._apply_hierarchical_weights(
+            self.jr._apply_temporal_weights(self.citation_matrix, self.sample_cases),
+            self.sample_cases
+        )
+        assert np.allclose(weighted.toarray(), expected)
+        
+        # Custom pipelines are used by calculate_jurisrank
+        jr = JurisRank(max_iterations=10, weighting=pipeline)
+        assert jr.get_weighting_pipeline() is pipeline
+    
+    def test_citation_weight_requires_stage_methods(self):
+        """Weighting stages must implement prepare and edge_weights."""
+        class PrepareOnly(CitationWeight):
+            def prepare(self, metadata):
+                return np.ones(len(metadata))
+        
+        class UnitWeight(PrepareOnly):
+            def edge_weights(self, citing, cited, features):
+                return features[citing]
+        
+        with pytest.raises(TypeError):
+            CitationWeight()
+        with pytest.raises(TypeError):
+            PrepareOnly()
+        
+        weighted = WeightingPipeline([UnitWeight()]).apply(csr_matrix(self.citation_matrix), self.sample_cases)
+        assert np.allclose(weighted.toarray(), self.citation_matrix)
+    
+    def test_doctrinal_index_similarity(self):
+        """Test inverted-index Jaccard and its MinHash approximation."""
+        elements = [['due_process', 'emergency'], ['emergency'], ['due_process', 'emergency'], []]
+        index = DoctrinalIndex(elements, num_perm=256)
+        
+        assert sorted(index.cases_with('emergency')) == [0, 1, 2]
+        assert np.allclose(index.jaccard([1, 0, 3], [0, 2, 0]), [0.5, 1.0, 0.0])
+        assert np.allclose(index.minhash_jaccard([1, 0, 3], [0, 2, 0]), [0.5, 1.0, 0.0], atol=0.15)
+        
+        # Clustering boost only applies along citation edges
+        cases = self.sample_cases.copy()
+        cases['doctrinal_elements'] = elements[:3]
+        clustered = WeightingPipeline([DoctrinalClusteringWeight()]).apply(
+            csr_matrix(self.citation_matrix), cases)
+        assert clustered.nnz == 2
+        assert np.isclose(clustered[1, 0], 1.25)
+    
+    def test_solvers_agree_with_power_iteration(self):
+        """Test accelerated solvers reach the power-iteration scores."""
+        rng = np.random.default_rng(0)
+        citations = (rng.random((40, 40)) < 0.1).astype(float)
+        cases = pd.DataFrame({
+            'case_id': [f'c{i}' for i in range(40)],
+            'date': pd.date_range('1990-01-01', periods=40, freq='180D'),
+            'court_level': 'Supreme Court'
+        })
+        
+        reference = JurisRank(max_iterations=500, convergence_threshold=1e-12).calculate_jurisrank(citations, cases)
+        for solver in SOLVERS:
+            jr = JurisRank(max_iterations=500, convergence_threshold=1e-12, solver=solver)
+            results = jr.calculate_jurisrank(citations, cases)
+            assert np.allclose(list(results.values()), list(reference.values()), atol=1e-8)
+        
+        with pytest.raises(ValueError):
+            JurisRank(solver='newton')
+    
+    def test_warm_start_and_history_interval(self):
+        """Test warm starts converge faster and history can be decimated."""
+        jr = JurisRank(max_iterations=200, convergence_threshold=1e-10, history_interval=5)
+        results = jr.calculate_jurisrank(self.citation_matrix, self.sample_cases)
+        cold_iterations = jr.iterations_run
+        assert len(jr.fitness_history) == cold_iterations // 5
+        
+        warm_results = jr.calculate_jurisrank(self.citation_matrix, self.sample_cases, initial_scores=results)
+        assert jr.iterations_run < cold_iterations
+        for case_id, score in results.items():
+            assert abs(warm_results[case_id] - score) < 1e-8
+        
+        jr.history_interval = 0
+        jr.calculate_jurisrank(self.citation_matrix, self.sample_cases)
+        assert jr.fitness_history == []
+    
+    def test_incremental_update_matches_recompute(self):
+        """Test incremental updates stay within their error bound of a full recompute."""
+        jr = JurisRank(max_iterations=200, convergence_threshold=1e-8)
+        jr.calculate_jurisrank(self.citation_matrix, self.sample_cases)
+        
+        new_cases = pd.DataFrame({
+            'case_id': ['Case_D', 'Case_E'],
+            'date': ['2021-01-01', '2022-01-01'],
+            'court_level': ['Supreme Court', 'Lower Court']
+        })
+        jr.update_jurisrank(new_cases, [('Case_D', 'Case_A'), ('Case_D', 'Case_C')])
+        updated = jr.update_jurisrank(new_citations=[('Case_E', 'Case_D'), ('Case_A', 'Case_B')])
+        
+        all_cases = pd.concat([self.sample_cases, new_cases], ignore_index=True)
+        citations = citation_matrix_from_edges([(1, 0), (2, 1), (3, 0), (3, 2), (4, 3), (0, 1)], n_cases=5)
+        reference = JurisRank(max_iterations=500, convergence_threshold=1e-12).calculate_jurisrank(
+            citations, all_cases)
+        
+        error = sum(abs(updated[case_id] - score) for case_id, score in reference.items())
+        assert error <= jr.update_error_bound <= 1e-6
+        
+        with pytest.raises(ValueError):
+            jr.update_jurisrank(new_citations=[('Case_Z', 'Case_A')])
+    
+    def test_temporal_evolution_matches_per_window_ranking(self):
+        """Test sliding windows match ranking each window's subgraph from scratch."""
+        rng = np.random.default_rng(1)
+        citations = (rng.random((30, 30)) < 0.15).astype(float)
+        cases = pd.DataFrame({
+            'case_id': [f'c{i}' for i in range(30)],
+            'date': pd.Timestamp('1990-01-01') + pd.to_timedelta(rng.integers(0, 3650, 30), unit='D'),
+            'court_level': 'Appeals Court'
+        })
+        windows = [('1990-01-01', '1995-12-31'), ('1992-01-01', '1997-12-31'), ('1994-01-01', '1999-12-31')]
+        
+        jr = JurisRank(max_iterations=500, convergence_threshold=1e-12)
+        evolution = jr.calculate_temporal_evolution(citations, cases, windows)
+        
+        assert len(evolution) == 3
+        dates = pd.to_datetime(cases['date'])
+        for (start, end), period_fitness in zip(windows, evolution.values()):
+            in_window = np.flatnonzero((dates >= start) & (dates <= end))
+            expected = jr.calculate_jurisrank(citations[np.ix_(in_window, in_window)],
+                                              cases.iloc[in_window].reset_index(drop=True))
+            assert list(period_fitness) == list(expected)
+            assert np.allclose(list(period_fitness.values()), list(expected.values()), atol=1e-9)
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
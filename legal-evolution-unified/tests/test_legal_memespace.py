@@ -0,0 +1,429 @@
+"""
+Unit tests for Legal-Memespace module
+Author: Ignacio Adrián Lerer
+"""
+
+import sys
+import os
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.integrate import odeint
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.legal_memespace import (LegalMemespace, LotkaVolterraSystem, EquilibriumAnalyzer,
+                                  detect_changepoints, CHANGEPOINT_METHODS)
+from tools.legal_memespace.changepoint import suppress_overlapping_peaks
+from tools.legal_memespace.memespace import ODE_METHODS
+
+
+def loop_lotka_volterra(populations, t, r, K, alpha):
+    """Element-by-element competition equations the vectorized system replaced."""
+    n = len(populations)
+    dpdt = np.zeros(n)
+    for i in range(n):
+        competition_effect = sum(alpha[i, j] * populations[j] for j in range(n))
+        if K[i] > 0:
+            dpdt[i] = r[i] * populations[i] * (1 - competition_effect / K[i])
+        else:
+            dpdt[i] = 0
+        if populations[i] <= 0:
+            dpdt[i] = max(0, dpdt[i])
+    return dpdt
+
+
+def competition_system(n_doctrines=5, seed=0, frozen=()):
+    rng = np.random.default_rng(seed)
+    r = rng.uniform(0.2, 1.5, n_doctrines)
+    K = rng.uniform(50.0, 150.0, n_doctrines)
+    K[list(frozen)] = 0.0
+    alpha = rng.uniform(0.1, 1.2, (n_doctrines, n_doctrines))
+    np.fill_diagonal(alpha, 1.0)
+    return r, K, alpha
+
+
+class TestLotkaVolterraSystem:
+    """Vectorized right-hand side, analytic Jacobian and integrators."""
+
+    @pytest.mark.parametrize("frozen", [(), (1,)])
+    def test_rhs_matches_loop(self, frozen):
+        r, K, alpha = competition_system(frozen=frozen)
+        system = LotkaVolterraSystem(r, K, alpha)
+        rng = np.random.default_rng(1)
+        states = rng.uniform(-5.0, 200.0, (50, len(r)))
+        states[:10, 2] = 0.0
+        for state in states:
+            np.testing.assert_allclose(system.rhs(state), loop_lotka_volterra(state, 0.0, r, K, alpha),
+                                       rtol=1e-12, atol=1e-10)
+
+    @pytest.mark.parametrize("frozen", [(), (3,)])
+    def test_jacobian_matches_finite_differences(self, frozen):
+        r, K, alpha = competition_system(seed=2, frozen=frozen)
+        system = LotkaVolterraSystem(r, K, alpha)
+        rng = np.random.default_rng(3)
+        step = 1e-6
+        for state in rng.uniform(1.0, 150.0, (20, len(r))):
+            numeric = np.column_stack([
+                (system.rhs(state + step * e) - system.rhs(state - step * e)) / (2 * step)
+                for e in np.eye(len(r))
+            ])
+            np.testing.assert_allclose(system.jacobian(state), numeric, rtol=1e-6, atol=1e-8)
+
+    def test_jacobian_clamped_rows(self):
+        r, K, alpha = competition_system(seed=4)
+        system = LotkaVolterraSystem(r, K, alpha)
+        # Doctrine 0 is below zero with room to grow, so its decline is clamped
+        state = np.array([-1.0, 10.0, 10.0, 10.0, 10.0])
+        assert system.rhs(state)[0] == 0.0
+        np.testing.assert_array_equal(system.jacobian(state)[0], 0.0)
+
+    @pytest.mark.parametrize("method", ODE_METHODS)
+    @pytest.mark.parametrize("seed", [0, 5])
+    def test_integrators_match_loop(self, method, seed):
+        r, K, alpha = competition_system(seed=seed, frozen=(4,))
+        initial = np.random.default_rng(seed).uniform(5.0, 40.0, len(r))
+        time_points = np.linspace(0, 40, 81)
+
+        expected = odeint(loop_lotka_volterra, initial, time_points, args=(r, K, alpha),
+                          rtol=1e-10, atol=1e-10)
+        actual = LotkaVolterraSystem(r, K, alpha).integrate(initial, time_points, method=method)
+
+        assert actual.shape == expected.shape
+        np.testing.assert_allclose(actual, expected, rtol=1e-2, atol=1e-2)
+
+    def test_simulate_competition_methods(self):
+        r, K, alpha = competition_system(seed=6)
+        initial = np.full(len(r), 10.0)
+        time_points = np.linspace(0, 20, 41)
+        memespace = LegalMemespace()
+        solutions = [memespace.simulate_competition(initial, alpha, time_points, r, K, ode_method=method)
+                     for method in ODE_METHODS]
+        for solution in solutions[1:]:
+            np.testing.assert_allclose(solution, solutions[0], rtol=1e-2, atol=1e-2)
+        with pytest.raises(ValueError):
+            memespace.simulate_competition(initial, alpha, time_points, ode_method='rk45')
+
+
+COURT_LEVELS = ['Supreme Court', 'Appeals Court', 'Federal Court', 'Provincial Supreme', 'Lower Court', None]
+SYNTHETIC_COLUMNS = [
+    ('state_power', 0.5), ('emergency_level', 0.5), ('formalism', 0.5), ('permanence', 0.5),
+    ('executive_power', 0.5), ('legislative_deference', 0.5), ('judicial_activism', 0.5),
+    ('rights_protection', 0.5), ('property_rights', 0.5), ('due_process', 0.5),
+    ('economic_crisis', 0.0), ('inflation_context', 0.0), ('fiscal_emergency', 0.0),
+    ('emergency_doctrine', 0.0), ('formalist_doctrine', 0.0), ('regulatory_state', 0.0),
+    ('constitutional_strict', 0.0),
+]
+COURT_WEIGHTS = {'Supreme Court': 1.0, 'Appeals Court': 0.8, 'Federal Court': 0.6,
+                 'Provincial Supreme': 0.4, 'Lower Court': 0.2}
+
+
+def case_table(n_cases=203, seed=0, explicit=False):
+    """Cases with some doctrinal attributes missing entirely and some NaN entries."""
+    rng = np.random.default_rng(seed)
+    cases = pd.DataFrame({'case_id': [f'case_{k}' for k in range(n_cases)]})
+    if explicit:
+        for k in range(6):
+            cases[f'feature_{k}'] = rng.normal(size=n_cases) * (k + 1)
+        cases.loc[rng.choice(n_cases, 10), 'feature_2'] = np.nan
+        return cases
+    for name, _ in SYNTHETIC_COLUMNS[:12]:
+        cases[name] = rng.uniform(0.0, 1.0, n_cases)
+    cases.loc[rng.choice(n_cases, 15), 'formalism'] = np.nan
+    cases['court_level'] = [COURT_LEVELS[k] for k in rng.integers(len(COURT_LEVELS), size=n_cases)]
+    cases['year'] = rng.integers(1900, 2025, n_cases).astype(float)
+    return cases
+
+
+def reference_features(cases):
+    """Row-by-row feature construction of the original map_doctrinal_space."""
+    explicit = [col for col in cases.columns if col.startswith('feature_')]
+    if explicit:
+        return cases[explicit].values.astype(float)
+    rows = []
+    for _, case in cases.iterrows():
+        values = [case.get(name, default) for name, default in SYNTHETIC_COLUMNS[:10]]
+        values.append(COURT_WEIGHTS.get(case.get('court_level'), 0.5))
+        values.append((case.get('year', 1962) - 1900) / 125.0)
+        values.extend(case.get(name, default) for name, default in SYNTHETIC_COLUMNS[10:])
+        rows.append(values)
+    return np.array(rows, dtype=float)
+
+
+def reference_mapping(cases, n_dimensions=4, random_state=42):
+    """Original mapping: column-mean imputation, scaling, PCA and column-wise min-max."""
+    features = reference_features(cases)
+    for col in range(features.shape[1]):
+        mask = np.isfinite(features[:, col])
+        features[~mask, col] = features[mask, col].mean() if mask.any() else 0.5
+    coordinates = PCA(n_components=n_dimensions, random_state=random_state).fit_transform(
+        StandardScaler().fit_transform(features))
+    normalized = np.full_like(coordinates, 0.5)
+    for i in range(n_dimensions):
+        low, high = coordinates[:, i].min(), coordinates[:, i].max()
+        if high > low:
+            normalized[:, i] = (coordinates[:, i] - low) / (high - low)
+    return normalized
+
+
+class TestDoctrinalSpace:
+    """Full and incremental mapping, projection state and chunked input."""
+
+    @pytest.mark.parametrize("explicit", [False, True])
+    def test_map_doctrinal_space_unchanged(self, explicit):
+        cases = case_table(explicit=explicit)
+        memespace = LegalMemespace()
+        coordinates = memespace.map_doctrinal_space(cases)
+
+        np.testing.assert_allclose(coordinates, reference_mapping(cases), rtol=1e-10, atol=1e-10)
+        np.testing.assert_array_equal(memespace.coordinates_cache['case_7'], coordinates[7])
+
+    def test_map_doctrinal_space_feature_columns(self):
+        cases = case_table(explicit=True)
+        columns = ['feature_0', 'feature_2', 'feature_3', 'feature_4', 'feature_5']
+        coordinates = LegalMemespace().map_doctrinal_space(cases, feature_columns=columns)
+        np.testing.assert_allclose(coordinates, reference_mapping(cases[columns]), rtol=1e-10, atol=1e-10)
+        with pytest.raises(ValueError):
+            LegalMemespace().map_doctrinal_space(cases, feature_columns=['feature_9'])
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_projection_state_round_trip(self, incremental, tmp_path):
+        cases, new_cases = case_table(seed=1), case_table(n_cases=40, seed=2)
+        fitted = LegalMemespace()
+        if incremental:
+            fitted.fit_doctrinal_space_incremental(cases, chunksize=50)
+        else:
+            fitted.map_doctrinal_space(cases)
+        path = tmp_path / 'projection.json'
+        fitted.save_projection_state(str(path))
+
+        restored = LegalMemespace().load_projection_state(str(path))
+        assert type(restored.pca) is type(fitted.pca)
+        for source in (cases, new_cases):
+            np.testing.assert_allclose(restored.project_doctrinal_space(source),
+                                       fitted.project_doctrinal_space(source), rtol=1e-12, atol=1e-12)
+        with pytest.raises(ValueError):
+            LegalMemespace(n_dimensions=3).load_projection_state(str(path))
+
+    def test_project_matches_full_mapping(self):
+        cases = case_table(seed=3)
+        memespace = LegalMemespace()
+        coordinates = memespace.map_doctrinal_space(cases)
+        np.testing.assert_allclose(memespace.project_doctrinal_space(cases, chunksize=64), coordinates,
+                                   rtol=1e-10, atol=1e-10)
+
+    @pytest.mark.parametrize("explicit", [False, True])
+    def test_csv_chunks_match_dataframe(self, explicit, tmp_path):
+        cases = case_table(seed=4, explicit=explicit)
+        path = tmp_path / 'cases.csv'
+        cases.to_csv(path, index=False)
+
+        from_frame = LegalMemespace().fit_doctrinal_space_incremental(cases, chunksize=50)
+        from_csv = LegalMemespace().fit_doctrinal_space_incremental(str(path), chunksize=50)
+
+        np.testing.assert_allclose(from_csv.pca.components_, from_frame.pca.components_, rtol=1e-10, atol=1e-10)
+        np.testing.assert_allclose(from_csv.project_doctrinal_space(str(path), chunksize=64),
+                                   from_frame.project_doctrinal_space(cases, chunksize=64),
+                                   rtol=1e-10, atol=1e-10)
+
+
+def shifted_trajectory(n_points=300, shifts=(100, 200), seed=0, noise=0.4):
+    """Doctrinal coordinates whose mean jumps along a new dimension at each shift."""
+    rng = np.random.default_rng(seed)
+    means = np.zeros((n_points, 4))
+    for k, index in enumerate(shifts):
+        means[index:, k % 4] += 1.5
+    return means + rng.normal(0.0, noise, means.shape)
+
+
+def weekly_dates(n_points):
+    return pd.Series(pd.date_range('1990-01-01', periods=n_points, freq='W'))
+
+
+class TestChangePoints:
+    """Change-point candidates and significant transitions for every method."""
+
+    @pytest.mark.parametrize("method", CHANGEPOINT_METHODS)
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_candidates_locate_shifts(self, method, seed):
+        candidates = detect_changepoints(shifted_trajectory(seed=seed), method=method,
+                                         window_sizes=(5, 10, 20))
+        assert len(candidates) == 2
+        np.testing.assert_allclose([c['index'] for c in candidates], [100, 200], atol=3)
+        for candidate in candidates:
+            assert candidate['start'] < candidate['index'] < candidate['end']
+
+    def test_window_blocks_do_not_overlap_peaks(self):
+        coordinates = shifted_trajectory(seed=3)
+        candidates = detect_changepoints(coordinates, method='window', window_sizes=(5, 10, 20), penalty=0.0)
+        indices = [c['index'] for c in candidates]
+        assert len(indices) > 2
+        for candidate in candidates:
+            inside = [i for i in indices if candidate['start'] <= i < candidate['end']]
+            assert inside == [candidate['index']]
+
+    def test_suppress_overlapping_peaks(self):
+        peaks = np.array([10, 14, 30, 45, 52])
+        heights = np.array([1.0, 3.0, 2.0, 0.5, 4.0])
+        windows = np.array([5, 5, 5, 20, 5])
+        # 14 suppresses 10; 52 (window 5) and 45 (window 20) overlap at 45's scale
+        np.testing.assert_array_equal(suppress_overlapping_peaks(peaks, heights, windows), [14, 30, 52])
+        np.testing.assert_array_equal(suppress_overlapping_peaks(peaks, heights, windows, 2), [14, 52])
+
+    @pytest.mark.parametrize("method", CHANGEPOINT_METHODS)
+    def test_max_changepoints(self, method):
+        candidates = detect_changepoints(shifted_trajectory(seed=4), method=method,
+                                         window_sizes=(5, 10, 20), max_changepoints=1)
+        assert len(candidates) == 1
+
+    @pytest.mark.parametrize("method", CHANGEPOINT_METHODS)
+    def test_significant_transitions(self, method):
+        coordinates = shifted_trajectory(seed=5)
+        dates = weekly_dates(len(coordinates))
+        # Shuffled input is sorted by date before detection
+        order = np.random.default_rng(0).permutation(len(coordinates))
+        transitions = LegalMemespace().detect_phase_transitions(
+            coordinates[order], dates.iloc[order].reset_index(drop=True), method=method,
+            window_sizes=(5, 10, 20), n_permutations=199
+        )
+        detected = pd.to_datetime([t.date for t in transitions])
+        assert len(transitions) == 2
+        for found, expected in zip(detected, dates.iloc[[100, 200]]):
+            assert abs((found - expected).days) <= 21
+        assert all(t.statistical_significance <= 0.05 for t in transitions)
+
+    @pytest.mark.parametrize("method", CHANGEPOINT_METHODS)
+    def test_no_transitions_in_noise(self, method):
+        coordinates = np.random.default_rng(6).normal(0.0, 0.4, (300, 4))
+        transitions = LegalMemespace().detect_phase_transitions(
+            coordinates, weekly_dates(len(coordinates)), method=method,
+            window_sizes=(5, 10, 20), n_permutations=199
+        )
+        assert transitions == []
+
+
+def blob_coordinates(n_cases=600, n_centres=4, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.uniform(0.0, 1.0, (n_centres, 4))
+    return centres[rng.integers(n_centres, size=n_cases)] + rng.normal(0.0, 0.04, (n_cases, 4))
+
+
+class TestClustering:
+    """Cluster-count sweep across processes and silhouette subsampling."""
+
+    @pytest.mark.parametrize("algorithm", ['kmeans', 'minibatch'])
+    def test_n_jobs_gives_same_clustering(self, algorithm):
+        coordinates = blob_coordinates()
+        serial_labels, serial_info = LegalMemespace().cluster_doctrinal_space(
+            coordinates, n_jobs=1, algorithm=algorithm, silhouette_sample_size=200)
+        parallel_labels, parallel_info = LegalMemespace().cluster_doctrinal_space(
+            coordinates, n_jobs=2, algorithm=algorithm, silhouette_sample_size=200)
+
+        assert parallel_info['n_clusters'] == serial_info['n_clusters']
+        np.testing.assert_array_equal(parallel_labels, serial_labels)
+        assert parallel_info['silhouette_score'] == serial_info['silhouette_score']
+        assert parallel_info['cluster_sizes'] == serial_info['cluster_sizes']
+
+    def test_finds_blob_count(self):
+        _, info = LegalMemespace().cluster_doctrinal_space(blob_coordinates(), silhouette_sample_size=None)
+        assert info['n_clusters'] == 4
+        assert info['silhouette_sample_size'] == 600
+
+    def test_silhouette_subsample_is_deterministic(self):
+        coordinates = blob_coordinates(seed=1)
+        runs = [LegalMemespace(random_state=7).cluster_doctrinal_space(coordinates, silhouette_sample_size=150)
+                for _ in range(2)]
+        np.testing.assert_array_equal(runs[0][0], runs[1][0])
+        assert runs[0][1] == runs[1][1]
+        assert runs[0][1]['silhouette_sample_size'] == 150
+
+    def test_silhouette_subsample_follows_random_state(self):
+        coordinates = blob_coordinates(seed=2)
+        scores = {LegalMemespace(random_state=seed).cluster_doctrinal_space(
+                      coordinates, n_clusters=4, silhouette_sample_size=50)[1]['silhouette_score']
+                  for seed in (1, 2, 3)}
+        # Different seeds draw different subsamples
+        assert len(scores) > 1
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            LegalMemespace().cluster_doctrinal_space(blob_coordinates(), algorithm='dbscan')
+
+
+def random_community(n_doctrines, seed):
+    rng = np.random.default_rng(seed)
+    alpha = rng.uniform(0.0, 1.6, (n_doctrines, n_doctrines))
+    np.fill_diagonal(alpha, 1.0)
+    return alpha, rng.uniform(0.2, 1.5, n_doctrines), rng.uniform(50.0, 150.0, n_doctrines)
+
+
+def brute_force_equilibria(alpha, r, K, tol=1e-10):
+    """Solve every support one at a time; {support: populations} for feasible ones."""
+    n = len(r)
+    feasible = {}
+    for size in range(1, n + 1):
+        for support in combinations(range(n), size):
+            index = list(support)
+            try:
+                solution = np.linalg.solve(alpha[np.ix_(index, index)], K[index])
+            except np.linalg.LinAlgError:
+                continue
+            if np.all(solution > tol):
+                populations = np.zeros(n)
+                populations[index] = solution
+                feasible[support] = populations
+    return feasible
+
+
+class TestEquilibria:
+    """Exhaustive support enumeration and the heuristic fallback."""
+
+    @pytest.mark.parametrize("n_doctrines", [3, 4, 5, 6, 7])
+    def test_enumeration_matches_brute_force(self, n_doctrines):
+        for seed in range(40):
+            alpha, r, K = random_community(n_doctrines, seed)
+            analyzer = EquilibriumAnalyzer(alpha, r, K)
+            expected = brute_force_equilibria(alpha, r, K)
+            found = {tuple(eq.support): eq for eq in analyzer.enumerate_equilibria()}
+
+            assert analyzer.is_exhaustive()
+            assert set(found) == set(expected)
+            for support, equilibrium in found.items():
+                np.testing.assert_allclose(equilibrium.populations, expected[support], rtol=1e-8)
+                np.testing.assert_allclose(equilibrium.invasion_rates, analyzer.invasion_rates(expected[support]),
+                                           rtol=1e-8, atol=1e-10)
+
+    def test_stability_matches_jacobian(self):
+        alpha, r, K = random_community(5, seed=3)
+        system = LotkaVolterraSystem(r, K, alpha)
+        for equilibrium in EquilibriumAnalyzer(alpha, r, K).enumerate_equilibria():
+            eigenvalues = np.linalg.eigvals(system.jacobian(equilibrium.populations))
+            assert equilibrium.max_eigenvalue == pytest.approx(np.max(eigenvalues.real), abs=1e-8)
+
+    def test_max_support_size(self):
+        alpha, r, K = random_community(6, seed=1)
+        expected = {support for support in brute_force_equilibria(alpha, r, K) if len(support) <= 2}
+        analyzer = EquilibriumAnalyzer(alpha, r, K)
+        assert analyzer.support_count(2) == 6 + 15
+        assert {tuple(eq.support) for eq in analyzer.enumerate_equilibria(max_support_size=2)} == expected
+
+    def test_heuristic_fallback_is_marked_incomplete(self):
+        alpha, r, K = random_community(6, seed=2)
+        expected = brute_force_equilibria(alpha, r, K)
+        analyzer = EquilibriumAnalyzer(alpha, r, K)
+        assert not analyzer.is_exhaustive(max_supports=62)
+        heuristic = {tuple(eq.support) for eq in analyzer.enumerate_equilibria(max_supports=62)}
+        assert heuristic <= set(expected)
+
+        memespace = LegalMemespace()
+        exhaustive = memespace.analyze_competitive_equilibrium(alpha, r, K, enumerate_supports=True)
+        limited = memespace.analyze_competitive_equilibrium(alpha, r, K, enumerate_supports=True,
+                                                            max_supports=62)
+        assert exhaustive['complete'] is True
+        assert limited['complete'] is False
+        assert {tuple(eq['support']) for eq in exhaustive['feasible_equilibria']} == set(expected)
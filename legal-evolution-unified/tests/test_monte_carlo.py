@@ -0,0 +1,213 @@
+"""
+Unit tests for the Monte Carlo runner
+Author: Ignacio Adrián Lerer
+"""
+
+import dataclasses
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation_module.monte_carlo import MonteCarloRunner
+
+
+def _runner(**kwargs):
+    """Runner with a small, fast 'test' scenario in its library"""
+    kwargs.setdefault('random_seed', 42)
+    kwargs.setdefault('verbose', False)
+    runner = MonteCarloRunner(**kwargs)
+    library = runner.scenario_library
+    library.scenarios['test'] = dataclasses.replace(
+        library.get_scenario('baseline'), name='test', n_workers=30, n_timesteps=40,
+        reform_proposal_interval=5, crisis_probability=0.2
+    )
+    return runner
+
+
+def _summary(results):
+    return {
+        'n_converged': results.n_converged,
+        'mean_reform_success_rate': results.mean_reform_success_rate,
+        'mean_final_cli': results.mean_final_cli,
+        'std_final_cli': results.std_final_cli,
+        'mean_final_mfd': results.mean_final_mfd,
+        'final_cli_values': results.final_cli_values,
+        'mean_cli_trajectory': results.mean_cli_trajectory,
+        'std_mfd_trajectory': results.std_mfd_trajectory,
+    }
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """Serial, task-dispatched run of the test scenario"""
+    return _runner(n_iterations=12, n_jobs=1, dispatch='task').run_scenario('test')
+
+
+class TestDispatch:
+    """Task and chunked dispatch agree for any worker count."""
+
+    @pytest.mark.parametrize("dispatch,n_jobs,chunk_size", [
+        ('task', 2, None),
+        ('chunked', 1, None),
+        ('chunked', 2, None),
+        ('chunked', 2, 5),
+    ])
+    def test_identical_summaries(self, reference, dispatch, n_jobs, chunk_size):
+        results = _runner(n_iterations=12, n_jobs=n_jobs, dispatch=dispatch,
+                          chunk_size=chunk_size).run_scenario('test')
+        assert _summary(results) == _summary(reference)
+
+    def test_chunked_trajectories_match_task(self, reference):
+        runner = _runner(n_iterations=12, n_jobs=2, dispatch='chunked', chunk_size=5)
+        results = runner.run_scenario('test')
+        for chunked, task in zip(results.all_results, reference.all_results):
+            assert chunked['iteration'] == task['iteration']
+            np.testing.assert_array_equal(chunked['cli_trajectory'], task['cli_trajectory'])
+            np.testing.assert_array_equal(chunked['mfd_trajectory'], task['mfd_trajectory'])
+
+    def test_unknown_dispatch(self):
+        with pytest.raises(ValueError):
+            MonteCarloRunner(dispatch='threads')
+
+
+class TestRunAdaptive:
+    """Sequential waves stop at the CI target and are reproducible."""
+
+    def _run(self, precision, **kwargs):
+        runner = _runner(n_iterations=60, n_jobs=1)
+        return runner.run_adaptive('test', precision=precision, min_iterations=10, wave_size=10, **kwargs)
+
+    def test_stops_when_target_reached(self):
+        target = {'final_cli': 0.01}
+        results = self._run(target)
+        history = results.convergence_history
+
+        assert results.precision_reached
+        assert 10 < results.n_iterations < 60
+        assert history[-1]['n_iterations'] == results.n_iterations
+        assert history[-1]['ci_half_width_final_cli'] <= 0.01
+        # Every earlier wave was still above target
+        assert all(h['ci_half_width_final_cli'] > 0.01 for h in history[:-1])
+
+    def test_loose_target_stops_at_min_iterations(self):
+        results = self._run(10.0)
+        assert results.precision_reached
+        assert results.n_iterations == 10
+        assert len(results.convergence_history) == 1
+
+    def test_budget_exhausted(self):
+        results = self._run(1e-9, max_iterations=25)
+        assert not results.precision_reached
+        assert results.n_iterations == 25
+        assert [h['n_iterations'] for h in results.convergence_history] == [10, 20, 25]
+
+    def test_reproducible_and_prefix_of_fixed_run(self):
+        first = self._run({'final_cli': 0.01})
+        second = self._run({'final_cli': 0.01})
+        assert _summary(first) == _summary(second)
+        assert first.convergence_history == second.convergence_history
+
+        fixed = _runner(n_jobs=1).run_scenario('test', n_iterations=first.n_iterations)
+        assert _summary(first) == _summary(fixed)
+
+    def test_unknown_metric(self):
+        with pytest.raises(ValueError):
+            self._run({'final_gdp': 0.1})
+
+
+class TestSensitivityGrid:
+    """Sensitivity designs, parameter ranges and checkpoint/resume."""
+
+    PARAMETERS = {
+        'initial_cli': (0.2, 0.8),
+        'union_militancy_min': (2, 8),
+        'union_militancy_max': (2, 8),
+    }
+
+    @pytest.mark.parametrize("design", ['lhs', 'sobol'])
+    def test_sampled_designs(self, design):
+        points = _runner()._sensitivity_design(self.PARAMETERS, design, n_points=16)
+        assert len(points) == 16
+        for point in points:
+            assert 0.2 <= point['initial_cli'] <= 0.8
+            assert point['union_militancy_min'] == int(point['union_militancy_min'])
+            assert 2 <= point['union_militancy_min'] <= point['union_militancy_max'] <= 8
+        assert len({p['initial_cli'] for p in points}) == 16
+
+    def test_factorial_design(self):
+        points = _runner()._sensitivity_design(
+            {'initial_cli': np.array([0.3, 0.6]), 'crisis_probability': [0.05, 0.1, 0.2]}, 'factorial', None
+        )
+        assert len(points) == 6
+        assert points[0] == {'initial_cli': 0.3, 'crisis_probability': 0.05}
+        assert all(type(v) is float for point in points for v in point.values())
+
+    def test_design_errors(self):
+        runner = _runner()
+        with pytest.raises(ValueError):
+            runner._sensitivity_design(self.PARAMETERS, 'grid', 4)
+        with pytest.raises(ValueError):
+            runner._sensitivity_design(self.PARAMETERS, 'lhs', None)
+        with pytest.raises(ValueError):
+            runner._sensitivity_design({'initial_cli': (0.1, 0.5, 0.9)}, 'sobol', 4)
+
+    @pytest.mark.parametrize("parameter,value,expected", [
+        ('union_militancy_min', 9, (9, 9)),
+        ('union_militancy_max', 2, (2, 2)),
+        ('union_militancy_min', 5, (5, 7)),
+        ('employer_coordination_min', 8, (8, 8)),
+        ('employer_coordination_max', np.int64(3), (3, 3)),
+    ])
+    def test_ranges_never_invert(self, parameter, value, expected):
+        runner = _runner()
+        scenario = runner._modify_scenario_parameter(
+            runner.scenario_library.get_scenario('baseline'), parameter, value
+        )
+        ranges = {'union': scenario.union_militancy_range, 'employer': scenario.employer_coordination_range}
+        assert ranges[parameter.split('_')[0]] == expected
+
+    @pytest.mark.parametrize("design,n_points", [('factorial', None), ('lhs', 4), ('sobol', 4)])
+    def test_each_design_runs(self, design, n_points):
+        parameters = ({'union_militancy_min': np.array([3, 6]), 'union_militancy_max': np.array([4, 8])}
+                      if design == 'factorial' else self.PARAMETERS)
+        grid = _runner(n_jobs=1).sensitivity_grid('test', parameters, design=design, n_points=n_points,
+                                                  n_iterations_per_point=3)
+        assert grid['n_points'] == 4 and grid['n_restored'] == 0
+        assert all(r['n_converged'] == 3 for r in grid['results'])
+
+    def test_checkpoint_resume(self, tmp_path):
+        # NumPy values in the parameters must not break the JSON header
+        parameters = {'initial_cli': np.array([0.3, 0.5, 0.7]), 'union_militancy_max': np.array([4, 8])}
+        path = tmp_path / "grid.jsonl"
+
+        full = _runner(n_jobs=2).sensitivity_grid('test', parameters, n_iterations_per_point=4,
+                                                  checkpoint_path=str(path))
+        lines = path.read_text(encoding='utf-8').split("\n")
+        assert len(lines) == 1 + 6 + 1  # header, one line per point, trailing newline
+
+        # Interrupted run: two complete points and one truncated line
+        path.write_text("\n".join(lines[:3]) + "\n" + lines[3][:20], encoding='utf-8')
+        resumed = _runner(n_jobs=1).sensitivity_grid('test', parameters, n_iterations_per_point=4,
+                                                     checkpoint_path=str(path))
+        assert resumed['n_restored'] == 2
+        assert resumed['results'] == full['results']
+
+        # Fully checkpointed: nothing left to run
+        again = _runner(n_jobs=1).sensitivity_grid('test', parameters, n_iterations_per_point=4,
+                                                   checkpoint_path=str(path))
+        assert again['n_restored'] == 6
+        assert again['results'] == full['results']
+
+    def test_checkpoint_for_other_design_rejected(self, tmp_path):
+        path = tmp_path / "grid.jsonl"
+        runner = _runner(n_jobs=1)
+        runner.sensitivity_grid('test', {'initial_cli': [0.3]}, n_iterations_per_point=2,
+                                checkpoint_path=str(path))
+        with pytest.raises(ValueError):
+            runner.sensitivity_grid('test', {'initial_cli': [0.4]}, n_iterations_per_point=2,
+                                    checkpoint_path=str(path))
@@ -0,0 +1,233 @@
+"""
+Unit tests for RootFinder module
+Author: Ignacio Adrián Lerer
+"""
+
+import sys
+import os
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.rootfinder import RootFinder
+from tools.rootfinder.cache import GenealogyCache
+from tools.rootfinder.network import CompiledCitationNetwork, extract_doctrinal_elements, popcount
+
+COURT_LEVELS = ['Supreme Court', 'Appeals Court', 'Federal Court', 'Lower Court', 'Tribunal']
+ELEMENTS = [f'principle_{k}' for k in range(12)]
+HIERARCHY = {'Supreme Court': 1.0, 'Appeals Court': 0.8, 'Federal Court': 0.7,
+             'Provincial Supreme': 0.6, 'Lower Court': 0.5}
+
+
+def build_network(n_cases=60, n_citations=240, seed=0):
+    """Random citation graph with weights, court levels, dates and doctrinal elements"""
+    rng = np.random.default_rng(seed)
+    graph = nx.DiGraph()
+    for k in range(n_cases):
+        attrs = {'court_level': COURT_LEVELS[rng.integers(len(COURT_LEVELS))]}
+        if rng.random() < 0.9:
+            attrs['date'] = str(pd.Timestamp('1950-01-01') + pd.Timedelta(days=int(rng.integers(0, 25000))))
+        if rng.random() < 0.8:
+            attrs['doctrinal_elements'] = list(rng.choice(ELEMENTS, size=rng.integers(1, 6), replace=False))
+        else:
+            attrs['emergency_power'] = bool(rng.random() < 0.5)
+        graph.add_node(f'case_{k}', **attrs)
+    while graph.number_of_edges() < n_citations:
+        citing, cited = rng.choice(n_cases, size=2, replace=False)
+        graph.add_edge(f'case_{citing}', f'case_{cited}', weight=float(rng.uniform(0.0, 1.0)))
+    return graph
+
+
+def reference_genealogy(finder, target, graph, max_depth=10, include_weak_paths=False):
+    """Per-pair networkx implementation of the ABAN walk, for comparison"""
+    def strength(case, ancestor):
+        return graph.get_edge_data(case, ancestor, {}).get('weight', 1.0)
+
+    def precedential_weight(case):
+        if len(graph) < 2:
+            return 0.0
+        weight = min(graph.in_degree(case, weight='weight') / (len(graph) - 1), 1.0)
+        return weight * HIERARCHY.get(graph.nodes[case].get('court_level', 'Lower Court'), 0.5)
+
+    def distance(case1, case2):
+        e1 = extract_doctrinal_elements(graph.nodes[case1])
+        e2 = extract_doctrinal_elements(graph.nodes[case2])
+        if not e1 and not e2:
+            return 0.0
+        if not e1 or not e2:
+            return 1.0
+        return 1.0 - len(e1 & e2) / len(e1 | e2)
+
+    def proximity(case1, case2):
+        d1, d2 = graph.nodes[case1].get('date'), graph.nodes[case2].get('date')
+        if not d1 or not d2:
+            return 0.5
+        return min(np.exp(-0.1 * abs((pd.to_datetime(d1) - pd.to_datetime(d2)).days / 365.25)), 1.0)
+
+    lineage, current, visited = [], target, set()
+    while len(lineage) < max_depth and current not in visited:
+        visited.add(current)
+        ancestors = list(graph.predecessors(current))
+        if not include_weak_paths:
+            ancestors = [a for a in ancestors if strength(current, a) >= finder.min_citation_strength]
+        if not ancestors:
+            break
+        scores = [0.4 * strength(current, a) + 0.3 * precedential_weight(a)
+                  + 0.2 * (1.0 - distance(current, a)) + 0.1 * proximity(current, a) for a in ancestors]
+        parent = ancestors[int(np.argmax(scores))]
+        child_elements = extract_doctrinal_elements(graph.nodes[current])
+        parent_elements = extract_doctrinal_elements(graph.nodes[parent])
+        lineage.append({
+            'case_id': parent,
+            'generation': len(lineage),
+            'inherited_elements': sorted(child_elements & parent_elements),
+            'mutations': sorted(child_elements - parent_elements),
+            'citation_strength': strength(current, parent),
+            'doctrinal_distance': distance(current, parent),
+            'precedential_weight': precedential_weight(parent),
+        })
+        current = parent
+    return lineage
+
+
+def as_comparable(genealogy):
+    return [{
+        'case_id': node.case_id,
+        'generation': node.generation,
+        'inherited_elements': sorted(node.inherited_elements),
+        'mutations': sorted(node.mutations),
+        'citation_strength': node.citation_strength,
+        'doctrinal_distance': node.doctrinal_distance,
+        'precedential_weight': node.precedential_weight,
+    } for node in genealogy]
+
+
+def assert_same_lineage(actual, expected):
+    assert [n['case_id'] for n in actual] == [n['case_id'] for n in expected]
+    for a, e in zip(actual, expected):
+        for key in ('generation', 'inherited_elements', 'mutations'):
+            assert a[key] == e[key]
+        for key in ('citation_strength', 'doctrinal_distance', 'precedential_weight'):
+            assert a[key] == pytest.approx(e[key], rel=1e-12, abs=1e-12)
+
+
+class TestCompiledNetwork:
+    """Bitset helpers and compiled tables."""
+
+    @pytest.mark.parametrize("bits", [0, 1, 0b1011, (1 << 200) | (1 << 64) | 7])
+    def test_popcount(self, bits):
+        assert popcount(bits) == sum(1 for k in range(bits.bit_length()) if bits >> k & 1)
+
+    def test_element_counts(self):
+        graph = build_network(seed=3)
+        network = CompiledCitationNetwork(graph)
+        expected = [len(extract_doctrinal_elements(graph.nodes[case])) for case in network.case_ids]
+        np.testing.assert_array_equal(network.element_counts, expected)
+
+
+class TestGenealogy:
+    """Lineage tracing, one target at a time and in batches."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("include_weak_paths", [False, True])
+    def test_lineages_match_reference(self, seed, include_weak_paths):
+        graph = build_network(seed=seed)
+        finder = RootFinder(min_citation_strength=0.3)
+        for case in list(graph.nodes)[::3]:
+            actual = finder.trace_genealogy(case, graph, max_depth=8, include_weak_paths=include_weak_paths)
+            expected = reference_genealogy(finder, case, graph, 8, include_weak_paths)
+            assert_same_lineage(as_comparable(actual), expected)
+
+    @pytest.mark.parametrize("max_depth", [1, 4, 10])
+    def test_trace_genealogies_matches_trace_genealogy(self, max_depth):
+        graph = build_network(seed=5)
+        cases = list(graph.nodes)
+        batched = RootFinder().trace_genealogies(cases, graph, max_depth=max_depth)
+
+        single = RootFinder()
+        assert list(batched) == cases
+        for case in cases:
+            assert as_comparable(batched[case]) == as_comparable(single.trace_genealogy(case, graph, max_depth))
+
+    def test_unknown_case(self):
+        with pytest.raises(nx.NetworkXError):
+            RootFinder().trace_genealogy('missing', build_network())
+
+
+class TestGenealogyCache:
+    """LRU bookkeeping and freshness of cached lineages."""
+
+    def test_lru_eviction_and_stats(self):
+        cache = GenealogyCache(max_size=2)
+        a, b, c = (('a', 10, False, 0), []), (('b', 10, False, 0), []), (('c', 10, False, 0), [])
+        cache.put(*a)
+        cache.put(*b)
+        assert cache.get(a[0]) == []          # a becomes most recently used
+        cache.put(*c)                         # evicts b
+
+        assert a[0] in cache and c[0] in cache and b[0] not in cache
+        assert cache.get(b[0]) is None
+        assert cache.get_stats() == {'size': 2, 'max_size': 2, 'hits': 1, 'misses': 1,
+                                     'hit_rate': 0.5, 'evictions': 1, 'invalidations': 0}
+
+    def test_disabled_and_invalid_size(self):
+        cache = GenealogyCache(max_size=0)
+        cache.put(('a', 10, False, 0), [])
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            GenealogyCache(max_size=-1)
+
+    def test_trace_genealogy_hits_cache(self):
+        graph = build_network(seed=1)
+        finder = RootFinder(cache_size=4)
+        cases = list(graph.nodes)[:6]
+        for case in cases:
+            finder.trace_genealogy(case, graph)
+        assert finder.trace_genealogy(cases[-1], graph) is finder.trace_genealogy(cases[-1], graph)
+
+        stats = finder.genealogy_cache.get_stats()
+        assert stats['size'] == 4
+        assert stats['evictions'] == 2
+        assert stats['hits'] == 2 and stats['misses'] == 6
+
+    def test_invalidate_by_visited_case(self):
+        graph = build_network(seed=2)
+        finder = RootFinder()
+        lineages = finder.trace_genealogies(list(graph.nodes), graph)
+        version = finder.compile_network(graph).version
+        target = next(case for case, lineage in lineages.items() if lineage)
+        ancestor = lineages[target][0].case_id
+
+        dropped = finder.genealogy_cache.invalidate([ancestor], version)
+        assert dropped == sum(1 for case, lineage in lineages.items()
+                              if case == ancestor or ancestor in {node.case_id for node in lineage})
+        assert (target, 10, False, version) not in finder.genealogy_cache
+
+    @pytest.mark.parametrize("new_cases", [False, True])
+    def test_add_citations_serves_fresh_lineages(self, new_cases):
+        graph = build_network(n_cases=50, n_citations=150, seed=7)
+        rng = np.random.default_rng(11)
+        finder = RootFinder(min_citation_strength=0.2)
+        cases = list(graph.nodes)
+        finder.trace_genealogies(cases, graph)
+
+        for _ in range(5):
+            citations = []
+            for _ in range(8):
+                citing, cited = rng.choice(len(cases), size=2, replace=False)
+                citations.append((cases[citing], cases[cited], {'weight': float(rng.uniform(0.0, 1.0))}))
+            if new_cases:
+                citations.append((f'new_{graph.number_of_nodes()}', cases[0], {'weight': 0.9}))
+            finder.add_citations(graph, citations)
+
+            fresh = RootFinder(min_citation_strength=0.2)
+            served = finder.trace_genealogies(cases, graph)
+            for case in cases:
+                assert as_comparable(served[case]) == as_comparable(fresh.trace_genealogy(case, graph))
+        # New cases rescale every precedential weight, so nothing survives them
+        assert (finder.genealogy_cache.hits == 0) == new_cases
@@ -8,10 +8,21 @@ Author: Ignacio Adrián Lerer
 License: MIT
 """
 
-from .jurisrank import JurisRank
+from .jurisrank import JurisRank, citation_matrix_from_edges
+from .weighting import (WeightingPipeline, CitationWeight, TemporalDecayWeight,
+                        CourtHierarchyWeight, DoctrinalClusteringWeight, DoctrinalIndex)
 
 __version__ = "1.0.0"
 __author__ = "Ignacio Adrián Lerer"
 __email__ = "adrian@lerer.com.ar"
 
-__all__ = ['JurisRank']
\ No newline at end of file
+__all__ = [
+    'JurisRank',
+    'citation_matrix_from_edges',
+    'WeightingPipeline',
+    'CitationWeight',
+    'TemporalDecayWeight',
+    'CourtHierarchyWeight',
+    'DoctrinalClusteringWeight',
+    'DoctrinalIndex'
+]
\ No newline at end of file
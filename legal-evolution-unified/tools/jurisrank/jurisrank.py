@@ -7,16 +7,93 @@ Author: Ignacio Adrián Lerer
 import numpy as np
 import pandas as pd
 import networkx as nx
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union, Any
+from dataclasses import dataclass
+from multiprocessing import Pool, cpu_count
 import warnings
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, issparse, diags, identity, tril, triu
+from scipy.sparse.linalg import spsolve_triangular
 from sklearn.preprocessing import normalize
 import logging
 
+from .weighting import (WeightingPipeline, TemporalDecayWeight, CourtHierarchyWeight,
+                        DoctrinalClusteringWeight)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Citation input accepted by JurisRank: dense N x N array or scipy sparse matrix
+CitationInput = Union[np.ndarray, csr_matrix]
+
+# Stationary-distribution solvers for JurisRank
+SOLVERS = ('power', 'gauss_seidel', 'aitken', 'quadratic')
+
+
+def citation_matrix_from_edges(edges, n_cases: int,
+                               weights: Optional[np.ndarray] = None) -> csr_matrix:
+    """
+    Build a sparse citation matrix from an edge list.
+    
+    Parameters:
+    -----------
+    edges : array-like
+        E x 2 array of (citing_index, cited_index) pairs
+    n_cases : int
+        Number of cases (matrix dimension)
+    weights : np.ndarray, optional
+        Citation weights per edge (default: 1.0). Duplicate edges are summed.
+        
+    Returns:
+    --------
+    csr_matrix
+        N x N matrix where element [i,j] represents citation from case i to case j
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if weights is None:
+        weights = np.ones(len(edges))
+    return csr_matrix((np.asarray(weights, dtype=float), (edges[:, 0], edges[:, 1])),
+                      shape=(n_cases, n_cases))
+
+
+# Per-process state for parallel temporal-window ranking
+_window_ranker: Optional['JurisRank'] = None
+_window_matrix: Optional[csr_matrix] = None
+_window_warm_start = True
+
+
+def _init_window_worker(ranker: 'JurisRank', weighted_matrix: csr_matrix, warm_start: bool):
+    """Pool initializer: receive the ranker and date-sorted weighted matrix once per process."""
+    global _window_ranker, _window_matrix, _window_warm_start
+    _window_ranker = ranker
+    _window_matrix = weighted_matrix
+    _window_warm_start = warm_start
+
+
+def _rank_window_chunk(bounds: List[Tuple[int, int]]) -> List[np.ndarray]:
+    """Rank a run of consecutive windows in a worker process."""
+    return _window_ranker._rank_windows(_window_matrix, bounds, _window_warm_start)
+
+
+@dataclass
+class _RankingState:
+    """
+    Ranking kept between calculate_jurisrank and update_jurisrank calls.
+    
+    Scores and residual are scaled by the number of cases N (scores sum to
+    N), so the teleport term is source_scale * (1 - d) per case regardless
+    of N. The normalized scores do not depend on source_scale.
+    """
+    metadata: pd.DataFrame
+    pipeline: WeightingPipeline
+    prepared: List[Any]
+    weighted_matrix: csr_matrix
+    out_weight: np.ndarray
+    scores: np.ndarray
+    residual: Optional[np.ndarray] = None
+    source_scale: float = 1.0
+
+
 class JurisRank:
     """
     Calculates memetic fitness scores for legal doctrines through citation network analysis.
@@ -28,7 +105,9 @@ class JurisRank:
     """
     
     def __init__(self, damping_factor: float = 0.85, max_iterations: int = 100, 
-                 convergence_threshold: float = 0.0001, temporal_decay: float = 0.05):
+                 convergence_threshold: float = 0.0001, temporal_decay: float = 0.05,
+                 weighting: Optional[WeightingPipeline] = None, solver: str = 'power',
+                 history_interval: int = 1, extrapolation_interval: int = 10):
         """
         Initialize JurisRank calculator.
         
@@ -42,25 +121,58 @@ class JurisRank:
             Threshold for convergence detection (default: 0.0001)
         temporal_decay : float
             Annual decay rate for temporal weighting (default: 0.05)
+        weighting : WeightingPipeline, optional
+            Citation weighting stages (default: temporal decay, court
+            hierarchy and doctrinal clustering)
+        solver : str
+            'power' iteration, 'gauss_seidel' sweeps, or power iteration
+            with periodic 'aitken' (delta-squared) or 'quadratic'
+            extrapolation (default: 'power')
+        history_interval : int
+            Record the score vector in fitness_history every k iterations;
+            0 disables history recording (default: 1)
+        extrapolation_interval : int
+            Iterations between extrapolation steps for 'aitken'/'quadratic'
+            (default: 10)
         """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}'. Choose from {SOLVERS}")
+        
         self.damping_factor = damping_factor
         self.max_iterations = max_iterations
         self.convergence_threshold = convergence_threshold
         self.temporal_decay = temporal_decay
+        self.weighting = weighting
+        self.solver = solver
+        self.history_interval = history_interval
+        self.extrapolation_interval = extrapolation_interval
         self.fitness_history = []
-        
-    def calculate_jurisrank(self, citation_matrix: np.ndarray, 
-                           case_metadata: pd.DataFrame) -> Dict[str, float]:
+        self.iterations_run = 0
+        self.update_error_bound = None
+        self._ranking_state: Optional[_RankingState] = None
+        
+    def calculate_jurisrank(self, citation_matrix: CitationInput, 
+                           case_metadata: pd.DataFrame,
+                           initial_scores: Optional[Union[np.ndarray, Dict[str, float]]] = None
+                           ) -> Dict[str, float]:
         """
         Calculate fitness scores for legal doctrines.
         
+        The citation graph is processed as a sparse CSR matrix end-to-end, so
+        only stored citations are weighted and dangling cases are handled
+        without materializing dense rows.
+        
         Parameters:
         -----------
-        citation_matrix : np.ndarray
+        citation_matrix : np.ndarray or scipy.sparse matrix
             N x N matrix where element [i,j] represents citation from case i to case j
+            (see citation_matrix_from_edges for edge lists)
         case_metadata : pd.DataFrame
             Metadata including case names, dates, and court levels
             Required columns: 'case_id', 'date', 'court_level'
+        initial_scores : np.ndarray or Dict[str, float], optional
+            Warm start, e.g. the scores of a previous run. A dict is matched
+            by case ID; cases missing from it start at 1/N (default: uniform)
             
         Returns:
         --------
@@ -71,43 +183,305 @@ class JurisRank:
         
         # Validate inputs
         self._validate_inputs(citation_matrix, case_metadata)
+        citation_matrix = self._as_csr(citation_matrix)
+        
+        n_cases = citation_matrix.shape[0]
+        
+        # Initialize with equal fitness (or warm start)
+        fitness_scores = self._initial_scores(initial_scores, case_metadata, n_cases)
+        
+        # Apply temporal, hierarchical and doctrinal clustering weights
+        pipeline = self.get_weighting_pipeline()
+        logger.info(f"Applying weights: {', '.join(stage.name for stage in pipeline.stages)}...")
+        prepared = pipeline.prepare(case_metadata)
+        weighted_matrix = pipeline.apply(citation_matrix, prepared=prepared)
+        
+        # Normalize to create transition matrix (dangling rows stay empty)
+        transition_matrix = self._normalize_matrix(weighted_matrix)
+        
+        logger.info(f"Running {self.solver} solver...")
+        fitness_scores = self._solve(transition_matrix, fitness_scores)
+        
+        # Keep the weighted graph so update_jurisrank can refine incrementally
+        self._ranking_state = _RankingState(
+            metadata=case_metadata.reset_index(drop=True),
+            pipeline=pipeline,
+            prepared=prepared,
+            weighted_matrix=weighted_matrix,
+            out_weight=np.asarray(weighted_matrix.sum(axis=1)).ravel(),
+            scores=fitness_scores * n_cases
+        )
+        self.update_error_bound = None
+        
+        # Create result dictionary
+        results = {}
+        for idx, case_id in enumerate(case_metadata['case_id']):
+            results[case_id] = float(fitness_scores[idx])
+            
+        logger.info("JurisRank calculation completed.")
+        return results
+    
+    def update_jurisrank(self, new_cases: Optional[pd.DataFrame] = None,
+                         new_citations=None, tolerance: Optional[float] = None) -> Dict[str, float]:
+        """
+        Incrementally update the last ranking with newly ingested cases and citations.
         
-        n_cases = len(citation_matrix)
+        Only the new citations are weighted and only the transition rows of
+        citing cases that gained citations change. The ranking is then
+        refined by residual pushes (batched Gauss-Southwell): cases whose
+        residual is above average absorb it and pass d times it on to the
+        cases they cite, so work concentrates around the changed part of
+        the graph. Uniform residual (dangling mass, the change in N) only
+        rescales the teleport source, which normalization removes, so it is
+        absorbed without touching every case.
         
-        # Initialize with equal fitness
-        fitness_scores = np.ones(n_cases) / n_cases
+        Refinement stops once the L1 error versus the exact JurisRank of the
+        updated graph is provably below tolerance; the bound is stored in
+        self.update_error_bound.
+        
+        Parameters:
+        -----------
+        new_cases : pd.DataFrame, optional
+            Metadata of new cases, appended after the existing ones.
+            Required columns: 'case_id', 'date', 'court_level'
+        new_citations : array-like, optional
+            Iterable of (citing_case_id, cited_case_id) pairs; either case
+            may be new or existing. Repeated citations add up.
+        tolerance : float, optional
+            Maximum L1 error versus a full recompute (default: the error
+            bound of the ranking being updated, at least convergence_threshold)
+            
+        Returns:
+        --------
+        Dict[str, float]
+            Dictionary mapping case IDs (existing and new) to fitness scores
+        """
+        state = self._ranking_state
+        if state is None:
+            raise ValueError("No ranking to update. Run calculate_jurisrank first.")
+        d = self.damping_factor
+        
+        n_old = len(state.metadata)
+        if state.residual is None:
+            state.residual = self._residual(state)
+        if tolerance is None:
+            tolerance = max(self.convergence_threshold, self._error_bound(state))
+        
+        # Append new cases and their weighting features
+        if new_cases is not None and len(new_cases):
+            missing_columns = [col for col in ['case_id', 'date', 'court_level'] if col not in new_cases.columns]
+            if missing_columns:
+                raise ValueError(f"Missing required columns in new_cases: {missing_columns}")
+            duplicates = new_cases['case_id'].isin(state.metadata['case_id']) | new_cases['case_id'].duplicated()
+            if duplicates.any():
+                raise ValueError(f"new_cases contains case IDs already ranked or repeated: "
+                                 f"{new_cases['case_id'][duplicates].tolist()[:5]}")
+            metadata = pd.concat([state.metadata, new_cases], ignore_index=True)
+        else:
+            metadata = state.metadata
+        n_cases = len(metadata)
+        citing, cited = self._citation_indices(new_citations, metadata)
+        
+        if n_cases > n_old:
+            state.prepared = state.pipeline.extend(state.prepared, new_cases)
+            state.metadata = metadata
+        weights = state.pipeline.edge_weights(citing, cited, state.prepared)
+        
+        # Transition rows that change: existing cases citing in this batch
+        # (new cases start with zero score, so their rows spread nothing yet)
+        affected = np.unique(citing[citing < n_old])
+        old_rows = state.weighted_matrix[affected]
+        old_rows.resize((len(affected), n_cases))
+        old_out_weight = state.out_weight[affected]
+        old_dangling_mass = state.scores[state.out_weight == 0].sum()
+        
+        weighted_matrix = state.weighted_matrix
+        weighted_matrix.resize((n_cases, n_cases))
+        state.weighted_matrix = (weighted_matrix + csr_matrix((weights, (citing, cited)),
+                                                              shape=(n_cases, n_cases))).tocsr()
+        state.out_weight = np.concatenate([state.out_weight, np.zeros(n_cases - n_old)])
+        np.add.at(state.out_weight, citing, weights)
+        
+        scores = np.concatenate([state.scores, np.zeros(n_cases - n_old)])
+        new_dangling_mass = scores[state.out_weight == 0].sum()
+        
+        # New cases: teleport plus the old dangling share; the change of the
+        # dangling share (new N, cases that stopped dangling) is uniform
+        residual = np.concatenate([
+            state.residual,
+            np.full(n_cases - n_old, state.source_scale * (1 - d) + d * old_dangling_mass / n_old)
+        ])
+        self._absorb_uniform_residual(state, d * (new_dangling_mass / n_cases - old_dangling_mass / n_old))
+        
+        # Replace the affected cases' old transition rows with the new ones
+        residual -= d * self._spread(old_rows, old_out_weight, scores[affected])
+        residual += d * self._spread(state.weighted_matrix[affected], state.out_weight[affected],
+                                     scores[affected])
+        
+        # Batched residual pushes until the error bound meets tolerance
+        dangling = state.out_weight == 0
+        target_mass = tolerance * (1 - d) * state.source_scale * n_cases / 2
+        rounds = 0
+        residual_mass = np.abs(residual).sum()
+        while residual_mass > target_mass and rounds < self.max_iterations:
+            push = np.flatnonzero(np.abs(residual) >= residual_mass / n_cases)
+            pushed = residual[push]
+            scores[push] += pushed
+            residual[push] = 0.0
+            if 8 * len(push) > n_cases:
+                # Large fronts: one sparse product instead of slicing rows
+                pushed_mass = np.zeros(n_cases)
+                pushed_mass[push] = pushed
+                residual += d * self._spread(state.weighted_matrix, state.out_weight, pushed_mass)
+            else:
+                residual += d * self._spread(state.weighted_matrix[push], state.out_weight[push], pushed)
+            self._absorb_uniform_residual(state, d * pushed[dangling[push]].sum() / n_cases)
+            target_mass = tolerance * (1 - d) * state.source_scale * n_cases / 2
+            residual_mass = np.abs(residual).sum()
+            rounds += 1
+        
+        if residual_mass > target_mass:
+            logger.warning(f"Update did not reach tolerance after {rounds} push rounds")
+        else:
+            logger.info(f"Update converged after {rounds} push rounds")
+        
+        state.scores = scores
+        state.residual = residual
+        self.iterations_run = rounds
+        self.update_error_bound = self._error_bound(state)
+        
+        fitness_scores = scores / scores.sum()
+        return dict(zip(state.metadata['case_id'].tolist(), fitness_scores.tolist()))
+    
+    def _residual(self, state: _RankingState) -> np.ndarray:
+        """Residual s * (1 - d) + d * (P^T y + dangling mass / N) - y of the scaled scores."""
+        d = self.damping_factor
+        n_cases = len(state.scores)
+        dangling_mass = state.scores[state.out_weight == 0].sum()
+        return (state.source_scale * (1 - d) + d * dangling_mass / n_cases - state.scores
+                + d * self._spread(state.weighted_matrix, state.out_weight, state.scores))
+    
+    def _absorb_uniform_residual(self, state: _RankingState, uniform: float):
+        """
+        Fold a residual added equally to every case into the teleport source.
+        
+        The solution is proportional to the source scale s, so lowering s
+        by uniform / (1 - d) cancels the uniform residual exactly.
+        """
+        state.source_scale -= uniform / (1 - self.damping_factor)
+    
+    def _error_bound(self, state: _RankingState) -> float:
+        """
+        L1 error bound of the normalized scores versus the exact ranking.
+        
+        ||y - y*||_1 <= ||r||_1 / (1 - d) with y* summing to s * N;
+        normalizing y at most doubles the error.
+        """
+        n_cases = len(state.scores)
+        return 2 * np.abs(state.residual).sum() / ((1 - self.damping_factor) * state.source_scale * n_cases)
+    
+    @staticmethod
+    def _spread(rows: csr_matrix, out_weight: np.ndarray, mass: np.ndarray) -> np.ndarray:
+        """Mass of each row sent along its normalized citations (dangling rows send nothing)."""
+        scale = np.divide(mass, out_weight, out=np.zeros_like(mass, dtype=float), where=out_weight > 0)
+        return rows.T.dot(scale)
+    
+    @staticmethod
+    def _citation_indices(citations, metadata: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Map (citing_case_id, cited_case_id) pairs to row indices of metadata."""
+        if citations is None:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        pairs = np.asarray(list(citations), dtype=object).reshape(-1, 2)
+        positions = pd.Index(metadata['case_id']).get_indexer(pairs.ravel()).reshape(-1, 2)
+        if (positions < 0).any():
+            unknown = sorted({str(case_id) for case_id in pairs[positions < 0]})
+            raise ValueError(f"Citations reference unknown case IDs: {unknown[:5]}")
+        return positions[:, 0].astype(np.int64), positions[:, 1].astype(np.int64)
+    
+    def _initial_scores(self, initial_scores: Optional[Union[np.ndarray, Dict[str, float]]],
+                        metadata: pd.DataFrame, n_cases: int) -> np.ndarray:
+        """Starting probability vector: uniform, or a normalized warm start."""
+        if initial_scores is None:
+            return np.ones(n_cases) / n_cases
+        
+        if isinstance(initial_scores, dict):
+            scores = metadata['case_id'].map(initial_scores).fillna(1.0 / n_cases).to_numpy(dtype=float)
+        else:
+            scores = np.asarray(initial_scores, dtype=float)
+            if scores.shape != (n_cases,):
+                raise ValueError(f"initial_scores must have length {n_cases}, got shape {scores.shape}")
         
-        # Apply temporal normalization
-        logger.info("Applying temporal weights...")
-        temporal_matrix = self._apply_temporal_weights(citation_matrix, case_metadata)
+        scores = np.clip(scores, 0.0, None)
+        total = scores.sum()
+        return scores / total if total > 0 else np.ones(n_cases) / n_cases
+    
+    def _solve(self, transition_matrix: csr_matrix, fitness_scores: np.ndarray) -> np.ndarray:
+        """
+        Compute the stationary JurisRank vector.
         
-        # Apply hierarchical weights
-        logger.info("Applying hierarchical weights...")
-        hierarchical_matrix = self._apply_hierarchical_weights(temporal_matrix, case_metadata)
+        Solves x = d * (P^T x + (dangling . x) / N) + (1 - d) / N with the
+        configured solver, starting from fitness_scores. Dangling cases
+        (empty rows of P) spread their score uniformly. Convergence is the
+        L1 change between iterates falling below convergence_threshold.
         
-        # Apply doctrinal clustering weights
-        logger.info("Applying doctrinal clustering...")
-        clustered_matrix = self._apply_doctrinal_clustering(hierarchical_matrix, case_metadata)
+        Parameters:
+        -----------
+        transition_matrix : csr_matrix
+            Row-stochastic transition matrix P (dangling rows empty)
+        fitness_scores : np.ndarray
+            Starting probability vector
+            
+        Returns:
+        --------
+        np.ndarray
+            Fitness scores (sums to 1)
+        """
+        n_cases = transition_matrix.shape[0]
+        d = self.damping_factor
+        dangling_nodes = np.diff(transition_matrix.indptr) == 0
+        transition_transpose = transition_matrix.T.tocsr()
+        
+        if self.solver == 'gauss_seidel':
+            # Sweep in the direction that makes most citations implicit:
+            # (I - d * T) x_new = d * R x_old + rest, T triangular, R the remainder
+            lower = tril(transition_transpose, format='csr')
+            upper = triu(transition_transpose, format='csr')
+            sweep_forward = lower.nnz >= upper.nnz
+            triangular = lower if sweep_forward else upper
+            triangular_system = (identity(n_cases, format='csr') - d * triangular).tocsr()
+            remainder = (transition_transpose - triangular).tocsr()
         
-        # Normalize to create transition matrix
-        transition_matrix = self._normalize_matrix(clustered_matrix)
+        self.fitness_history = []
+        recent_scores = [fitness_scores]
         
-        # Power iteration with convergence tracking
-        logger.info("Running power iteration...")
         for iteration in range(self.max_iterations):
-            previous_scores = fitness_scores.copy()
+            previous_scores = fitness_scores
             
-            # PageRank calculation with damping
-            fitness_scores = (
-                (1 - self.damping_factor) / n_cases + 
-                self.damping_factor * transition_matrix.T.dot(fitness_scores)
-            )
+            # Teleport plus uniformly spread dangling mass
+            dangling_mass = fitness_scores[dangling_nodes].sum()
+            constant_term = (1 - d) / n_cases + d * dangling_mass / n_cases
+            
+            if self.solver == 'gauss_seidel':
+                fitness_scores = spsolve_triangular(
+                    triangular_system, d * remainder.dot(fitness_scores) + constant_term,
+                    lower=sweep_forward
+                )
+            else:
+                # PageRank calculation with damping
+                fitness_scores = d * transition_transpose.dot(fitness_scores) + constant_term
             
             # Normalize to maintain probability distribution
             fitness_scores /= fitness_scores.sum()
             
+            if self.solver in ('aitken', 'quadratic'):
+                recent_scores = (recent_scores + [fitness_scores])[-4:]
+                if (iteration + 1) % self.extrapolation_interval == 0:
+                    fitness_scores = self._extrapolate(recent_scores)
+                    recent_scores = [fitness_scores]
+            
             # Store history
-            self.fitness_history.append(fitness_scores.copy())
+            if self.history_interval and (iteration + 1) % self.history_interval == 0:
+                self.fitness_history.append(fitness_scores.copy())
             
             # Check convergence
             convergence_diff = np.abs(fitness_scores - previous_scores).sum()
@@ -116,18 +490,49 @@ class JurisRank:
                 break
         else:
             logger.warning(f"Did not converge after {self.max_iterations} iterations")
-            
-        # Create result dictionary
-        results = {}
-        for idx, case_id in enumerate(case_metadata['case_id']):
-            results[case_id] = float(fitness_scores[idx])
-            
-        logger.info("JurisRank calculation completed.")
-        return results
+        
+        self.iterations_run = iteration + 1 if self.max_iterations > 0 else 0
+        return fitness_scores
+    
+    def _extrapolate(self, recent_scores: List[np.ndarray]) -> np.ndarray:
+        """
+        Extrapolate the limit of the iterates: Aitken delta-squared on the
+        dominant error mode, or quadratic extrapolation (Kamvar et al. 2003).
+        
+        Falls back to the latest iterate if there are too few iterates or
+        the extrapolated vector is not a valid distribution.
+        """
+        latest = recent_scores[-1]
+        
+        if self.solver == 'aitken' and len(recent_scores) >= 3:
+            x0, x1, x2 = recent_scores[-3:]
+            step, previous_step = x2 - x1, x1 - x0
+            # Contraction ratio of the dominant error mode
+            ratio = step.dot(previous_step) / max(previous_step.dot(previous_step), 1e-300)
+            if not 0 < ratio < 1:
+                return latest
+            extrapolated = x2 + step * ratio / (1 - ratio)
+        elif self.solver == 'quadratic' and len(recent_scores) >= 4:
+            x0, x1, x2, x3 = recent_scores[-4:]
+            y = np.column_stack([x1 - x0, x2 - x0])
+            gamma, *_ = np.linalg.lstsq(y, -(x3 - x0), rcond=None)
+            gamma1, gamma2, gamma3 = gamma[0], gamma[1], 1.0
+            beta0 = gamma1 + gamma2 + gamma3
+            beta1 = gamma2 + gamma3
+            beta2 = gamma3
+            extrapolated = beta0 * x1 + beta1 * x2 + beta2 * x3
+        else:
+            return latest
+        
+        extrapolated = np.clip(extrapolated, 0.0, None)
+        total = extrapolated.sum()
+        if not np.isfinite(total) or total <= 0:
+            return latest
+        return extrapolated / total
     
-    def _validate_inputs(self, citation_matrix: np.ndarray, metadata: pd.DataFrame):
+    def _validate_inputs(self, citation_matrix: CitationInput, metadata: pd.DataFrame):
         """Validate input data."""
-        if citation_matrix.shape[0] != citation_matrix.shape[1]:
+        if citation_matrix.ndim != 2 or citation_matrix.shape[0] != citation_matrix.shape[1]:
             raise ValueError("Citation matrix must be square")
         
         if len(metadata) != citation_matrix.shape[0]:
@@ -138,110 +543,89 @@ class JurisRank:
         if missing_columns:
             raise ValueError(f"Missing required columns in metadata: {missing_columns}")
     
-    def _apply_temporal_weights(self, matrix: np.ndarray, 
-                                metadata: pd.DataFrame) -> np.ndarray:
+    @staticmethod
+    def _as_csr(matrix: CitationInput) -> csr_matrix:
+        """Convert a citation matrix to float CSR (copying, so callers' data is untouched)."""
+        if issparse(matrix):
+            result = matrix.tocsr().astype(float)
+        else:
+            result = csr_matrix(np.asarray(matrix, dtype=float))
+        if result is matrix:
+            result = result.copy()
+        result.sum_duplicates()
+        result.eliminate_zeros()
+        return result
+    
+    @staticmethod
+    def _like_input(result: csr_matrix, matrix: CitationInput) -> CitationInput:
+        """Return result in the representation (dense or sparse) of the input matrix."""
+        return result if issparse(matrix) else result.toarray()
+    
+    def get_weighting_pipeline(self) -> WeightingPipeline:
+        """
+        Weighting pipeline used by calculate_jurisrank.
+        
+        Returns the pipeline passed at construction, or the default
+        temporal/hierarchical/clustering pipeline for self.temporal_decay.
+        """
+        if self.weighting is not None:
+            return self.weighting
+        return WeightingPipeline.default(self.temporal_decay)
+    
+    def _apply_weight(self, stage, matrix: CitationInput,
+                      metadata: pd.DataFrame) -> CitationInput:
+        """Apply a single weighting stage, preserving the input representation."""
+        weighted_matrix = WeightingPipeline([stage]).apply(self._as_csr(matrix), metadata)
+        return self._like_input(weighted_matrix, matrix)
+    
+    def _apply_temporal_weights(self, matrix: CitationInput, 
+                                metadata: pd.DataFrame) -> CitationInput:
         """
         Apply temporal decay to citations.
         
         More recent citations receive higher weights using exponential decay.
         """
-        weighted_matrix = matrix.copy().astype(float)
-        dates = pd.to_datetime(metadata['date'])
-        
-        for i in range(len(matrix)):
-            for j in range(len(matrix)):
-                if matrix[i][j] > 0:
-                    # Calculate years between cases
-                    delta_years = (dates.iloc[i] - dates.iloc[j]).days / 365.25
-                    
-                    # Apply exponential decay (only for backward citations)
-                    if delta_years > 0:  # Citing case is newer than cited case
-                        temporal_weight = np.exp(-self.temporal_decay * delta_years)
-                        weighted_matrix[i][j] *= temporal_weight
-                    else:
-                        # Future citations shouldn't exist, but if they do, heavily penalize
-                        weighted_matrix[i][j] *= 0.01
-                        
-        return weighted_matrix
+        return self._apply_weight(TemporalDecayWeight(self.temporal_decay), matrix, metadata)
     
-    def _apply_hierarchical_weights(self, matrix: np.ndarray, 
-                                    metadata: pd.DataFrame) -> np.ndarray:
+    def _apply_hierarchical_weights(self, matrix: CitationInput, 
+                                    metadata: pd.DataFrame) -> CitationInput:
         """
         Apply court hierarchy weights.
         
         Citations from higher courts receive more weight.
         """
-        hierarchy_weights = {
-            'Supreme Court': 1.0,
-            'Appeals Court': 0.7,
-            'Federal Court': 0.6,
-            'Provincial Supreme': 0.5,
-            'Lower Court': 0.4,
-            'Administrative': 0.3
-        }
-        
-        weighted_matrix = matrix.copy()
-        for i in range(len(matrix)):
-            court_level = metadata.iloc[i]['court_level']
-            weight = hierarchy_weights.get(court_level, 0.5)
-            weighted_matrix[i, :] *= weight
-            
-        return weighted_matrix
+        return self._apply_weight(CourtHierarchyWeight(), matrix, metadata)
     
-    def _apply_doctrinal_clustering(self, matrix: np.ndarray,
-                                   metadata: pd.DataFrame) -> np.ndarray:
+    def _apply_doctrinal_clustering(self, matrix: CitationInput,
+                                   metadata: pd.DataFrame) -> CitationInput:
         """
         Apply doctrinal clustering weights.
         
         Cases with similar doctrinal elements amplify each other's citations.
         """
-        weighted_matrix = matrix.copy()
-        
-        # Check if doctrinal similarity data is available
-        if 'doctrinal_elements' not in metadata.columns:
-            logger.warning("No doctrinal elements found, skipping clustering weights")
-            return weighted_matrix
-        
-        # Calculate doctrinal similarity matrix
-        n_cases = len(metadata)
-        similarity_matrix = np.zeros((n_cases, n_cases))
-        
-        for i in range(n_cases):
-            for j in range(n_cases):
-                if i != j:
-                    elements_i = set(metadata.iloc[i].get('doctrinal_elements', []))
-                    elements_j = set(metadata.iloc[j].get('doctrinal_elements', []))
-                    
-                    if elements_i and elements_j:
-                        # Jaccard similarity
-                        intersection = len(elements_i & elements_j)
-                        union = len(elements_i | elements_j)
-                        similarity_matrix[i][j] = intersection / union if union > 0 else 0
-        
-        # Apply clustering boost
-        clustering_boost = 1.0 + 0.5 * similarity_matrix  # Up to 50% boost for identical doctrines
-        weighted_matrix *= clustering_boost
-        
-        return weighted_matrix
+        return self._apply_weight(DoctrinalClusteringWeight(), matrix, metadata)
     
-    def _normalize_matrix(self, matrix: np.ndarray) -> np.ndarray:
+    def _normalize_matrix(self, matrix: CitationInput) -> CitationInput:
         """
         Normalize matrix to create stochastic transition matrix.
         
-        Each row sums to 1, representing transition probabilities.
+        Each row with citations sums to 1, representing transition
+        probabilities. Dangling rows (cases with no outgoing citations) are
+        left empty; the power iteration redistributes their probability
+        uniformly instead of storing dense 1/N rows.
         """
-        row_sums = matrix.sum(axis=1)
+        normalized = self._as_csr(matrix)
+        row_sums = np.asarray(normalized.sum(axis=1)).ravel()
         
         # Handle dangling nodes (cases with no outgoing citations)
         dangling_nodes = row_sums == 0
         if dangling_nodes.any():
             logger.info(f"Found {dangling_nodes.sum()} dangling nodes (cases with no citations)")
-            # Distribute dangling node probability uniformly
-            matrix[dangling_nodes, :] = 1.0 / matrix.shape[1]
-            row_sums = matrix.sum(axis=1)
         
         # Normalize rows
-        return matrix / row_sums[:, np.newaxis]
+        inverse_sums = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=~dangling_nodes)
+        normalized = diags(inverse_sums).dot(normalized).tocsr()
+        return self._like_input(normalized, matrix)
     
     def get_fitness_evolution(self) -> np.ndarray:
         """
@@ -321,48 +705,122 @@ class JurisRank:
         sorted_cases = sorted(fitness_scores.items(), key=lambda x: x[1], reverse=True)
         return sorted_cases[:top_k]
     
-    def calculate_temporal_evolution(self, citation_matrix: np.ndarray,
+    def calculate_temporal_evolution(self, citation_matrix: CitationInput,
                                    case_metadata: pd.DataFrame,
-                                   time_windows: List[Tuple[str, str]]) -> Dict[str, Dict[str, float]]:
+                                   time_windows: List[Tuple[str, str]],
+                                   warm_start: bool = True,
+                                   n_jobs: int = 1) -> Dict[str, Dict[str, float]]:
         """
         Calculate fitness evolution across different time periods.
         
+        Citation weights depend only on the two cases of each citation, so
+        the full graph is weighted once and its cases sorted by date once;
+        each window is then a contiguous block of the sorted matrix. Each
+        window is normalized on its own and, with warm_start, starts from
+        the previous window's ranks (cases entering the window get 1/N).
+        
         Parameters:
         -----------
-        citation_matrix : np.ndarray
+        citation_matrix : np.ndarray or scipy.sparse matrix
             Full citation matrix
         case_metadata : pd.DataFrame
             Case metadata with dates
         time_windows : List[Tuple[str, str]]
             List of (start_date, end_date) tuples defining time periods
+        warm_start : bool
+            Start each window from the previous window's ranks (default: True)
+        n_jobs : int
+            Parallel processes (-1 = all CPUs). Windows are split into
+            consecutive runs, warm-started within each run (default: 1)
             
         Returns:
         --------
         Dict[str, Dict[str, float]]
             Nested dict: {period_name: {case_id: fitness_score}}
         """
-        temporal_fitness = {}
-        dates = pd.to_datetime(case_metadata['date'])
-        
+        self._validate_inputs(citation_matrix, case_metadata)
+        citation_matrix = self._as_csr(citation_matrix)
+        
+        # Weight once, then sort cases by date once
+        pipeline = self.get_weighting_pipeline()
+        weighted_matrix = pipeline.apply(citation_matrix, case_metadata)
+        dates = pd.to_datetime(case_metadata['date']).to_numpy(dtype='datetime64[ns]')
+        order = np.argsort(dates, kind='stable')
+        sorted_dates = dates[order]
+        sorted_matrix = weighted_matrix[order][:, order].tocsr()
+        
+        # Each window is a contiguous date range of the sorted cases
+        periods = []
         for i, (start_date, end_date) in enumerate(time_windows):
-            period_name = f"Period_{i+1}_{start_date}_{end_date}"
-            
-            # Filter cases within time window
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            
-            mask = (dates >= start_dt) & (dates <= end_dt)
-            period_indices = mask[mask].index.tolist()
-            
-            if not period_indices:
-                continue
+            start = np.searchsorted(sorted_dates, pd.to_datetime(start_date).to_datetime64(), side='left')
+            end = np.searchsorted(sorted_dates, pd.to_datetime(end_date).to_datetime64(), side='right')
+            if end > start:
+                periods.append((f"Period_{i+1}_{start_date}_{end_date}", (int(start), int(end))))
+        
+        bounds = [window for _, window in periods]
+        n_jobs = cpu_count() if n_jobs == -1 else n_jobs
+        if n_jobs > 1 and len(bounds) > 1:
+            chunk_size = -(-len(bounds) // n_jobs)
+            chunks = [bounds[i:i + chunk_size] for i in range(0, len(bounds), chunk_size)]
+            with Pool(min(n_jobs, len(chunks)), initializer=_init_window_worker,
+                      initargs=(self._window_worker_copy(), sorted_matrix, warm_start)) as pool:
+                window_scores = [scores for chunk in pool.map(_rank_window_chunk, chunks) for scores in chunk]
+        else:
+            window_scores = self._rank_windows(sorted_matrix, bounds, warm_start)
+        
+        case_ids = case_metadata['case_id'].to_numpy()
+        temporal_fitness = {}
+        for (period_name, (start, end)), scores in zip(periods, window_scores):
+            # Report cases in their original order
+            positions = np.argsort(order[start:end], kind='stable')
+            temporal_fitness[period_name] = dict(zip(case_ids[order[start:end][positions]].tolist(),
+                                                     scores[positions].tolist()))
             
-            # Extract submatrix for this period
-            period_matrix = citation_matrix[np.ix_(period_indices, period_indices)]
-            period_metadata = case_metadata.iloc[period_indices].reset_index(drop=True)
+        return temporal_fitness
+    
+    def _rank_windows(self, sorted_matrix: csr_matrix, bounds: List[Tuple[int, int]],
+                      warm_start: bool = True) -> List[np.ndarray]:
+        """
+        Rank consecutive windows of the date-sorted weighted matrix.
+        
+        Parameters:
+        -----------
+        sorted_matrix : csr_matrix
+            Weighted citation matrix with cases sorted by date
+        bounds : List[Tuple[int, int]]
+            (start, end) row ranges of the windows
+        warm_start : bool
+            Start each window from the previous window's ranks
             
-            # Calculate fitness for this period
-            period_fitness = self.calculate_jurisrank(period_matrix, period_metadata)
-            temporal_fitness[period_name] = period_fitness
+        Returns:
+        --------
+        List[np.ndarray]
+            Fitness scores of each window, in sorted-case order
+        """
+        window_scores = []
+        previous_start = previous_end = 0
+        previous_scores = np.array([])
+        for start, end in bounds:
+            n_cases = end - start
+            initial = np.ones(n_cases) / n_cases
+            overlap_start, overlap_end = max(start, previous_start), min(end, previous_end)
+            if warm_start and overlap_end > overlap_start:
+                # Rescale to the new window size so carried-over and entering cases are comparable
+                initial[overlap_start - start:overlap_end - start] = (
+                    previous_scores[overlap_start - previous_start:overlap_end - previous_start]
+                    * len(previous_scores) / n_cases
+                )
+                initial /= initial.sum()
             
-        return temporal_fitness
\ No newline at end of file
+            transition_matrix = self._normalize_matrix(sorted_matrix[start:end, start:end])
+            previous_scores = self._solve(transition_matrix, initial)
+            previous_start, previous_end = start, end
+            window_scores.append(previous_scores)
+        return window_scores
+    
+    def _window_worker_copy(self) -> 'JurisRank':
+        """Solver settings only, without weighting or ranking state, for worker processes."""
+        return JurisRank(damping_factor=self.damping_factor, max_iterations=self.max_iterations,
+                         convergence_threshold=self.convergence_threshold,
+                         temporal_decay=self.temporal_decay, solver=self.solver,
+                         history_interval=0, extrapolation_interval=self.extrapolation_interval)
@@ -0,0 +1,402 @@
+"""
+JurisRank Weighting Pipeline
+Composable per-citation weights applied to the nonzero entries of a sparse citation matrix
+Author: Ignacio Adrián Lerer
+"""
+
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Any
+from scipy.sparse import csr_matrix, issparse, vstack
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Citation weight by court level of the citing case
+DEFAULT_HIERARCHY_WEIGHTS = {
+    'Supreme Court': 1.0,
+    'Appeals Court': 0.7,
+    'Federal Court': 0.6,
+    'Provincial Supreme': 0.5,
+    'Lower Court': 0.4,
+    'Administrative': 0.3
+}
+
+_NANOSECONDS_PER_DAY = 86_400 * 10**9
+
+# Similarity methods for DoctrinalClusteringWeight
+SIMILARITY_METHODS = ('exact', 'minhash')
+
+# Mersenne prime for MinHash universal hashing
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+class CitationWeight(ABC):
+    """
+    Abstract base class for a weighting stage.
+
+    A stage turns case metadata into per-case features once (`prepare`)
+    and then maps (citing, cited) index arrays to one weight per citation
+    (`edge_weights`). Stages never see the matrix itself, so the same
+    prepared features can weight a full graph, a window subgraph or a
+    batch of newly ingested citations.
+    """
+
+    name = 'weight'
+
+    @abstractmethod
+    def prepare(self, metadata: pd.DataFrame) -> Any:
+        """Precompute per-case features from metadata."""
+        pass
+
+    @abstractmethod
+    def edge_weights(self, citing: np.ndarray, cited: np.ndarray, features: Any) -> np.ndarray:
+        """Weight for each citation citing[k] -> cited[k]."""
+        pass
+
+    def extend(self, features: Any, new_metadata: pd.DataFrame) -> Any:
+        """Features for the prepared cases followed by newly added cases."""
+        return np.concatenate([features, self.prepare(new_metadata)])
+
+
+class TemporalDecayWeight(CitationWeight):
+    """
+    Exponential decay with the age gap between citing and cited case.
+
+    Backward citations are weighted exp(-decay * years); citations to
+    later (or same-day) cases are penalized with `future_penalty`.
+    """
+
+    name = 'temporal'
+
+    def __init__(self, decay: float = 0.05, future_penalty: float = 0.01):
+        self.decay = decay
+        self.future_penalty = future_penalty
+
+    def prepare(self, metadata: pd.DataFrame) -> np.ndarray:
+        """Date of each case as int64 nanoseconds since the epoch."""
+        return pd.to_datetime(metadata['date']).to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+    def edge_weights(self, citing: np.ndarray, cited: np.ndarray, features: np.ndarray) -> np.ndarray:
+        # Whole days between cases (floor, as Timedelta.days), then years
+        delta_years = ((features[citing] - features[cited]) // _NANOSECONDS_PER_DAY) / 365.25
+        backward = delta_years > 0
+        return np.where(backward, np.exp(-self.decay * np.where(backward, delta_years, 0.0)),
+                        self.future_penalty)
+
+
+class CourtHierarchyWeight(CitationWeight):
+    """Citations from higher courts receive more weight (by citing court level)."""
+
+    name = 'hierarchy'
+
+    def __init__(self, hierarchy_weights: Optional[Dict[str, float]] = None,
+                 default_weight: float = 0.5):
+        self.hierarchy_weights = dict(DEFAULT_HIERARCHY_WEIGHTS if hierarchy_weights is None
+                                      else hierarchy_weights)
+        self.default_weight = default_weight
+
+    def prepare(self, metadata: pd.DataFrame) -> np.ndarray:
+        """Court weight of each case."""
+        return (metadata['court_level'].map(self.hierarchy_weights)
+                .fillna(self.default_weight).to_numpy(dtype=float))
+
+    def edge_weights(self, citing: np.ndarray, cited: np.ndarray, features: np.ndarray) -> np.ndarray:
+        return features[citing]
+
+
+class DoctrinalIndex:
+    """
+    Inverted index of doctrinal elements.
+
+    Stores a sparse binary case x element incidence matrix; its CSC form
+    is the element -> cases posting list. Pairwise Jaccard similarity is
+    evaluated only for requested case pairs, from the number of shared
+    elements, so no N x N similarity matrix is ever built. Optional MinHash
+    signatures give constant-cost approximate similarities for corpora
+    with many elements per case.
+    """
+
+    def __init__(self, element_lists: Sequence, num_perm: int = 0, seed: int = 0):
+        """
+        Build the index.
+
+        Parameters:
+        -----------
+        element_lists : sequence
+            Doctrinal elements of each case (list/set; anything else counts as empty)
+        num_perm : int
+            Number of MinHash permutations to precompute (0 = exact only)
+        seed : int
+            Seed for the MinHash hash functions
+        """
+        self.num_perm = num_perm
+        self.seed = seed
+        self.elements: List[Any] = []
+        self._element_columns: Dict[Any, int] = {}
+        self.incidence = csr_matrix((0, 0))
+        self.signatures = np.empty((0, num_perm), dtype=np.uint64) if num_perm else None
+        self.extend(element_lists)
+
+    def extend(self, element_lists: Sequence):
+        """
+        Append cases to the index.
+
+        Unseen elements get new columns, so extending an index gives the
+        same incidence (and MinHash signatures) as building it from the
+        concatenated element lists. Only signatures of the new cases are
+        computed.
+        """
+        vocabulary = self._element_columns
+        indptr = [0]
+        indices: List[int] = []
+        for elements in element_lists:
+            if isinstance(elements, (list, tuple, set, frozenset, np.ndarray)):
+                indices.extend(sorted({vocabulary.setdefault(e, len(vocabulary)) for e in elements}))
+            indptr.append(len(indices))
+
+        self.elements.extend(list(vocabulary)[len(self.elements):])
+        new_rows = csr_matrix(
+            (np.ones(len(indices)), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(vocabulary))
+        )
+        n_existing = self.incidence.shape[0]
+        existing = self.incidence
+        existing.resize((n_existing, len(vocabulary)))
+        self.incidence = vstack([existing, new_rows], format='csr')
+        self.sizes = np.diff(self.incidence.indptr)
+        self._postings = self.incidence.tocsc()
+        if self.signatures is not None:
+            self.signatures = np.vstack([
+                self.signatures, self._minhash_signatures(self.num_perm, self.seed, start=n_existing)
+            ])
+        return self
+
+    def __len__(self) -> int:
+        return self.incidence.shape[0]
+
+    def cases_with(self, element) -> np.ndarray:
+        """Indices of the cases that contain a doctrinal element."""
+        column = self._element_columns.get(element)
+        if column is None:
+            return np.array([], dtype=np.int64)
+        return self._postings.indices[self._postings.indptr[column]:self._postings.indptr[column + 1]]
+
+    def shared_counts(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Number of doctrinal elements shared by each pair rows[k], cols[k]."""
+        if len(rows) == 0 or not self.elements:
+            return np.zeros(len(rows))
+        return np.asarray(self.incidence[rows].multiply(self.incidence[cols]).sum(axis=1)).ravel()
+
+    def jaccard(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Exact Jaccard similarity for each pair (0 where either case has no elements)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        similarity = np.zeros(len(rows))
+        # Only pairs of nonempty cases can share an element
+        candidates = np.flatnonzero((self.sizes[rows] > 0) & (self.sizes[cols] > 0))
+        if len(candidates):
+            r, c = rows[candidates], cols[candidates]
+            shared = self.shared_counts(r, c)
+            similarity[candidates] = shared / (self.sizes[r] + self.sizes[c] - shared)
+        return similarity
+
+    def minhash_jaccard(self, rows: np.ndarray, cols: np.ndarray,
+                        lsh_bands: Optional[int] = None) -> np.ndarray:
+        """
+        MinHash estimate of Jaccard similarity for each pair.
+
+        With lsh_bands, signatures are split into that many bands and only
+        pairs agreeing on at least one full band (LSH candidates) get an
+        estimate; the rest are treated as dissimilar (0).
+        """
+        if self.signatures is None:
+            raise ValueError("Index was built without MinHash signatures (num_perm=0)")
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        similarity = np.zeros(len(rows))
+        candidates = (self.sizes[rows] > 0) & (self.sizes[cols] > 0)
+        if lsh_bands:
+            num_perm = self.signatures.shape[1]
+            if num_perm % lsh_bands:
+                raise ValueError(f"lsh_bands ({lsh_bands}) must divide num_perm ({num_perm})")
+            band_match = (self.signatures[rows] == self.signatures[cols]).reshape(
+                len(rows), lsh_bands, num_perm // lsh_bands).all(axis=2)
+            candidates &= band_match.any(axis=1)
+        candidates = np.flatnonzero(candidates)
+        if len(candidates):
+            similarity[candidates] = np.mean(
+                self.signatures[rows[candidates]] == self.signatures[cols[candidates]], axis=1)
+        return similarity
+
+    def _minhash_signatures(self, num_perm: int, seed: int, start: int = 0,
+                            block_size: int = 65536) -> np.ndarray:
+        """Case x permutation matrix of minimum element hashes for cases start.. (max uint64 if empty)."""
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, _MINHASH_PRIME, num_perm, dtype=np.uint64)
+        b = rng.integers(0, _MINHASH_PRIME, num_perm, dtype=np.uint64)
+        # Hash family h(x) = (a * x + b) mod p, with uint64 wraparound in a * x
+        element_hashes = (np.outer(np.arange(len(self.elements), dtype=np.uint64), a) + b) \
+            % np.uint64(_MINHASH_PRIME)
+
+        signatures = np.full((len(self) - start, num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+        indptr = self.incidence.indptr
+        # Blocks of cases bound the (elements x num_perm) hash buffer
+        for block_start in range(start, len(self), block_size):
+            rows = np.arange(block_start, min(block_start + block_size, len(self)))
+            rows = rows[self.sizes[rows] > 0]
+            if not len(rows):
+                continue
+            hashes = element_hashes[self.incidence.indices[indptr[rows[0]]:indptr[rows[-1] + 1]]]
+            signatures[rows - start] = np.minimum.reduceat(hashes, indptr[rows] - indptr[rows[0]], axis=0)
+        return signatures
+
+
+class DoctrinalClusteringWeight(CitationWeight):
+    """
+    Cases with similar doctrinal elements amplify each other's citations.
+
+    Each citation between cases with Jaccard similarity s is boosted by
+    (1 + max_boost * s); self-citations and cases without doctrinal
+    elements are left unchanged. Similarity is computed from a
+    DoctrinalIndex for citation edges only, either exactly or by MinHash.
+    """
+
+    name = 'clustering'
+
+    def __init__(self, max_boost: float = 0.5, column: str = 'doctrinal_elements',
+                 method: str = 'exact', num_perm: int = 128,
+                 lsh_bands: Optional[int] = None, seed: int = 0):
+        """
+        Parameters:
+        -----------
+        max_boost : float
+            Boost for identical doctrines (default: 0.5, i.e. up to 50%)
+        column : str
+            Metadata column with each case's doctrinal elements
+        method : str
+            'exact' Jaccard or 'minhash' approximation
+        num_perm : int
+            MinHash permutations (method='minhash')
+        lsh_bands : int, optional
+            LSH bands for candidate filtering (method='minhash')
+        seed : int
+            MinHash seed
+        """
+        if method not in SIMILARITY_METHODS:
+            raise ValueError(f"Unknown similarity method '{method}'. Choose from {SIMILARITY_METHODS}")
+        self.max_boost = max_boost
+        self.column = column
+        self.method = method
+        self.num_perm = num_perm
+        self.lsh_bands = lsh_bands
+        self.seed = seed
+
+    def prepare(self, metadata: pd.DataFrame) -> Optional[DoctrinalIndex]:
+        """Doctrinal inverted index of the cases (None if the column is missing)."""
+        if self.column not in metadata.columns:
+            logger.warning("No doctrinal elements found, skipping clustering weights")
+            return None
+        num_perm = self.num_perm if self.method == 'minhash' else 0
+        return DoctrinalIndex(metadata[self.column].tolist(), num_perm=num_perm, seed=self.seed)
+
+    def extend(self, features: Optional[DoctrinalIndex],
+               new_metadata: pd.DataFrame) -> Optional[DoctrinalIndex]:
+        """Add new cases to the index (clustering stays off if it was off)."""
+        if features is None:
+            return None
+        if self.column in new_metadata.columns:
+            return features.extend(new_metadata[self.column].tolist())
+        return features.extend([None] * len(new_metadata))
+
+    def edge_weights(self, citing: np.ndarray, cited: np.ndarray,
+                     features: Optional[DoctrinalIndex]) -> np.ndarray:
+        weights = np.ones(len(citing))
+        if features is None:
+            return weights
+        # Self-citations are not boosted
+        pairs = np.flatnonzero(citing != cited)
+        if self.method == 'minhash':
+            similarity = features.minhash_jaccard(citing[pairs], cited[pairs], self.lsh_bands)
+        else:
+            similarity = features.jaccard(citing[pairs], cited[pairs])
+        weights[pairs] += self.max_boost * similarity
+        return weights
+
+
+class WeightingPipeline:
+    """
+    Ordered composition of CitationWeight stages.
+
+    The pipeline multiplies the stored entries of a CSR citation matrix by
+    the product of every stage's edge weights, touching only the nonzero
+    citations.
+
+    Example:
+    --------
+    >>> pipeline = WeightingPipeline([TemporalDecayWeight(0.05), CourtHierarchyWeight()])
+    >>> prepared = pipeline.prepare(case_metadata)
+    >>> weighted = pipeline.apply(citation_matrix, prepared=prepared)
+    """
+
+    def __init__(self, stages: Sequence[CitationWeight]):
+        self.stages = list(stages)
+
+    @classmethod
+    def default(cls, temporal_decay: float = 0.05) -> 'WeightingPipeline':
+        """Temporal decay, court hierarchy and doctrinal clustering (JurisRank defaults)."""
+        return cls([
+            TemporalDecayWeight(temporal_decay),
+            CourtHierarchyWeight(),
+            DoctrinalClusteringWeight()
+        ])
+
+    def prepare(self, metadata: pd.DataFrame) -> List[Any]:
+        """Per-stage case features, reusable across apply/edge_weights calls."""
+        return [stage.prepare(metadata) for stage in self.stages]
+
+    def extend(self, prepared: List[Any], new_metadata: pd.DataFrame) -> List[Any]:
+        """Prepared features extended with newly added cases (appended in order)."""
+        return [stage.extend(features, new_metadata) for stage, features in zip(self.stages, prepared)]
+
+    def edge_weights(self, citing: np.ndarray, cited: np.ndarray,
+                     prepared: List[Any]) -> np.ndarray:
+        """Combined weight for each citation citing[k] -> cited[k]."""
+        citing = np.asarray(citing, dtype=np.int64)
+        cited = np.asarray(cited, dtype=np.int64)
+        weights = np.ones(len(citing))
+        for stage, features in zip(self.stages, prepared):
+            weights *= stage.edge_weights(citing, cited, features)
+        return weights
+
+    def apply(self, matrix: csr_matrix, metadata: Optional[pd.DataFrame] = None,
+              prepared: Optional[List[Any]] = None) -> csr_matrix:
+        """
+        Weight a citation matrix.
+
+        Parameters:
+        -----------
+        matrix : csr_matrix
+            N x N citation matrix (citing rows, cited columns)
+        metadata : pd.DataFrame, optional
+            Case metadata aligned with the matrix (needed unless prepared is given)
+        prepared : list, optional
+            Output of prepare() for the same cases
+
+        Returns:
+        --------
+        csr_matrix
+            New matrix with the same sparsity pattern and weighted entries
+        """
+        if prepared is None:
+            if metadata is None:
+                raise ValueError("Either metadata or prepared features are required")
+            prepared = self.prepare(metadata)
+
+        weighted = matrix.tocsr().astype(float) if issparse(matrix) else csr_matrix(np.asarray(matrix, dtype=float))
+        if weighted is matrix:
+            weighted = weighted.copy()
+        citing = np.repeat(np.arange(weighted.shape[0]), np.diff(weighted.indptr))
+        weighted.data *= self.edge_weights(citing, weighted.indices, prepared)
+        return weighted
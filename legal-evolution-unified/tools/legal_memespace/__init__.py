@@ -8,10 +8,20 @@ Author: Ignacio Adrián Lerer
 License: MIT
 """
 
-from .memespace import LegalMemespace
+from .memespace import LegalMemespace, LotkaVolterraSystem
+from .changepoint import CumulativeSums, detect_changepoints, CHANGEPOINT_METHODS
+from .equilibrium import EquilibriumAnalyzer, Equilibrium
 
 __version__ = "1.0.0"
 __author__ = "Ignacio Adrián Lerer"
 __email__ = "adrian@lerer.com.ar"
 
-__all__ = ['LegalMemespace']
\ No newline at end of file
+__all__ = [
+    'LegalMemespace',
+    'LotkaVolterraSystem',
+    'CumulativeSums',
+    'detect_changepoints',
+    'CHANGEPOINT_METHODS',
+    'EquilibriumAnalyzer',
+    'Equilibrium'
+]
\ No newline at end of file
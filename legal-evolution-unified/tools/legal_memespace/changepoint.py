@@ -0,0 +1,321 @@
+"""
+Legal-Memespace Change-Point Engine
+Multi-scale change-point detection over time-ordered doctrinal coordinates
+Author: Ignacio Adrián Lerer
+"""
+
+import heapq
+import numpy as np
+from scipy.signal import find_peaks
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Detection modes: sliding mean-shift windows, binary segmentation, PELT
+CHANGEPOINT_METHODS = ('window', 'binseg', 'pelt')
+
+# Upper bound on array elements materialized per permutation batch
+_PERMUTATION_BATCH_ELEMENTS = 1 << 22
+
+
+class CumulativeSums:
+    """
+    Prefix sums of a (n_points x n_dims) trajectory.
+
+    Any window mean or segment cost is two lookups into the prefix arrays,
+    so statistics for every window position and size cost O(n) in total.
+    Coordinates are centred first to limit cancellation in the costs.
+    """
+
+    def __init__(self, coordinates: np.ndarray):
+        coords = np.asarray(coordinates, dtype=float)
+        if coords.ndim == 1:
+            coords = coords[:, None]
+        self.n_points, self.n_dims = coords.shape
+        self.offset = coords.mean(axis=0) if self.n_points else np.zeros(self.n_dims)
+        centred = coords - self.offset
+        self.sums = np.vstack([np.zeros(self.n_dims), np.cumsum(centred, axis=0)])
+        self.squares = np.concatenate([[0.0], np.cumsum(np.einsum('ij,ij->i', centred, centred))])
+
+    def total(self, start, end) -> np.ndarray:
+        """Sum of the centred coordinates over [start, end)."""
+        return self.sums[end] - self.sums[start]
+
+    def mean(self, start, end) -> np.ndarray:
+        """Mean coordinates over [start, end); start/end may be arrays."""
+        length = np.asarray(end) - np.asarray(start)
+        return self.total(start, end) / length[..., None] + self.offset
+
+    def cost(self, start, end) -> np.ndarray:
+        """L2 segment cost: squared deviations from the segment mean over [start, end)."""
+        length = np.asarray(end) - np.asarray(start)
+        total = self.total(start, end)
+        return (self.squares[end] - self.squares[start]
+                - np.einsum('...j,...j->...', total, total) / length)
+
+    def split_gains(self, start: int, end: int, min_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Cost reduction of splitting [start, end) at every admissible index."""
+        splits = np.arange(start + min_size, end - min_size + 1)
+        if splits.size == 0:
+            return splits, np.empty(0)
+        gains = self.cost(start, end) - self.cost(start, splits) - self.cost(splits, end)
+        return splits, gains
+
+
+def mean_shift_profile(sums: CumulativeSums, window: int) -> np.ndarray:
+    """
+    Distance between the means of the `window` points before and after each index.
+
+    Entry i compares [i - window, i) with [i, i + window); positions without
+    two full windows are NaN.
+    """
+    profile = np.full(sums.n_points, np.nan)
+    positions = np.arange(window, sums.n_points - window)
+    if positions.size:
+        shift = (sums.total(positions, positions + window)
+                 - sums.total(positions - window, positions)) / window
+        profile[positions] = np.linalg.norm(shift, axis=1)
+    return profile
+
+
+def multiscale_profile(sums: CumulativeSums,
+                       window_sizes: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scale-normalized mean-shift profile across several window sizes.
+
+    A mean difference over windows of size w has standard error proportional
+    to sqrt(2 / w), so each profile is scaled by sqrt(w / 2) before taking the
+    maximum. Returns the combined profile and the window achieving it.
+    """
+    window_sizes = np.asarray(window_sizes, dtype=int)
+    profiles = np.vstack([mean_shift_profile(sums, w) * np.sqrt(w / 2.0) for w in window_sizes])
+    filled = np.where(np.isnan(profiles), -np.inf, profiles)
+    best = np.argmax(filled, axis=0)
+    combined = filled[best, np.arange(sums.n_points)]
+    return np.where(np.isfinite(combined), combined, np.nan), window_sizes[best]
+
+
+def suppress_overlapping_peaks(peaks: np.ndarray, heights: np.ndarray, windows: np.ndarray,
+                               max_peaks: Optional[int] = None) -> np.ndarray:
+    """
+    Greedy non-maximum suppression of profile peaks at their own scale.
+
+    Peaks are accepted from the highest down; a peak is dropped when an
+    accepted one lies within the larger of their two windows, so no
+    accepted peak's block [i - w, i + w) contains another accepted peak.
+    Returns the accepted peaks in index order.
+    """
+    accepted = []
+    for k in np.argsort(-heights, kind='stable'):
+        if max_peaks is not None and len(accepted) >= max_peaks:
+            break
+        if all(abs(peaks[k] - peaks[j]) >= max(windows[k], windows[j]) for j in accepted):
+            accepted.append(k)
+    return np.sort(peaks[accepted]).astype(int)
+
+
+def binary_segmentation(sums: CumulativeSums, penalty: float, min_size: int,
+                        max_changepoints: Optional[int] = None) -> List[int]:
+    """
+    Greedy binary segmentation: repeatedly split the segment with the largest
+    cost reduction while that reduction exceeds `penalty`.
+    """
+    changepoints = []
+    candidates = []
+
+    def push(start, end):
+        splits, gains = sums.split_gains(start, end, min_size)
+        if gains.size:
+            best = int(np.argmax(gains))
+            if gains[best] > penalty:
+                heapq.heappush(candidates, (-gains[best], start, end, int(splits[best])))
+
+    push(0, sums.n_points)
+    while candidates and (max_changepoints is None or len(changepoints) < max_changepoints):
+        _, start, end, split = heapq.heappop(candidates)
+        changepoints.append(split)
+        push(start, split)
+        push(split, end)
+
+    return sorted(changepoints)
+
+
+def pelt(sums: CumulativeSums, penalty: float, min_size: int) -> List[int]:
+    """
+    Exact penalized segmentation with PELT pruning (Killick et al., 2012).
+
+    Each step evaluates the surviving candidate starts in one vectorized
+    cost lookup; candidates that can no longer be optimal are pruned.
+    """
+    n = sums.n_points
+    best_cost = np.full(n + 1, np.inf)
+    best_cost[0] = -penalty
+    previous = np.zeros(n + 1, dtype=int)
+    admissible = np.empty(0, dtype=int)
+
+    for end in range(min_size, n + 1):
+        newest = end - min_size
+        if np.isfinite(best_cost[newest]):
+            admissible = np.append(admissible, newest)
+        if admissible.size == 0:
+            continue
+
+        totals = best_cost[admissible] + sums.cost(admissible, end)
+        best = int(np.argmin(totals))
+        best_cost[end] = totals[best] + penalty
+        previous[end] = admissible[best]
+        admissible = admissible[totals <= best_cost[end]]
+
+    changepoints = []
+    end = n
+    while end > 0 and np.isfinite(best_cost[end]):
+        end = previous[end]
+        if end > 0:
+            changepoints.append(int(end))
+    return changepoints[::-1]
+
+
+def default_penalty(coordinates: np.ndarray) -> float:
+    """
+    BIC-style penalty 2 * sigma^2 * log(n) per change point.
+
+    sigma^2 is the noise variance summed over dimensions, estimated from the
+    MAD of first differences so that level shifts do not inflate it.
+    """
+    coords = np.asarray(coordinates, dtype=float)
+    if coords.ndim == 1:
+        coords = coords[:, None]
+    n = len(coords)
+    if n < 3:
+        return np.inf
+
+    diffs = np.diff(coords, axis=0)
+    mad = np.median(np.abs(diffs - np.median(diffs, axis=0)), axis=0)
+    noise_variance = np.sum((1.4826 * mad) ** 2 / 2.0)
+    if noise_variance <= 0:
+        noise_variance = np.sum(np.var(coords, axis=0))
+    if noise_variance <= 0:
+        noise_variance = 1e-12
+    return 2.0 * noise_variance * np.log(n)
+
+
+def _max_split_gain(blocks: np.ndarray, splits: np.ndarray) -> np.ndarray:
+    """Largest split gain at `splits` for each block in a (batch x m x d) stack."""
+    length = blocks.shape[1]
+    prefix = np.cumsum(blocks, axis=1)
+    total = prefix[:, -1]
+    left = prefix[:, splits - 1]
+    right = total[:, None] - left
+    # Squared terms cancel: gain = |L|^2/s + |R|^2/(m-s) - |T|^2/m
+    gains = (np.einsum('bkj,bkj->bk', left, left) / splits
+             + np.einsum('bkj,bkj->bk', right, right) / (length - splits)
+             - np.einsum('bj,bj->b', total, total)[:, None] / length)
+    return gains.max(axis=1)
+
+
+def permutation_pvalue(block: np.ndarray, splits: np.ndarray, n_permutations: int,
+                       rng: np.random.Generator) -> float:
+    """
+    Permutation p-value for a mean shift inside `block`.
+
+    The statistic is the largest split gain over `splits` (indices into the
+    block), so scanning for the best split is accounted for. Permutations
+    are drawn and scored in batches of stacked arrays.
+    """
+    block = np.asarray(block, dtype=float)
+    block = block - block.mean(axis=0)
+    splits = np.asarray(splits, dtype=int)
+    observed = _max_split_gain(block[None], splits)[0]
+    tolerance = 1e-12 * max(1.0, abs(observed))
+
+    per_permutation = 2 * block.size + 2 * len(splits) * block.shape[1]
+    batch_size = max(1, _PERMUTATION_BATCH_ELEMENTS // max(1, per_permutation))
+    exceed = 0
+    remaining = n_permutations
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        order = np.argsort(rng.random((batch, len(block))), axis=1)
+        null = _max_split_gain(block[order], splits)
+        exceed += int(np.count_nonzero(null >= observed - tolerance))
+        remaining -= batch
+
+    return (exceed + 1) / (n_permutations + 1)
+
+
+def detect_changepoints(coordinates: np.ndarray, method: str = 'pelt',
+                        window_sizes: Sequence[int] = (5,), min_size: Optional[int] = None,
+                        penalty: Optional[float] = None,
+                        max_changepoints: Optional[int] = None) -> List[Dict]:
+    """
+    Locate change points in a time-ordered trajectory.
+
+    Parameters:
+    -----------
+    coordinates : np.ndarray
+        Time-ordered coordinates (n_points x n_dims)
+    method : str
+        One of CHANGEPOINT_METHODS
+    window_sizes : Sequence[int]
+        Window sizes scanned by the 'window' method
+    min_size : int, optional
+        Minimum segment length for 'binseg' / 'pelt' (default: smallest window)
+    penalty : float, optional
+        Cost penalty per change point; 'window' peaks must exceed its square
+        root (default: default_penalty)
+    max_changepoints : int, optional
+        Keep at most this many change points
+
+    Returns:
+    --------
+    List[Dict]
+        One dict per change point, ordered by index, with 'index', 'start'
+        and 'end' (the neighbouring segment bounds the shift is measured
+        over) and 'splits' (candidate split offsets within [start, end) used
+        for significance testing)
+    """
+    if method not in CHANGEPOINT_METHODS:
+        raise ValueError(f"Unknown change-point method '{method}'. Choose from {CHANGEPOINT_METHODS}")
+
+    window_sizes = sorted({int(w) for w in np.atleast_1d(window_sizes)})
+    if not window_sizes or window_sizes[0] < 1:
+        raise ValueError("window_sizes must be positive integers")
+
+    sums = CumulativeSums(coordinates)
+    n = sums.n_points
+    if penalty is None:
+        penalty = default_penalty(coordinates)
+    if not np.isfinite(penalty):
+        return []
+
+    if method == 'window':
+        profile, windows = multiscale_profile(sums, window_sizes)
+        valid = np.nan_to_num(profile, nan=0.0)
+        if not np.any(valid > 0):
+            return []
+        # The squared profile is the gain of splitting the peak's block at its
+        # centre, so peaks face the same penalty as 'binseg' / 'pelt' splits
+        peaks, _ = find_peaks(valid, height=max(np.nanpercentile(profile, 75), np.sqrt(penalty)))
+        peaks = suppress_overlapping_peaks(peaks, valid[peaks], windows[peaks], max_changepoints)
+        return [{'index': int(i), 'start': int(i - windows[i]), 'end': int(i + windows[i]),
+                 'splits': np.array([windows[i]])} for i in peaks]
+
+    min_size = max(1, int(min_size if min_size is not None else window_sizes[0]))
+    if n < 2 * min_size:
+        return []
+
+    if method == 'binseg':
+        changepoints = binary_segmentation(sums, penalty, min_size, max_changepoints)
+    else:
+        changepoints = pelt(sums, penalty, min_size)
+        if max_changepoints is not None and len(changepoints) > max_changepoints:
+            bounds = [0] + changepoints + [n]
+            gains = [sums.cost(bounds[k], bounds[k + 2]) - sums.cost(bounds[k], bounds[k + 1])
+                     - sums.cost(bounds[k + 1], bounds[k + 2]) for k in range(len(changepoints))]
+            keep = np.argsort(gains)[::-1][:max_changepoints]
+            changepoints = sorted(changepoints[k] for k in keep)
+
+    bounds = [0] + changepoints + [n]
+    return [{'index': bounds[k + 1], 'start': bounds[k], 'end': bounds[k + 2],
+             'splits': np.arange(min_size, bounds[k + 2] - bounds[k] - min_size + 1)}
+            for k in range(len(changepoints))]
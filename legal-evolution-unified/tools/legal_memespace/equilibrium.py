@@ -0,0 +1,296 @@
+"""
+Legal-Memespace Equilibrium Analysis
+Vectorized invasion, equilibrium enumeration and stability for Lotka-Volterra competition
+Author: Ignacio Adrián Lerer
+"""
+
+import numpy as np
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on array elements materialized per batched solve / eigenvalue call
+_BATCH_ELEMENTS = 1 << 22
+
+
+@dataclass
+class Equilibrium:
+    """A feasible equilibrium on a support of coexisting doctrines."""
+    support: List[int]
+    populations: np.ndarray
+    eigenvalues: np.ndarray
+    invasion_rates: np.ndarray
+
+    @property
+    def equilibrium_type(self) -> str:
+        """'exclusion' (one doctrine), 'interior' (all doctrines) or 'boundary'."""
+        if len(self.support) == 1:
+            return 'exclusion'
+        if len(self.support) == len(self.populations):
+            return 'interior'
+        return 'boundary'
+
+    @property
+    def max_eigenvalue(self) -> float:
+        """Largest real part of the community-matrix eigenvalues."""
+        return float(np.max(np.real(self.eigenvalues)))
+
+    @property
+    def stable(self) -> bool:
+        """Locally asymptotically stable, including against absent doctrines invading."""
+        return self.max_eigenvalue < 0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return {
+            'type': self.equilibrium_type,
+            'support': self.support,
+            'populations': self.populations.tolist(),
+            'stable': self.stable,
+            'max_eigenvalue': self.max_eigenvalue,
+            'eigenvalues': self.eigenvalues.tolist(),
+            'invasion_rates': self.invasion_rates.tolist()
+        }
+
+
+class EquilibriumAnalyzer:
+    """
+    Equilibria and stability of dN/dt = r * N * (1 - alpha @ N / K).
+
+    An equilibrium with support S solves alpha[S, S] @ N_S = K_S with
+    N_S > 0 and N = 0 elsewhere. Its Jacobian is block triangular: the
+    support block is the community matrix -diag(r N / K) alpha restricted
+    to S, and each absent doctrine contributes its invasion growth rate
+    r_j * (1 - (alpha @ N)_j / K_j) on the diagonal.
+    """
+
+    def __init__(self, competition_matrix: np.ndarray, growth_rates: np.ndarray,
+                 carrying_capacities: np.ndarray, tol: float = 1e-10):
+        """
+        Parameters:
+        -----------
+        competition_matrix : np.ndarray
+            Competition coefficients alpha_ij
+        growth_rates : np.ndarray
+            Intrinsic growth rates r_i
+        carrying_capacities : np.ndarray
+            Carrying capacities K_i (positive)
+        tol : float
+            Populations and invasion rates within tol of zero count as zero
+        """
+        self.competition_matrix = np.asarray(competition_matrix, dtype=float)
+        self.growth_rates = np.asarray(growth_rates, dtype=float)
+        self.carrying_capacities = np.asarray(carrying_capacities, dtype=float)
+        self.n_doctrines = len(self.growth_rates)
+        self.tol = tol
+
+    @property
+    def single_populations(self) -> np.ndarray:
+        """Equilibrium population K_i / alpha_ii of each doctrine alone."""
+        return self.carrying_capacities / np.diag(self.competition_matrix)
+
+    def invasion_rates(self, populations: np.ndarray) -> np.ndarray:
+        """Per-capita growth r_j * (1 - (alpha @ N)_j / K_j) for one or a stack of states."""
+        pressure = np.asarray(populations, dtype=float) @ self.competition_matrix.T
+        return self.growth_rates * (1 - pressure / self.carrying_capacities)
+
+    def invasion_matrix(self) -> np.ndarray:
+        """
+        Entry [j, i]: growth rate of doctrine j invading doctrine i at its
+        single-doctrine equilibrium, for all pairs in one operation.
+        """
+        scaled = self.competition_matrix * self.single_populations[None, :]
+        return self.growth_rates[:, None] * (1 - scaled / self.carrying_capacities[:, None])
+
+    def excluding_doctrines(self) -> np.ndarray:
+        """Doctrines whose single-doctrine equilibrium no other doctrine can invade."""
+        invasion = self.invasion_matrix()
+        np.fill_diagonal(invasion, -np.inf)
+        return np.flatnonzero(np.all(invasion <= 0, axis=0))
+
+    def solve_supports(self, supports: np.ndarray) -> np.ndarray:
+        """
+        Batched solve of alpha[S, S] @ N_S = K_S for equally sized supports.
+
+        Parameters:
+        -----------
+        supports : np.ndarray
+            (n_supports x k) doctrine indices
+
+        Returns:
+        --------
+        np.ndarray
+            (n_supports x k) populations; NaN rows for singular systems
+        """
+        supports = np.asarray(supports, dtype=int)
+        size = supports.shape[1]
+        solutions = np.empty(supports.shape)
+        batch = max(1, _BATCH_ELEMENTS // (size * size))
+        for start in range(0, len(supports), batch):
+            chunk = supports[start:start + batch]
+            matrices = self.competition_matrix[chunk[:, :, None], chunk[:, None, :]]
+            rhs = self.carrying_capacities[chunk]
+            try:
+                solutions[start:start + len(chunk)] = np.linalg.solve(matrices, rhs[..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                # One singular system fails the whole batch; solve the batch one by one
+                for k in range(len(chunk)):
+                    try:
+                        solutions[start + k] = np.linalg.solve(matrices[k], rhs[k])
+                    except np.linalg.LinAlgError:
+                        solutions[start + k] = np.nan
+        return solutions
+
+    def community_eigenvalues(self, supports: np.ndarray, support_populations: np.ndarray) -> np.ndarray:
+        """
+        Eigenvalues of the community matrices -diag(r N / K) alpha on equally
+        sized supports, computed as one stacked eigenvalue problem per batch.
+        """
+        supports = np.asarray(supports, dtype=int)
+        size = supports.shape[1]
+        eigenvalues = np.empty(supports.shape, dtype=complex)
+        batch = max(1, _BATCH_ELEMENTS // (size * size))
+        for start in range(0, len(supports), batch):
+            chunk = supports[start:start + batch]
+            populations = support_populations[start:start + batch]
+            scale = self.growth_rates[chunk] * populations / self.carrying_capacities[chunk]
+            matrices = -scale[:, :, None] * self.competition_matrix[chunk[:, :, None], chunk[:, None, :]]
+            eigenvalues[start:start + len(chunk)] = np.linalg.eigvals(matrices)
+        return eigenvalues
+
+    def support_count(self, max_support_size: Optional[int] = None) -> int:
+        """Number of supports with at most max_support_size doctrines (2**n - 1 for all sizes)."""
+        n = self.n_doctrines
+        max_size = n if max_support_size is None else min(max_support_size, n)
+        return sum(comb(n, size) for size in range(1, max_size + 1))
+
+    def is_exhaustive(self, max_support_size: Optional[int] = None, max_supports: int = 100000) -> bool:
+        """Whether enumerate_equilibria solves every support instead of searching heuristically."""
+        return self.support_count(max_support_size) <= max_supports
+
+    def enumerate_equilibria(self, max_support_size: Optional[int] = None,
+                             max_supports: int = 100000) -> List[Equilibrium]:
+        """
+        Enumerate feasible equilibria over supports of coexisting doctrines.
+
+        When every support fits within max_supports (2**n - 1 of them for
+        unrestricted support sizes), all supports are solved, one batch per
+        size, and the result is complete. Beyond that the search falls back
+        to community assembly, which may miss equilibria (see is_exhaustive).
+
+        Parameters:
+        -----------
+        max_support_size : int, optional
+            Largest support considered (default: all doctrines)
+        max_supports : int
+            Cap on the number of supports solved
+
+        Returns:
+        --------
+        List[Equilibrium]
+            Feasible equilibria ordered by support size, with stability
+        """
+        n = self.n_doctrines
+        max_size = n if max_support_size is None else min(max_support_size, n)
+
+        if self.is_exhaustive(max_size, max_supports):
+            feasible = []
+            for size in range(1, max_size + 1):
+                supports = np.array(list(combinations(range(n), size)), dtype=int)
+                solutions = self.solve_supports(supports)
+                feasible.extend(self._feasible(supports, solutions))
+            return self._with_stability(feasible)
+
+        logger.info(f"{self.support_count(max_size)} supports exceed max_supports={max_supports}; "
+                    "searching by community assembly")
+        return self._with_stability(self._assemble(max_size, max_supports))
+
+    def _assemble(self, max_size: int, max_supports: int) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Heuristic search for feasible supports by community assembly.
+
+        The search starts from every single doctrine and from the full
+        interior support. A feasible support is extended by each absent
+        doctrine that can invade it; an infeasible one is retried without
+        the doctrines whose solved populations are not positive. Supports
+        of equal size are solved together, and supports unreachable by
+        these moves are never visited.
+        """
+        n = self.n_doctrines
+        seen = set()
+        frontier = {(i,) for i in range(n)}
+        if max_size == n and n > 1:
+            frontier.add(tuple(range(n)))
+
+        feasible = []
+        while frontier and len(seen) < max_supports:
+            pending = sorted(support for support in frontier if support not in seen)
+            pending = pending[:max_supports - len(seen)]
+            seen.update(pending)
+            frontier = set()
+
+            for size, supports in _group_by_size(pending):
+                solutions = self.solve_supports(supports)
+                valid = np.all(np.isfinite(solutions), axis=1)
+                positive = valid & np.all(solutions > self.tol, axis=1)
+
+                # Infeasible: drop the doctrines that would not persist
+                for support, solution in zip(supports[valid & ~positive], solutions[valid & ~positive]):
+                    reduced = tuple(support[solution > self.tol].tolist())
+                    if reduced:
+                        frontier.add(reduced)
+
+                for support, state, rate in self._feasible(supports, solutions):
+                    feasible.append((support, state, rate))
+                    if size < max_size:
+                        members = set(support.tolist())
+                        for invader in np.flatnonzero(rate > self.tol):
+                            if invader not in members:
+                                frontier.add(tuple(sorted(members | {int(invader)})))
+
+        if frontier - seen:
+            logger.warning(f"Equilibrium search stopped after {len(seen)} supports (max_supports)")
+
+        return feasible
+
+    def _feasible(self, supports: np.ndarray,
+                  solutions: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """(support, full population state, invasion rates) for supports with all populations positive."""
+        positive = np.all(np.isfinite(solutions), axis=1) & np.all(solutions > self.tol, axis=1)
+        if not positive.any():
+            return []
+        states = np.zeros((int(positive.sum()), self.n_doctrines))
+        np.put_along_axis(states, supports[positive], solutions[positive], axis=1)
+        return list(zip(supports[positive], states, self.invasion_rates(states)))
+
+    def _with_stability(self, feasible: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> List[Equilibrium]:
+        """Attach community-matrix eigenvalues to feasible equilibria in one pass per support size."""
+        equilibria = []
+        for size, indices in _group_by_size([support for support, _, _ in feasible], return_positions=True):
+            supports = np.array([feasible[k][0] for k in indices])
+            states = np.array([feasible[k][1] for k in indices])
+            eigenvalues = self.community_eigenvalues(supports, np.take_along_axis(states, supports, axis=1))
+            for k, support, state, support_eigenvalues in zip(indices, supports, states, eigenvalues):
+                rates = feasible[k][2]
+                absent = np.ones(self.n_doctrines, dtype=bool)
+                absent[support] = False
+                equilibria.append(Equilibrium(
+                    support=support.tolist(),
+                    populations=state,
+                    eigenvalues=np.concatenate([support_eigenvalues, rates[absent]]),
+                    invasion_rates=rates
+                ))
+        return equilibria
+
+
+def _group_by_size(supports: Sequence, return_positions: bool = False):
+    """Group supports by length as (size, array of supports) or (size, positions) pairs."""
+    groups: Dict[int, List] = {}
+    for position, support in enumerate(supports):
+        groups.setdefault(len(support), []).append(position if return_positions else tuple(support))
+    for size in sorted(groups):
+        yield size, (groups[size] if return_positions else np.array(groups[size], dtype=int))
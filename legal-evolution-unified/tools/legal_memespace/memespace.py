@@ -6,23 +6,41 @@ Author: Ignacio Adrián Lerer
 
 import numpy as np
 import pandas as pd
-from scipy.integrate import odeint
+from scipy.integrate import odeint, solve_ivp
 from scipy.optimize import minimize
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 import warnings
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Optional, Union
 import logging
 from dataclasses import dataclass
 import matplotlib.pyplot as plt
 from scipy.stats import chi2
 from scipy.signal import find_peaks
 import json
+import os
+from multiprocessing import Pool, cpu_count
+
+from .changepoint import (CumulativeSums, mean_shift_profile, detect_changepoints,
+                          permutation_pvalue)
+from .equilibrium import EquilibriumAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Integrators for competition dynamics: LSODA (odeint, switches to a stiff
+# method automatically) or the implicit stiff solvers of solve_ivp
+ODE_METHODS = ('lsoda', 'bdf', 'radau')
+
+# Cluster models for cluster_doctrinal_space
+CLUSTERING_ALGORITHMS = ('kmeans', 'minibatch')
+
+# Fitted attributes persisted by save_projection_state
+_SCALER_STATE = ('mean_', 'var_', 'scale_', 'n_samples_seen_')
+_PCA_STATE = ('components_', 'mean_', 'var_', 'explained_variance_', 'explained_variance_ratio_',
+              'singular_values_', 'noise_variance_', 'n_samples_seen_')
+
 @dataclass
 class PhaseTransition:
     """Represents a detected phase transition in doctrinal space."""
@@ -46,6 +64,120 @@ class PhaseTransition:
             'statistical_significance': self.statistical_significance
         }
 
+# Coordinates shared by the cluster-count sweep, set once per worker process
+_cluster_coordinates = None
+_cluster_sample = None
+
+
+def _init_cluster_worker(coordinates: Optional[np.ndarray], sample_indices: Optional[np.ndarray]):
+    """Install the coordinates and silhouette subsample for _fit_cluster_candidate."""
+    global _cluster_coordinates, _cluster_sample
+    _cluster_coordinates = coordinates
+    _cluster_sample = sample_indices
+
+
+def _fit_cluster_candidate(args: Tuple[int, Dict]) -> Tuple[int, KMeans, np.ndarray, float]:
+    """Fit one cluster count and score it by silhouette on the shared subsample."""
+    n_clusters, settings = args
+    if settings['algorithm'] == 'minibatch':
+        model = MiniBatchKMeans(n_clusters=n_clusters, random_state=settings['random_state'],
+                                batch_size=settings['batch_size'])
+    else:
+        model = KMeans(n_clusters=n_clusters, random_state=settings['random_state'])
+    labels = model.fit_predict(_cluster_coordinates)
+    
+    if _cluster_sample is None:
+        sample_coords, sample_labels = _cluster_coordinates, labels
+    else:
+        sample_coords, sample_labels = _cluster_coordinates[_cluster_sample], labels[_cluster_sample]
+    # A subsample that misses all but one cluster cannot be scored
+    score = silhouette_score(sample_coords, sample_labels) if len(set(sample_labels)) > 1 else -1.0
+    return n_clusters, model, labels, score
+
+
+class LotkaVolterraSystem:
+    """
+    Generalized Lotka-Volterra competition system.
+    
+    dN/dt = r * N * (1 - alpha @ N / K)
+    
+    Doctrines with non-positive carrying capacity are frozen (dN_i/dt = 0),
+    and a doctrine at or below zero prevalence cannot decline further.
+    """
+    
+    def __init__(self, growth_rates: np.ndarray, carrying_capacities: np.ndarray,
+                 competition_matrix: np.ndarray):
+        """
+        Parameters:
+        -----------
+        growth_rates : np.ndarray
+            Intrinsic growth rates r_i
+        carrying_capacities : np.ndarray
+            Carrying capacities K_i
+        competition_matrix : np.ndarray
+            Competition coefficients alpha_ij
+        """
+        K = np.asarray(carrying_capacities, dtype=float)
+        active = K > 0
+        self.growth_rates = np.where(active, np.asarray(growth_rates, dtype=float), 0.0)
+        # alpha_ij / K_i, so the competition term is a single matrix-vector product
+        self.scaled_competition = np.asarray(competition_matrix, dtype=float) / np.where(active, K, 1.0)[:, None]
+    
+    def rhs(self, populations: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """Time derivative of the populations (odeint signature)."""
+        dpdt = self.growth_rates * populations * (1 - self.scaled_competition @ populations)
+        return np.where((populations <= 0) & (dpdt < 0), 0.0, dpdt)
+    
+    def jacobian(self, populations: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """Analytic Jacobian J_ij = d(dN_i/dt)/dN_j (odeint Dfun signature)."""
+        pressure = 1 - self.scaled_competition @ populations
+        jacobian = -(self.growth_rates * populations)[:, None] * self.scaled_competition
+        jacobian[np.diag_indices_from(jacobian)] += self.growth_rates * pressure
+        # Rows clamped by the non-negativity guard have zero derivative
+        clamped = (populations <= 0) & (self.growth_rates * populations * pressure < 0)
+        jacobian[clamped] = 0.0
+        return jacobian
+    
+    def integrate(self, initial_populations: np.ndarray, time_points: np.ndarray,
+                  method: str = 'lsoda') -> np.ndarray:
+        """
+        Integrate the system with its analytic Jacobian.
+        
+        Parameters:
+        -----------
+        initial_populations : np.ndarray
+            Initial prevalence of each doctrine
+        time_points : np.ndarray
+            Increasing time points at which to report the solution
+        method : str
+            One of ODE_METHODS
+            
+        Returns:
+        --------
+        np.ndarray
+            Population trajectories (time_points x n_doctrines)
+        """
+        if method not in ODE_METHODS:
+            raise ValueError(f"Unknown ODE method '{method}'. Choose from {ODE_METHODS}")
+        
+        initial_populations = np.asarray(initial_populations, dtype=float)
+        time_points = np.asarray(time_points, dtype=float)
+        if method == 'lsoda':
+            return odeint(self.rhs, initial_populations, time_points, Dfun=self.jacobian)
+        
+        result = solve_ivp(
+            lambda t, populations: self.rhs(populations, t),
+            (time_points[0], time_points[-1]),
+            initial_populations,
+            method={'bdf': 'BDF', 'radau': 'Radau'}[method],
+            t_eval=time_points,
+            jac=lambda t, populations: self.jacobian(populations, t)
+        )
+        if not result.success:
+            raise RuntimeError(f"{method} integration failed: {result.message}")
+        return result.y.T
+
+
 class LegalMemespace:
     """
     Maps legal doctrines in multi-dimensional space and models their competition.
@@ -86,6 +218,11 @@ class LegalMemespace:
         self.coordinates_cache = {}
         self.competition_parameters = {}
         
+        # Projection state, reusable to map new cases without refitting
+        self.feature_columns = None
+        self.n_features_ = None
+        self.coordinate_bounds = None
+        
         np.random.seed(random_state)
         
     def map_doctrinal_space(self, cases: pd.DataFrame, 
@@ -108,18 +245,15 @@ class LegalMemespace:
         logger.info(f"Mapping {len(cases)} cases to {self.n_dimensions}D doctrinal space")
         
         # Extract or create features for PCA
-        if feature_columns:
-            if not all(col in cases.columns for col in feature_columns):
-                missing = [col for col in feature_columns if col not in cases.columns]
-                raise ValueError(f"Missing feature columns: {missing}")
-            features = cases[feature_columns].values
-        else:
-            features = self._extract_or_create_features(cases)
+        self.feature_columns = self._resolve_feature_columns(cases, feature_columns)
+        features = self._case_features(cases)
+        self.n_features_ = features.shape[1]
         
         # Handle missing values
         features = self._handle_missing_values(features)
         
         # Standardize features
+        self.scaler = StandardScaler()
         features_scaled = self.scaler.fit_transform(features)
         
         # Apply PCA
@@ -127,19 +261,11 @@ class LegalMemespace:
         coordinates = self.pca.fit_transform(features_scaled)
         
         # Normalize coordinates to [0, 1] range for each dimension
-        coordinates_normalized = np.zeros_like(coordinates)
-        for i in range(self.n_dimensions):
-            min_val = coordinates[:, i].min()
-            max_val = coordinates[:, i].max()
-            if max_val > min_val:
-                coordinates_normalized[:, i] = (coordinates[:, i] - min_val) / (max_val - min_val)
-            else:
-                coordinates_normalized[:, i] = 0.5  # Default to center if no variation
+        self.coordinate_bounds = (coordinates.min(axis=0), coordinates.max(axis=0))
+        coordinates_normalized = self._normalize_coordinates(coordinates)
         
         # Cache coordinates
-        if 'case_id' in cases.columns:
-            for idx, case_id in enumerate(cases['case_id']):
-                self.coordinates_cache[case_id] = coordinates_normalized[idx]
+        self._cache_coordinates(cases, coordinates_normalized)
         
         # Log PCA information
         explained_variance = self.pca.explained_variance_ratio_
@@ -149,89 +275,318 @@ class LegalMemespace:
         
         return coordinates_normalized
     
-    def _extract_or_create_features(self, cases: pd.DataFrame) -> np.ndarray:
-        """Extract or create features for PCA analysis."""
-        features = []
+    def fit_doctrinal_space_incremental(self, source: Union[pd.DataFrame, str, os.PathLike, Iterable[pd.DataFrame]],
+                                        feature_columns: Optional[List[str]] = None,
+                                        chunksize: int = 10000):
+        """
+        Fit the doctrinal projection out of core with IncrementalPCA.
         
-        # Check for explicit feature columns
-        feature_columns = [col for col in cases.columns if col.startswith('feature_')]
+        The scaler and IncrementalPCA are fitted chunk by chunk, so the corpus
+        never has to be in memory at once. A DataFrame or file path is read in
+        three passes (scaler, PCA, normalization bounds), matching a full fit up
+        to the IncrementalPCA approximation. Any other iterable of DataFrames is
+        consumed once via partial_fit_doctrinal_space.
+        
+        Parameters:
+        -----------
+        source : pd.DataFrame, path or iterable of pd.DataFrame
+            Cases, a CSV / Parquet file, or a stream of case chunks
+        feature_columns : List[str], optional
+            Specific columns to use as features. If None, auto-detect.
+        chunksize : int
+            Cases per chunk when reading a DataFrame or file
+            
+        Returns:
+        --------
+        LegalMemespace
+            self, with a projection state reusable by project_doctrinal_space
+        """
+        self._reset_projection_state(feature_columns)
+        
+        if not isinstance(source, (pd.DataFrame, str, os.PathLike)):
+            for chunk in self._iter_case_chunks(source, chunksize):
+                self.partial_fit_doctrinal_space(chunk)
+            return self
+        
+        for chunk in self._iter_case_chunks(source, chunksize):
+            self._feed_scaler(chunk)
+        self._partial_fit_pca(self._scaled_features(chunk)
+                              for chunk in self._iter_case_chunks(source, chunksize))
+        
+        for chunk in self._iter_case_chunks(source, chunksize):
+            self._extend_coordinate_bounds(self.pca.transform(self._scaled_features(chunk)))
+        
+        logger.info(f"Incremental PCA fitted on {int(self.pca.n_samples_seen_)} cases; "
+                    f"cumulative variance explained: {np.sum(self.pca.explained_variance_ratio_):.3f}")
+        return self
+    
+    def partial_fit_doctrinal_space(self, cases: pd.DataFrame,
+                                    feature_columns: Optional[List[str]] = None):
+        """
+        Update the incremental projection with a chunk of new cases.
+        
+        Running scaler statistics and IncrementalPCA components absorb the
+        chunk, and normalization bounds are widened to cover its projection.
+        Cases already mapped keep their cached coordinates until re-projected.
+        A space mapped with a full PCA is replaced by a fresh incremental fit.
+        """
+        if not isinstance(self.pca, IncrementalPCA):
+            self._reset_projection_state(feature_columns)
+        
+        self._feed_scaler(cases)
+        features_scaled = self._scaled_features(cases)
+        if len(features_scaled) < self.n_dimensions:
+            logger.warning(f"Chunk of {len(features_scaled)} cases is smaller than {self.n_dimensions} "
+                           "dimensions; only scaler statistics were updated")
+            return self
+        
+        self.pca.partial_fit(features_scaled)
+        self._extend_coordinate_bounds(self.pca.transform(features_scaled))
+        return self
+    
+    def project_doctrinal_space(self, source: Union[pd.DataFrame, str, os.PathLike, Iterable[pd.DataFrame]],
+                                chunksize: int = 10000) -> np.ndarray:
+        """
+        Project cases with the fitted state, without refitting.
+        
+        Coordinates use the stored normalization bounds, so new cases may fall
+        slightly outside [0, 1]. Cases with a case_id are added to the cache.
+        
+        Parameters:
+        -----------
+        source : pd.DataFrame, path or iterable of pd.DataFrame
+            Cases, a CSV / Parquet file, or a stream of case chunks
+        chunksize : int
+            Cases per chunk when reading a DataFrame or file
+            
+        Returns:
+        --------
+        np.ndarray
+            N x n_dimensions array of doctrinal coordinates
+        """
+        if self.pca is None or self.coordinate_bounds is None:
+            raise ValueError("Doctrinal space has not been fitted; call map_doctrinal_space "
+                             "or fit_doctrinal_space_incremental first")
+        
+        projected = []
+        for chunk in self._iter_case_chunks(source, chunksize):
+            coordinates = self._normalize_coordinates(self.pca.transform(self._scaled_features(chunk)))
+            self._cache_coordinates(chunk, coordinates)
+            projected.append(coordinates)
+        
+        if not projected:
+            return np.empty((0, self.n_dimensions))
+        return np.vstack(projected)
+    
+    def save_projection_state(self, filepath: str):
+        """Save the fitted scaler, PCA and normalization bounds to JSON."""
+        if self.pca is None or self.coordinate_bounds is None:
+            raise ValueError("Doctrinal space has not been fitted")
+        
+        state = {
+            'n_dimensions': self.n_dimensions,
+            'feature_columns': self.feature_columns,
+            'incremental': isinstance(self.pca, IncrementalPCA),
+            'scaler': {attr: np.asarray(getattr(self.scaler, attr)).tolist() for attr in _SCALER_STATE},
+            'pca': {attr: np.asarray(getattr(self.pca, attr)).tolist()
+                    for attr in _PCA_STATE if hasattr(self.pca, attr)},
+            'coordinate_bounds': [bound.tolist() for bound in self.coordinate_bounds]
+        }
+        with open(filepath, 'w') as f:
+            json.dump(state, f)
+    
+    def load_projection_state(self, filepath: str):
+        """Restore a projection saved with save_projection_state."""
+        with open(filepath, 'r') as f:
+            state = json.load(f)
+        
+        if state['n_dimensions'] != self.n_dimensions:
+            raise ValueError(f"Saved state has {state['n_dimensions']} dimensions, "
+                             f"this memespace has {self.n_dimensions}")
+        
+        self.feature_columns = state['feature_columns']
+        self.scaler = StandardScaler()
+        for attr, value in state['scaler'].items():
+            setattr(self.scaler, attr, np.asarray(value))
+        
+        if state['incremental']:
+            self.pca = IncrementalPCA(n_components=self.n_dimensions)
+        else:
+            self.pca = PCA(n_components=self.n_dimensions, random_state=self.random_state)
+        for attr, value in state['pca'].items():
+            setattr(self.pca, attr, np.asarray(value))
+        
+        n_features = self.scaler.mean_.shape[0]
+        self.scaler.n_features_in_ = self.pca.n_features_in_ = self.n_features_ = n_features
+        self.pca.n_components_ = self.n_dimensions
+        self.coordinate_bounds = tuple(np.asarray(bound, dtype=float) for bound in state['coordinate_bounds'])
+        return self
+    
+    def _reset_projection_state(self, feature_columns: Optional[List[str]]):
+        """Start a fresh incremental fit."""
+        self.feature_columns = feature_columns
+        self.n_features_ = None
+        self.scaler = StandardScaler()
+        self.pca = IncrementalPCA(n_components=self.n_dimensions)
+        self.coordinate_bounds = None
+    
+    def _partial_fit_pca(self, batches: Iterable[np.ndarray]):
+        """Feed IncrementalPCA, merging batches smaller than n_dimensions into a neighbour."""
+        pending = None
+        for batch in batches:
+            if pending is not None and len(pending) >= self.n_dimensions and len(batch) >= self.n_dimensions:
+                self.pca.partial_fit(pending)
+                pending = batch
+            else:
+                pending = batch if pending is None else np.vstack([pending, batch])
         
+        if pending is None or len(pending) < self.n_dimensions:
+            raise ValueError(f"At least {self.n_dimensions} cases are needed to fit the doctrinal space")
+        self.pca.partial_fit(pending)
+    
+    def _feed_scaler(self, cases: pd.DataFrame):
+        """Update running scaler statistics; NaN entries are ignored."""
+        if self.feature_columns is None and self.n_features_ is None:
+            self.feature_columns = self._resolve_feature_columns(cases, None)
+        features = self._case_features(cases)
+        self.n_features_ = features.shape[1]
+        self.scaler.partial_fit(np.where(np.isfinite(features), features, np.nan))
+    
+    def _scaled_features(self, cases: pd.DataFrame) -> np.ndarray:
+        """Standardized features; missing values are imputed with the running mean."""
+        features = self._case_features(cases)
+        scaled = self.scaler.transform(np.where(np.isfinite(features), features, np.nan))
+        return np.nan_to_num(scaled, nan=0.0)
+    
+    def _extend_coordinate_bounds(self, coordinates: np.ndarray):
+        """Widen the stored normalization bounds to cover new coordinates."""
+        if len(coordinates) == 0:
+            return
+        lower, upper = coordinates.min(axis=0), coordinates.max(axis=0)
+        if self.coordinate_bounds is not None:
+            lower = np.minimum(lower, self.coordinate_bounds[0])
+            upper = np.maximum(upper, self.coordinate_bounds[1])
+        self.coordinate_bounds = (lower, upper)
+    
+    def _normalize_coordinates(self, coordinates: np.ndarray) -> np.ndarray:
+        """Min-max normalize with the stored bounds (0.5 where a dimension has no variation)."""
+        lower, upper = self.coordinate_bounds
+        span = upper - lower
+        varying = span > 0
+        return np.where(varying, (coordinates - lower) / np.where(varying, span, 1.0), 0.5)
+    
+    def _cache_coordinates(self, cases: pd.DataFrame, coordinates: np.ndarray):
+        """Store coordinates by case_id when the cases carry one."""
+        if 'case_id' in cases.columns:
+            self.coordinates_cache.update(zip(cases['case_id'], coordinates))
+    
+    @staticmethod
+    def _iter_case_chunks(source, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield case DataFrames from a DataFrame, CSV / Parquet path, or iterable of chunks."""
+        if isinstance(source, pd.DataFrame):
+            for start in range(0, len(source), chunksize):
+                yield source.iloc[start:start + chunksize]
+        elif isinstance(source, (str, os.PathLike)):
+            path = os.fspath(source)
+            if path.endswith(('.parquet', '.pq')):
+                try:
+                    import pyarrow.parquet as pq
+                except ImportError:
+                    raise ImportError("pyarrow required for Parquet input. Install with: pip install pyarrow")
+                for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                    yield batch.to_pandas()
+            else:
+                yield from pd.read_csv(path, chunksize=chunksize)
+        else:
+            yield from source
+    
+    def _resolve_feature_columns(self, cases: pd.DataFrame,
+                                 feature_columns: Optional[List[str]]) -> Optional[List[str]]:
+        """Feature columns to use, or None for synthetic features from case attributes."""
         if feature_columns:
-            logger.info(f"Using {len(feature_columns)} explicit feature columns")
-            return cases[feature_columns].values
+            if not all(col in cases.columns for col in feature_columns):
+                missing = [col for col in feature_columns if col not in cases.columns]
+                raise ValueError(f"Missing feature columns: {missing}")
+            return list(feature_columns)
+        
+        # Check for explicit feature columns
+        explicit_columns = [col for col in cases.columns if col.startswith('feature_')]
+        if explicit_columns:
+            logger.info(f"Using {len(explicit_columns)} explicit feature columns")
+            return explicit_columns
         
         logger.info("Creating synthetic features from case attributes")
+        return None
+    
+    def _case_features(self, cases: pd.DataFrame) -> np.ndarray:
+        """Feature matrix for cases under the resolved feature columns."""
+        if self.feature_columns is not None:
+            return cases[self.feature_columns].to_numpy(dtype=float)
+        return self._create_synthetic_features(cases)
+    
+    def _create_synthetic_features(self, cases: pd.DataFrame) -> np.ndarray:
+        """Create features column-wise from available case attributes."""
+        def column(name, default):
+            if name in cases.columns:
+                return cases[name].to_numpy(dtype=float)
+            return np.full(len(cases), default)
+        
+        court_level_mapping = {
+            'Supreme Court': 1.0,
+            'Appeals Court': 0.8,
+            'Federal Court': 0.6,
+            'Provincial Supreme': 0.4,
+            'Lower Court': 0.2
+        }
+        if 'court_level' in cases.columns:
+            court_level = cases['court_level'].map(court_level_mapping).fillna(0.5).to_numpy(dtype=float)
+        else:
+            court_level = np.full(len(cases), 0.5)
         
-        # Create features from available case attributes
-        for _, case in cases.iterrows():
-            feature_vector = []
-            
+        return np.column_stack([
             # Core doctrinal dimensions
-            feature_vector.extend([
-                case.get('state_power', 0.5),           # State vs Individual
-                case.get('emergency_level', 0.5),       # Emergency vs Normal
-                case.get('formalism', 0.5),             # Formal vs Pragmatic  
-                case.get('permanence', 0.5),            # Temporary vs Permanent
-            ])
+            column('state_power', 0.5),             # State vs Individual
+            column('emergency_level', 0.5),         # Emergency vs Normal
+            column('formalism', 0.5),               # Formal vs Pragmatic
+            column('permanence', 0.5),              # Temporary vs Permanent
             
             # Additional doctrinal indicators
-            feature_vector.extend([
-                case.get('executive_power', 0.5),       # Executive authority
-                case.get('legislative_deference', 0.5), # Legislative deference
-                case.get('judicial_activism', 0.5),     # Judicial activism
-                case.get('rights_protection', 0.5),     # Individual rights
-                case.get('property_rights', 0.5),       # Property protection
-                case.get('due_process', 0.5),           # Due process adherence
-            ])
+            column('executive_power', 0.5),         # Executive authority
+            column('legislative_deference', 0.5),   # Legislative deference
+            column('judicial_activism', 0.5),       # Judicial activism
+            column('rights_protection', 0.5),       # Individual rights
+            column('property_rights', 0.5),         # Property protection
+            column('due_process', 0.5),             # Due process adherence
             
             # Court and temporal factors
-            court_level_mapping = {
-                'Supreme Court': 1.0,
-                'Appeals Court': 0.8,
-                'Federal Court': 0.6,
-                'Provincial Supreme': 0.4,
-                'Lower Court': 0.2
-            }
-            feature_vector.append(court_level_mapping.get(case.get('court_level'), 0.5))
-            
-            # Year normalized (assuming range 1900-2025)
-            year = case.get('year', 1962)  # Default to middle of range
-            normalized_year = (year - 1900) / 125.0
-            feature_vector.append(normalized_year)
+            court_level,
+            (column('year', 1962) - 1900) / 125.0,  # Year normalized (assuming range 1900-2025)
             
             # Economic context indicators
-            feature_vector.extend([
-                case.get('economic_crisis', 0.0),       # Economic crisis context
-                case.get('inflation_context', 0.0),     # Inflation context
-                case.get('fiscal_emergency', 0.0),      # Fiscal emergency
-            ])
+            column('economic_crisis', 0.0),         # Economic crisis context
+            column('inflation_context', 0.0),       # Inflation context
+            column('fiscal_emergency', 0.0),        # Fiscal emergency
             
             # Doctrine-specific indicators
-            feature_vector.extend([
-                case.get('emergency_doctrine', 0.0),    # Emergency doctrine presence
-                case.get('formalist_doctrine', 0.0),    # Formalist doctrine presence
-                case.get('regulatory_state', 0.0),      # Regulatory state acceptance
-                case.get('constitutional_strict', 0.0), # Strict constitutionalism
-            ])
-            
-            features.append(feature_vector)
-        
-        return np.array(features)
+            column('emergency_doctrine', 0.0),      # Emergency doctrine presence
+            column('formalist_doctrine', 0.0),      # Formalist doctrine presence
+            column('regulatory_state', 0.0),        # Regulatory state acceptance
+            column('constitutional_strict', 0.0),   # Strict constitutionalism
+        ])
     
     def _handle_missing_values(self, features: np.ndarray) -> np.ndarray:
         """Handle missing values in feature matrix."""
-        # Replace NaN with column means
-        features_clean = features.copy()
-        
-        for col in range(features_clean.shape[1]):
-            col_data = features_clean[:, col]
-            mask = ~np.isnan(col_data) & ~np.isinf(col_data)
-            
-            if mask.any():
-                mean_val = np.mean(col_data[mask])
-                features_clean[~mask, col] = mean_val
-            else:
-                features_clean[:, col] = 0.5  # Default neutral value
+        # Replace NaN / inf with column means of the finite entries
+        features_clean = np.array(features, dtype=float)
+        invalid = ~np.isfinite(features_clean)
+        if not invalid.any():
+            return features_clean
+        
+        counts = np.sum(~invalid, axis=0)
+        totals = np.sum(np.where(invalid, 0.0, features_clean), axis=0)
+        fill_values = np.where(counts > 0, totals / np.maximum(counts, 1), 0.5)  # 0.5: default neutral value
+        rows, cols = np.nonzero(invalid)
+        features_clean[rows, cols] = fill_values[cols]
         
         return features_clean
     
@@ -239,7 +594,8 @@ class LegalMemespace:
                            competition_matrix: np.ndarray,
                            time_points: np.ndarray,
                            growth_rates: Optional[np.ndarray] = None,
-                           carrying_capacities: Optional[np.ndarray] = None) -> np.ndarray:
+                           carrying_capacities: Optional[np.ndarray] = None,
+                           ode_method: str = 'lsoda') -> np.ndarray:
         """
         Simulate competitive dynamics using Lotka-Volterra equations.
         
@@ -255,6 +611,8 @@ class LegalMemespace:
             Intrinsic growth rates for each doctrine
         carrying_capacities : np.ndarray, optional
             Carrying capacities for each doctrine
+        ode_method : str
+            Integrator: 'lsoda' (default), or 'bdf' / 'radau' for stiff systems
             
         Returns:
         --------
@@ -278,37 +636,14 @@ class LegalMemespace:
             'competition_matrix': competition_matrix
         }
         
-        def lotka_volterra(populations, t, r, K, alpha):
-            """
-            Generalized Lotka-Volterra competition equations.
-            
-            dN_i/dt = r_i * N_i * (1 - (sum(alpha_ij * N_j) / K_i))
-            """
-            n = len(populations)
-            dpdt = np.zeros(n)
-            
-            for i in range(n):
-                competition_effect = sum(alpha[i, j] * populations[j] for j in range(n))
-                
-                if K[i] > 0:  # Avoid division by zero
-                    dpdt[i] = r[i] * populations[i] * (1 - competition_effect / K[i])
-                else:
-                    dpdt[i] = 0
-                
-                # Prevent negative populations
-                if populations[i] <= 0:
-                    dpdt[i] = max(0, dpdt[i])
-            
-            return dpdt
+        if ode_method not in ODE_METHODS:
+            raise ValueError(f"Unknown ODE method '{ode_method}'. Choose from {ODE_METHODS}")
+        
+        system = LotkaVolterraSystem(growth_rates, carrying_capacities, competition_matrix)
         
         # Simulate the system
         try:
-            solution = odeint(
-                lotka_volterra, 
-                initial_populations,
-                time_points,
-                args=(growth_rates, carrying_capacities, competition_matrix)
-            )
+            solution = system.integrate(initial_populations, time_points, method=ode_method)
             
             logger.info("Competition simulation completed successfully")
             return solution
@@ -357,29 +692,14 @@ class LegalMemespace:
             logger.warning("Insufficient data for phase transition detection")
             return self._create_null_transition(sorted_dates, sorted_coords)
         
-        # Calculate moving statistics
-        distances = []
-        transition_indices = []
-        
-        for i in range(window_size, n_cases - window_size):
-            # Calculate local change magnitude
-            before_window = sorted_coords[i-window_size:i]
-            after_window = sorted_coords[i:i+window_size]
-            
-            # Mean coordinates before and after
-            mean_before = np.mean(before_window, axis=0)
-            mean_after = np.mean(after_window, axis=0)
-            
-            # Euclidean distance between means
-            distance = np.sqrt(np.sum((mean_after - mean_before)**2))
-            distances.append(distance)
-            transition_indices.append(i)
+        # Mean-shift distance at every index from cumulative sums
+        sums = CumulativeSums(sorted_coords)
+        distances_array = mean_shift_profile(sums, window_size)[window_size:n_cases - window_size]
         
-        if not distances:
+        if len(distances_array) == 0:
             return self._create_null_transition(sorted_dates, sorted_coords)
         
         # Find peaks in distance profile
-        distances_array = np.array(distances)
         peaks, _ = find_peaks(distances_array, height=np.percentile(distances_array, 75))
         
         if len(peaks) == 0:
@@ -389,16 +709,7 @@ class LegalMemespace:
         
         # Select most significant transition
         max_distance_idx = peaks[np.argmax(distances_array[peaks])]
-        transition_idx = transition_indices[max_distance_idx]
-        
-        # Calculate transition details
-        before_coords = np.mean(sorted_coords[transition_idx-window_size:transition_idx], axis=0)
-        after_coords = np.mean(sorted_coords[transition_idx:transition_idx+window_size], axis=0)
-        magnitude = distances_array[max_distance_idx]
-        
-        # Determine affected dimensions
-        coord_changes = np.abs(after_coords - before_coords)
-        affected_dims = np.where(coord_changes > np.std(coord_changes))[0].tolist()
+        transition_idx = window_size + max_distance_idx
         
         # Statistical significance test
         p_value = self._calculate_transition_significance(
@@ -406,22 +717,105 @@ class LegalMemespace:
             sorted_coords[transition_idx:transition_idx+window_size]
         )
         
-        # Classify transition type
-        transition_type = self._classify_transition_type(before_coords, after_coords, affected_dims)
+        transition = self._build_transition(
+            sorted_dates.iloc[transition_idx],
+            sums.mean(transition_idx - window_size, transition_idx),
+            sums.mean(transition_idx, transition_idx + window_size),
+            p_value,
+            magnitude=distances_array[max_distance_idx]
+        )
+        
+        logger.info(f"Phase transition detected at {transition.date} with magnitude {transition.magnitude:.3f}")
+        
+        return transition
+    
+    def detect_phase_transitions(self, coordinates: np.ndarray,
+                                 case_dates: pd.Series,
+                                 method: str = 'pelt',
+                                 window_sizes: Union[int, Sequence[int]] = (5, 10, 20),
+                                 penalty: Optional[float] = None,
+                                 n_permutations: int = 999,
+                                 significance_threshold: float = 0.05,
+                                 max_transitions: Optional[int] = None) -> List[PhaseTransition]:
+        """
+        Detect every significant phase transition in doctrinal space.
+        
+        Parameters:
+        -----------
+        coordinates : np.ndarray
+            Doctrinal coordinates over time
+        case_dates : pd.Series
+            Corresponding dates for each coordinate
+        method : str
+            'window' (multi-scale sliding mean shift), 'binseg' (binary
+            segmentation) or 'pelt' (exact penalized segmentation)
+        window_sizes : int or Sequence[int]
+            Window sizes scanned by 'window'; the smallest is the minimum
+            segment length for 'binseg' and 'pelt'
+        penalty : float, optional
+            Cost penalty per transition (default: BIC-style)
+        n_permutations : int
+            Permutations per candidate for the p-value; 0 uses Hotelling's T²
+        significance_threshold : float
+            Candidates with a larger p-value are discarded
+        max_transitions : int, optional
+            Keep at most this many candidates before significance testing
+            
+        Returns:
+        --------
+        List[PhaseTransition]
+            Significant transitions in chronological order
+        """
+        logger.info(f"Detecting phase transitions in doctrinal space ({method})")
+        
+        sorted_indices = np.asarray(case_dates.argsort())
+        sorted_coords = np.asarray(coordinates, dtype=float)[sorted_indices]
+        sorted_dates = case_dates.iloc[sorted_indices]
+        
+        candidates = detect_changepoints(sorted_coords, method=method, window_sizes=window_sizes,
+                                         penalty=penalty, max_changepoints=max_transitions)
+        
+        rng = np.random.default_rng(self.random_state)
+        sums = CumulativeSums(sorted_coords)
+        transitions = []
+        for candidate in candidates:
+            start, index, end = candidate['start'], candidate['index'], candidate['end']
+            if n_permutations > 0:
+                p_value = permutation_pvalue(sorted_coords[start:end], candidate['splits'],
+                                             n_permutations, rng)
+            else:
+                p_value = self._calculate_transition_significance(
+                    sorted_coords[start:index], sorted_coords[index:end]
+                )
+            
+            if p_value <= significance_threshold:
+                transitions.append(self._build_transition(
+                    sorted_dates.iloc[index], sums.mean(start, index), sums.mean(index, end), p_value
+                ))
+        
+        logger.info(f"{len(transitions)} of {len(candidates)} candidate transitions are significant")
         
-        transition = PhaseTransition(
-            date=str(sorted_dates.iloc[transition_idx]),
+        return transitions
+    
+    def _build_transition(self, date, before_coords: np.ndarray, after_coords: np.ndarray,
+                          p_value: float, magnitude: Optional[float] = None) -> PhaseTransition:
+        """Describe the shift between two mean positions as a PhaseTransition."""
+        if magnitude is None:
+            magnitude = np.sqrt(np.sum((after_coords - before_coords)**2))
+        
+        # Determine affected dimensions
+        coord_changes = np.abs(after_coords - before_coords)
+        affected_dims = np.where(coord_changes > np.std(coord_changes))[0].tolist()
+        
+        return PhaseTransition(
+            date=str(date),
             coordinates_before=before_coords.tolist(),
             coordinates_after=after_coords.tolist(),
             magnitude=magnitude,
-            transition_type=transition_type,
+            transition_type=self._classify_transition_type(before_coords, after_coords, affected_dims),
             affected_dimensions=affected_dims,
             statistical_significance=p_value
         )
-        
-        logger.info(f"Phase transition detected at {transition.date} with magnitude {magnitude:.3f}")
-        
-        return transition
     
     def _create_null_transition(self, dates: pd.Series, coords: np.ndarray) -> PhaseTransition:
         """Create a null transition when no significant change is detected."""
@@ -497,7 +891,10 @@ class LegalMemespace:
     
     def analyze_competitive_equilibrium(self, competition_matrix: np.ndarray,
                                       growth_rates: np.ndarray,
-                                      carrying_capacities: np.ndarray) -> Dict[str, Union[np.ndarray, str]]:
+                                      carrying_capacities: np.ndarray,
+                                      enumerate_supports: bool = False,
+                                      max_support_size: Optional[int] = None,
+                                      max_supports: int = 100000) -> Dict[str, Union[np.ndarray, str]]:
         """
         Analyze competitive equilibrium and stability of the doctrinal system.
         
@@ -509,6 +906,15 @@ class LegalMemespace:
             Growth rates for each doctrine
         carrying_capacities : np.ndarray
             Carrying capacities
+        enumerate_supports : bool
+            Also enumerate feasible boundary and interior equilibria with their
+            stability (see EquilibriumAnalyzer.enumerate_equilibria)
+        max_support_size : int, optional
+            Largest set of coexisting doctrines considered when enumerating
+        max_supports : int
+            Cap on the number of supports solved when enumerating; with more
+            supports than this the search is heuristic and results['complete']
+            is False
             
         Returns:
         --------
@@ -531,30 +937,18 @@ class LegalMemespace:
         }
         
         try:
-            # Check for competitive exclusion (one doctrine dominates)
-            for i in range(n_doctrines):
-                # Can doctrine i exclude all others?
-                can_exclude_others = True
-                equilibrium_pop_i = carrying_capacities[i] / competition_matrix[i, i]
-                
-                for j in range(n_doctrines):
-                    if i != j:
-                        # Check if doctrine j can invade when i is at equilibrium
-                        invasion_growth = growth_rates[j] * (
-                            1 - (competition_matrix[j, i] * equilibrium_pop_i) / carrying_capacities[j]
-                        )
-                        
-                        if invasion_growth > 0:
-                            can_exclude_others = False
-                            break
-                
-                if can_exclude_others:
-                    results['dominant_doctrine'] = i
-                    results['equilibrium_points'].append({
-                        'type': 'exclusion',
-                        'populations': [equilibrium_pop_i if k == i else 0 for k in range(n_doctrines)],
-                        'dominant': i
-                    })
+            analyzer = EquilibriumAnalyzer(competition_matrix, growth_rates, carrying_capacities)
+            
+            # Check for competitive exclusion (one doctrine dominates): no other
+            # doctrine can invade its single-doctrine equilibrium
+            single_populations = analyzer.single_populations
+            for i in analyzer.excluding_doctrines():
+                results['dominant_doctrine'] = int(i)
+                results['equilibrium_points'].append({
+                    'type': 'exclusion',
+                    'populations': [single_populations[i] if k == i else 0 for k in range(n_doctrines)],
+                    'dominant': int(i)
+                })
             
             # Check for coexistence equilibrium
             if results['dominant_doctrine'] is None:
@@ -590,6 +984,14 @@ class LegalMemespace:
                 except np.linalg.LinAlgError:
                     logger.warning("Could not solve for coexistence equilibrium")
             
+            if enumerate_supports:
+                equilibria = analyzer.enumerate_equilibria(max_support_size=max_support_size,
+                                                           max_supports=max_supports)
+                results['feasible_equilibria'] = [equilibrium.to_dict() for equilibrium in equilibria]
+                results['complete'] = analyzer.is_exhaustive(max_support_size, max_supports)
+                results['stable_equilibria'] = [equilibrium.support for equilibrium in equilibria
+                                                if equilibrium.stable]
+            
         except Exception as e:
             logger.error(f"Error in equilibrium analysis: {e}")
             results['error'] = str(e)
@@ -601,23 +1003,17 @@ class LegalMemespace:
                                    growth_rates: np.ndarray,
                                    carrying_capacities: np.ndarray) -> np.ndarray:
         """Calculate the community matrix for stability analysis."""
-        n = len(equilibrium_pops)
-        community_matrix = np.zeros((n, n))
-        
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    # Diagonal elements
-                    community_matrix[i, i] = -growth_rates[i] * competition_matrix[i, i] * equilibrium_pops[i] / carrying_capacities[i]
-                else:
-                    # Off-diagonal elements
-                    community_matrix[i, j] = -growth_rates[i] * competition_matrix[i, j] * equilibrium_pops[i] / carrying_capacities[i]
-        
-        return community_matrix
+        # C_ij = -r_i * alpha_ij * N_i / K_i
+        scale = np.asarray(growth_rates) * np.asarray(equilibrium_pops) / np.asarray(carrying_capacities)
+        return -scale[:, None] * np.asarray(competition_matrix, dtype=float)
     
     def cluster_doctrinal_space(self, coordinates: np.ndarray,
                                n_clusters: Optional[int] = None,
-                               max_clusters: int = 8) -> Tuple[np.ndarray, Dict]:
+                               max_clusters: int = 8,
+                               n_jobs: int = 1,
+                               silhouette_sample_size: Optional[int] = 10000,
+                               algorithm: str = 'kmeans',
+                               batch_size: int = 1024) -> Tuple[np.ndarray, Dict]:
         """
         Cluster cases in doctrinal space to identify doctrinal families.
         
@@ -629,41 +1025,73 @@ class LegalMemespace:
             Number of clusters. If None, optimal number is determined.
         max_clusters : int
             Maximum number of clusters to consider
+        n_jobs : int
+            Processes for the cluster-count sweep (-1 = all CPUs)
+        silhouette_sample_size : int, optional
+            Cases in the random subsample used for silhouette scores; every
+            candidate is scored on the same subsample. None scores all cases.
+        algorithm : str
+            'kmeans' or 'minibatch' (MiniBatchKMeans, for large corpora)
+        batch_size : int
+            Mini-batch size when algorithm is 'minibatch'
             
         Returns:
         --------
         Tuple[np.ndarray, Dict]
             Cluster labels and clustering information
         """
+        if algorithm not in CLUSTERING_ALGORITHMS:
+            raise ValueError(f"Unknown clustering algorithm '{algorithm}'. Choose from {CLUSTERING_ALGORITHMS}")
+        
+        coordinates = np.asarray(coordinates, dtype=float)
+        n_cases = len(coordinates)
+        if silhouette_sample_size is not None and silhouette_sample_size < n_cases:
+            rng = np.random.default_rng(self.random_state)
+            sample_indices = np.sort(rng.choice(n_cases, size=silhouette_sample_size, replace=False))
+        else:
+            sample_indices = None
+        
+        settings = {'algorithm': algorithm, 'batch_size': batch_size, 'random_state': self.random_state}
+        
         if n_clusters is None:
             # Find optimal number of clusters using silhouette analysis
-            silhouette_scores = []
-            cluster_range = range(2, min(max_clusters + 1, len(coordinates)))
+            cluster_range = range(2, min(max_clusters + 1, n_cases))
+            tasks = [(n, settings) for n in cluster_range]
+            n_jobs = cpu_count() if n_jobs == -1 else max(1, n_jobs)
             
-            for n in cluster_range:
-                kmeans = KMeans(n_clusters=n, random_state=self.random_state)
-                cluster_labels = kmeans.fit_predict(coordinates)
-                silhouette_avg = silhouette_score(coordinates, cluster_labels)
-                silhouette_scores.append(silhouette_avg)
+            if n_jobs == 1 or len(tasks) <= 1:
+                _init_cluster_worker(coordinates, sample_indices)
+                candidates = [_fit_cluster_candidate(task) for task in tasks]
+            else:
+                with Pool(min(n_jobs, len(tasks)), initializer=_init_cluster_worker,
+                          initargs=(coordinates, sample_indices)) as pool:
+                    candidates = pool.map(_fit_cluster_candidate, tasks)
+            _init_cluster_worker(None, None)
             
-            if silhouette_scores:
-                optimal_clusters = cluster_range[np.argmax(silhouette_scores)]
+            if candidates:
+                # Reuse the model already fitted for the winning cluster count
+                optimal_clusters, kmeans, cluster_labels, best_silhouette = max(candidates, key=lambda c: c[3])
             else:
                 optimal_clusters = 3  # Default
+                kmeans = None
         else:
             optimal_clusters = n_clusters
+            kmeans = None
         
-        # Perform final clustering
-        kmeans = KMeans(n_clusters=optimal_clusters, random_state=self.random_state)
-        cluster_labels = kmeans.fit_predict(coordinates)
+        if kmeans is None:
+            # Perform final clustering
+            _init_cluster_worker(coordinates, sample_indices)
+            optimal_clusters, kmeans, cluster_labels, best_silhouette = _fit_cluster_candidate((optimal_clusters, settings))
+            _init_cluster_worker(None, None)
         
         # Calculate cluster information
         cluster_info = {
             'n_clusters': optimal_clusters,
             'cluster_centers': kmeans.cluster_centers_.tolist(),
             'inertia': kmeans.inertia_,
-            'silhouette_score': silhouette_score(coordinates, cluster_labels) if len(set(cluster_labels)) > 1 else 0,
-            'cluster_sizes': [np.sum(cluster_labels == i) for i in range(optimal_clusters)]
+            'silhouette_score': best_silhouette if len(set(cluster_labels)) > 1 else 0,
+            'silhouette_sample_size': n_cases if sample_indices is None else len(sample_indices),
+            'cluster_sizes': np.bincount(cluster_labels, minlength=optimal_clusters).tolist()
         }
         
         logger.info(f"Doctrinal space clustered into {optimal_clusters} families")
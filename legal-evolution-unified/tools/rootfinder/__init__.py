@@ -9,9 +9,11 @@ License: MIT
 """
 
 from .rootfinder import RootFinder, GenealogyNode
+from .network import CompiledCitationNetwork
+from .cache import GenealogyCache
 
 __version__ = "1.0.0"
 __author__ = "Ignacio Adrián Lerer"
 __email__ = "adrian@lerer.com.ar"
 
-__all__ = ['RootFinder', 'GenealogyNode']
\ No newline at end of file
+__all__ = ['RootFinder', 'GenealogyNode', 'CompiledCitationNetwork', 'GenealogyCache']
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+RootFinder Genealogy Cache
+Bounded LRU cache of traced genealogies with targeted invalidation
+Author: Ignacio Adrián Lerer
+"""
+
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Tuple, Optional, Set, Iterable, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (target_case, max_depth, include_weak_paths, graph_version)
+GenealogyKey = Tuple[Any, int, bool, int]
+
+
+class GenealogyCache:
+    """
+    Size-bounded LRU cache of genealogies.
+
+    Entries are keyed by (target_case, max_depth, include_weak_paths,
+    graph_version), so lineages traced on an older version of a network
+    are never served for a newer one and age out under LRU eviction.
+    Each entry also records the cases its trace visited, which lets
+    edge additions invalidate exactly the lineages that pass through a
+    changed case and carry the rest over to the new graph version.
+
+    Example:
+    --------
+    >>> cache = GenealogyCache(max_size=1024)
+    >>> cache.put(('Vizzoti_2004', 10, False, 3), genealogy)
+    >>> cache.get(('Vizzoti_2004', 10, False, 3))
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Parameters:
+        -----------
+        max_size : int
+            Maximum number of cached genealogies (0 disables caching)
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must be >= 0, got {max_size}")
+        self.max_size = max_size
+        self._entries: 'OrderedDict[GenealogyKey, list]' = OrderedDict()
+        self._dependents: Dict[Any, Set[GenealogyKey]] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: GenealogyKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: GenealogyKey) -> Optional[list]:
+        """Cached genealogy for key (marked most recently used), or None."""
+        genealogy = self._entries.get(key)
+        if genealogy is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return genealogy
+
+    def put(self, key: GenealogyKey, genealogy: list):
+        """Cache a genealogy, evicting least recently used entries beyond max_size."""
+        if self.max_size == 0:
+            return
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = genealogy
+        for case in self._visited_cases(key, genealogy):
+            self._dependents[case].add(key)
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, cases: Iterable[Any], graph_version: Optional[int] = None) -> int:
+        """
+        Drop genealogies whose trace visited any of cases.
+
+        Parameters:
+        -----------
+        cases : Iterable
+            Cases whose genealogy step changed
+        graph_version : int, optional
+            Only drop entries of this graph version (default: all versions)
+
+        Returns:
+        --------
+        int
+            Number of entries dropped
+        """
+        stale = set()
+        for case in cases:
+            stale.update(key for key in self._dependents.get(case, ())
+                         if graph_version is None or key[3] == graph_version)
+        for key in stale:
+            self._discard(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_version(self, graph_version: int) -> int:
+        """Drop every genealogy traced on a graph version."""
+        stale = [key for key in self._entries if key[3] == graph_version]
+        for key in stale:
+            self._discard(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def migrate(self, old_version: int, new_version: int):
+        """Re-key the remaining entries of old_version to new_version, keeping LRU order."""
+        entries = OrderedDict()
+        for key, genealogy in self._entries.items():
+            if key[3] == old_version:
+                new_key = key[:3] + (new_version,)
+                for case in self._visited_cases(key, genealogy):
+                    self._dependents[case].discard(key)
+                    self._dependents[case].add(new_key)
+                key = new_key
+            entries[key] = genealogy
+        self._entries = entries
+
+    def clear(self):
+        """Remove all entries (statistics are kept)."""
+        self._entries.clear()
+        self._dependents.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            Size, capacity, hits, misses, hit rate, evictions and invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+    def _discard(self, key: GenealogyKey):
+        genealogy = self._entries.pop(key)
+        for case in self._visited_cases(key, genealogy):
+            dependents = self._dependents.get(case)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[case]
+
+    @staticmethod
+    def _visited_cases(key: GenealogyKey, genealogy: List) -> Set[Any]:
+        """Cases whose genealogy step the trace evaluated (target and every ancestor reached)."""
+        return {key[0], *(node.case_id for node in genealogy)}
@@ -7,14 +7,23 @@ Author: Ignacio Adrián Lerer
 import networkx as nx
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
-from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Optional, Set, Callable, Iterable, Union
+from dataclasses import dataclass, field, replace
 import logging
 from collections import defaultdict, deque
 import json
+import weakref
+
+from .network import CompiledCitationNetwork, extract_doctrinal_elements, popcount
+from .cache import GenealogyCache
 
 logger = logging.getLogger(__name__)
 
+# Citation network accepted by RootFinder: networkx graph or compiled network
+CitationNetwork = Union[nx.DiGraph, CompiledCitationNetwork]
+
+_NANOSECONDS_PER_DAY = 86_400 * 10**9
+
 @dataclass
 class GenealogyNode:
     """Represents a node in the genealogical tree."""
@@ -52,7 +61,7 @@ class RootFinder:
     
     def __init__(self, min_citation_strength: float = 0.1,
                  max_doctrinal_distance: float = 0.8,
-                 fidelity_threshold: float = 0.3):
+                 fidelity_threshold: float = 0.3, cache_size: int = 1024):
         """
         Initialize RootFinder.
         
@@ -64,13 +73,16 @@ class RootFinder:
             Maximum doctrinal distance to consider as same lineage
         fidelity_threshold : float
             Threshold for considering inheritance as "faithful"
+        cache_size : int
+            Maximum number of cached genealogies (least recently used are evicted)
         """
         self.min_citation_strength = min_citation_strength
         self.max_doctrinal_distance = max_doctrinal_distance
         self.fidelity_threshold = fidelity_threshold
-        self.genealogy_cache = {}
+        self.genealogy_cache = GenealogyCache(max_size=cache_size)
+        self._compiled_networks = weakref.WeakKeyDictionary()
         
-    def trace_genealogy(self, target_case: str, citation_network: nx.DiGraph, 
+    def trace_genealogy(self, target_case: str, citation_network: CitationNetwork, 
                        max_depth: int = 10, include_weak_paths: bool = False) -> List[GenealogyNode]:
         """
         Trace the genealogical lineage of a legal doctrine using ABAN algorithm.
@@ -79,7 +91,7 @@ class RootFinder:
         -----------
         target_case : str
             Case ID to trace backwards from
-        citation_network : nx.DiGraph
+        citation_network : nx.DiGraph or CompiledCitationNetwork
             Directed graph of citations (edge from citing to cited case)
         max_depth : int
             Maximum generations to trace back
@@ -91,181 +103,331 @@ class RootFinder:
         List[GenealogyNode]
             Genealogical path from target to root ancestors
         """
-        if target_case in self.genealogy_cache:
+        network = self.compile_network(citation_network)
+        cache_key = (target_case, max_depth, include_weak_paths, network.version)
+        cached = self.genealogy_cache.get(cache_key)
+        if cached is not None:
             logger.info(f"Using cached genealogy for {target_case}")
-            return self.genealogy_cache[target_case]
+            return cached
         
         logger.info(f"Tracing genealogy for {target_case} (max_depth: {max_depth})")
         
-        genealogy = []
-        current_case = target_case
-        visited = set()
-        depth = 0
+        genealogy = self._walk_lineage(
+            target_case,
+            lambda case: self._genealogy_step(case, network, include_weak_paths),
+            max_depth
+        )
         
-        while depth < max_depth and current_case not in visited:
-            visited.add(current_case)
-            
-            # Get citations (ancestors)
-            ancestors = list(citation_network.predecessors(current_case))
-            
-            if not ancestors:
-                logger.debug(f"No more ancestors found for {current_case} at depth {depth}")
-                break
+        # Cache the result
+        self.genealogy_cache.put(cache_key, genealogy)
+        
+        logger.info(f"Genealogy traced: {len(genealogy)} generations for {target_case}")
+        return genealogy
+    
+    def compile_network(self, citation_network: CitationNetwork) -> CompiledCitationNetwork:
+        """
+        Compiled (indexed, array-backed) form of a citation network.
+        
+        Compiled networks are memoized per graph object and recompiled when
+        its number of nodes or edges or its graph['version'] changes. Use
+        add_citations to add citations; after editing the graph otherwise,
+        increment citation_network.graph['version'] so cached genealogies
+        of the old version are no longer served.
+        
+        Parameters:
+        -----------
+        citation_network : nx.DiGraph or CompiledCitationNetwork
+            Directed graph of citations (edge from citing to cited case)
             
-            # Filter ancestors by citation strength if required
-            if not include_weak_paths:
-                filtered_ancestors = []
-                for ancestor in ancestors:
-                    edge_data = citation_network.get_edge_data(current_case, ancestor, {})
-                    strength = edge_data.get('weight', 1.0)
-                    if strength >= self.min_citation_strength:
-                        filtered_ancestors.append(ancestor)
-                ancestors = filtered_ancestors
-                
-                if not ancestors:
-                    logger.debug(f"No strong citations found for {current_case}")
-                    break
+        Returns:
+        --------
+        CompiledCitationNetwork
+            Network that all RootFinder algorithms run against
+        """
+        if isinstance(citation_network, CompiledCitationNetwork):
+            return citation_network
+        
+        signature = (citation_network.number_of_nodes(), citation_network.number_of_edges(),
+                     citation_network.graph.get('version', 0))
+        cached = self._compiled_networks.get(citation_network)
+        if cached is None or cached[0] != signature:
+            cached = (signature, CompiledCitationNetwork(citation_network))
+            self._compiled_networks[citation_network] = cached
+        return cached[1]
+    
+    def add_citations(self, citation_network: nx.DiGraph, citations: Iterable) -> Set[str]:
+        """
+        Add citations to a network and invalidate only the affected genealogies.
+        
+        A new citation u -> v changes the genealogy step of v (new
+        ancestor), of the cases v cites (v's precedential weight changes)
+        and of u if v cites u (citation strength). Cached genealogies whose
+        trace visited one of these cases are dropped; the others are carried
+        over to the new graph version. Citations that add new cases change
+        the network size, which rescales every precedential weight, so all
+        genealogies of the old version are dropped.
+        
+        Parameters:
+        -----------
+        citation_network : nx.DiGraph
+            Citation network to update in place
+        citations : Iterable
+            (citing_case, cited_case) or (citing_case, cited_case, attributes) tuples
             
-            # Find primary ancestor (strongest precedential connection)
-            primary_ancestor = self._identify_primary_ancestor(
-                current_case, ancestors, citation_network
-            )
+        Returns:
+        --------
+        Set[str]
+            Cases whose genealogy step changed
+        """
+        if not isinstance(citation_network, nx.DiGraph):
+            raise TypeError("Citations can only be added to an nx.DiGraph citation network")
+        
+        citations = list(citations)
+        old_network = self.compile_network(citation_network)
+        adds_cases = any(citation[0] not in citation_network or citation[1] not in citation_network
+                         for citation in citations)
+        
+        citation_network.add_edges_from(citations)
+        citation_network.graph['version'] = citation_network.graph.get('version', 0) + 1
+        new_network = self.compile_network(citation_network)
+        
+        if adds_cases:
+            changed = set(citation_network.nodes)
+            dropped = self.genealogy_cache.invalidate_version(old_network.version)
+        else:
+            changed = set()
+            for citing, cited, *_ in citations:
+                changed.add(cited)
+                changed.update(citation_network.successors(cited))
+                if citation_network.has_edge(cited, citing):
+                    changed.add(citing)
+            dropped = self.genealogy_cache.invalidate(changed, old_network.version)
+            self.genealogy_cache.migrate(old_network.version, new_network.version)
+        
+        logger.info(f"Added {len(citations)} citations: {len(changed)} cases changed, "
+                    f"{dropped} cached genealogies invalidated")
+        return changed
+    
+    def trace_genealogies(self, cases: Iterable[str], citation_network: CitationNetwork,
+                          max_depth: int = 10, include_weak_paths: bool = False) -> Dict[str, List[GenealogyNode]]:
+        """
+        Trace the genealogies of many cases at once.
+        
+        Each case's genealogy step (primary ancestor, inheritance, metrics)
+        depends only on that case, so it is computed once per case and
+        every incoming citation is analyzed once. Lineages are built in
+        reverse topological order of the primary-ancestor chains: a case's
+        lineage is its own step followed by its primary ancestor's lineage,
+        shifted one generation. Cases on a primary-ancestor cycle are
+        walked directly, as in trace_genealogy.
+        
+        Parameters:
+        -----------
+        cases : Iterable[str]
+            Case IDs to trace backwards from
+        citation_network : nx.DiGraph or CompiledCitationNetwork
+            Directed graph of citations (edge from citing to cited case)
+        max_depth : int
+            Maximum generations to trace back
+        include_weak_paths : bool
+            Whether to include genealogical paths with weak citations
             
-            # Analyze inheritance and mutations
-            inherited, mutations = self._analyze_inheritance(
-                current_case, primary_ancestor, citation_network
-            )
+        Returns:
+        --------
+        Dict[str, List[GenealogyNode]]
+            Genealogy of each case, as returned by trace_genealogy
+        """
+        cases = list(dict.fromkeys(cases))
+        logger.info(f"Tracing genealogies for {len(cases)} cases (max_depth: {max_depth})")
+        
+        network = self.compile_network(citation_network)
+        steps: Dict[str, Optional[GenealogyNode]] = {}
+        
+        def step(case: str) -> Optional[GenealogyNode]:
+            if case not in steps:
+                steps[case] = self._genealogy_step(case, network, include_weak_paths)
+            return steps[case]
+        
+        lineages: Dict[str, List[GenealogyNode]] = {}
+        results = {}
+        for target in cases:
+            cache_key = (target, max_depth, include_weak_paths, network.version)
+            cached = self.genealogy_cache.get(cache_key)
+            if cached is not None:
+                results[target] = cached
+                continue
             
-            # Calculate inheritance fidelity
-            fidelity = self._calculate_fidelity(inherited, mutations)
+            # Climb the primary-ancestor chain until a known lineage, a root or a cycle
+            path: List[str] = []
+            on_path: Dict[str, int] = {}
+            cycle_start = None
+            current = target
+            while max_depth > 0 and current not in lineages:
+                on_path[current] = len(path)
+                path.append(current)
+                node = step(current)
+                if node is None:
+                    break
+                current = node.case_id
+                if current in on_path:
+                    cycle_start = on_path[current]
+                    break
+            if cycle_start is None:
+                cycle_start = len(path)
             
-            # Classify mutation type
-            mutation_type = self._classify_mutation(mutations, inherited, fidelity)
+            # Cases on a cycle revisit themselves, so their lineages are walked
+            for case in path[cycle_start:]:
+                lineages[case] = self._walk_lineage(case, step, max_depth)
             
-            # Calculate additional metrics
-            citation_strength = self._get_citation_strength(
-                current_case, primary_ancestor, citation_network
-            )
+            # Unwind: every other case extends its primary ancestor's lineage
+            for case in reversed(path[:cycle_start]):
+                node = step(case)
+                if node is None:
+                    lineages[case] = []
+                else:
+                    lineages[case] = [node] + [
+                        replace(ancestor, generation=ancestor.generation + 1)
+                        for ancestor in lineages[node.case_id][:max_depth - 1]
+                    ]
             
-            doctrinal_distance = self._calculate_doctrinal_distance(
-                current_case, primary_ancestor, citation_network
-            )
+            results[target] = lineages.get(target, [])
+            self.genealogy_cache.put(cache_key, results[target])
+        
+        logger.info(f"Genealogies traced for {len(cases)} cases ({len(steps)} genealogy steps)")
+        return results
+    
+    def _genealogy_step(self, case: str, network: CompiledCitationNetwork,
+                        include_weak_paths: bool) -> Optional[GenealogyNode]:
+        """
+        One generation of the ABAN algorithm.
+        
+        Returns the genealogy node (generation 0) of the primary ancestor
+        of a case, or None if the case has no (strong) ancestors.
+        """
+        if case not in network:
+            raise nx.NetworkXError(f"The node {case} is not in the digraph.")
+        case_index = network.index[case]
+        
+        # Get citations (ancestors) and their strengths
+        ancestors = network.ancestors(case_index)
+        strengths = network.strengths(case_index)
+        
+        if not len(ancestors):
+            logger.debug(f"No more ancestors found for {case}")
+            return None
+        
+        # Filter ancestors by citation strength if required
+        if not include_weak_paths:
+            strong = strengths >= self.min_citation_strength
+            ancestors, strengths = ancestors[strong], strengths[strong]
             
-            precedential_weight = self._calculate_precedential_weight(
-                primary_ancestor, citation_network
-            )
+            if not len(ancestors):
+                logger.debug(f"No strong citations found for {case}")
+                return None
+        
+        # Find primary ancestor (strongest precedential connection)
+        position = self._identify_primary_ancestor(case_index, ancestors, strengths, network)
+        primary_ancestor = int(ancestors[position])
+        
+        # Analyze inheritance and mutations
+        inherited, mutations = self._analyze_inheritance(
+            case_index, primary_ancestor, network
+        )
+        
+        # Calculate inheritance fidelity
+        fidelity = self._calculate_fidelity(inherited, mutations)
+        
+        # Classify mutation type
+        mutation_type = self._classify_mutation(mutations, inherited, fidelity)
+        
+        # Calculate additional metrics
+        citation_strength = float(strengths[position])
+        
+        doctrinal_distance = float(self._calculate_doctrinal_distance(
+            case_index, np.array([primary_ancestor]), network
+        )[0])
+        
+        precedential_weight = float(network.precedential_weight[primary_ancestor])
+        
+        return GenealogyNode(
+            case_id=network.case_ids[primary_ancestor],
+            generation=0,
+            inherited_elements=inherited,
+            mutations=mutations,
+            inheritance_fidelity=fidelity,
+            mutation_type=mutation_type,
+            citation_strength=citation_strength,
+            doctrinal_distance=doctrinal_distance,
+            precedential_weight=precedential_weight
+        )
+    
+    @staticmethod
+    def _walk_lineage(target_case: str, step: Callable[[str], Optional[GenealogyNode]],
+                      max_depth: int) -> List[GenealogyNode]:
+        """Follow primary ancestors from a case until max_depth, a root or a revisited case."""
+        genealogy = []
+        current_case = target_case
+        visited = set()
+        depth = 0
+        
+        while depth < max_depth and current_case not in visited:
+            visited.add(current_case)
             
-            # Create genealogy node
-            node = GenealogyNode(
-                case_id=primary_ancestor,
-                generation=depth,
-                inherited_elements=inherited,
-                mutations=mutations,
-                inheritance_fidelity=fidelity,
-                mutation_type=mutation_type,
-                citation_strength=citation_strength,
-                doctrinal_distance=doctrinal_distance,
-                precedential_weight=precedential_weight
-            )
+            node = step(current_case)
+            if node is None:
+                break
             
-            genealogy.append(node)
-            current_case = primary_ancestor
+            genealogy.append(replace(node, generation=depth))
+            current_case = node.case_id
             depth += 1
-            
-        # Cache the result
-        self.genealogy_cache[target_case] = genealogy
         
-        logger.info(f"Genealogy traced: {len(genealogy)} generations for {target_case}")
         return genealogy
     
-    def _identify_primary_ancestor(self, case: str, ancestors: List[str], 
-                                   network: nx.DiGraph) -> str:
+    def _identify_primary_ancestor(self, case: int, ancestors: np.ndarray, strengths: np.ndarray,
+                                   network: CompiledCitationNetwork) -> int:
         """
         Identify the primary precedential ancestor using multiple criteria.
+        
+        Returns the position of the primary ancestor in ancestors (the first
+        one on ties).
         """
         if len(ancestors) == 1:
-            return ancestors[0]
+            return 0
         
-        scores = {}
-        
-        for ancestor in ancestors:
-            score = 0.0
-            
-            # Citation strength weight (40%)
-            edge_data = network.get_edge_data(case, ancestor, {})
-            citation_weight = edge_data.get('weight', 1.0)
-            score += 0.4 * citation_weight
-            
-            # Precedential importance (30%)
-            precedential_weight = self._calculate_precedential_weight(ancestor, network)
-            score += 0.3 * precedential_weight
-            
-            # Doctrinal similarity (20%)
-            doctrinal_similarity = 1.0 - self._calculate_doctrinal_distance(case, ancestor, network)
-            score += 0.2 * doctrinal_similarity
-            
-            # Temporal proximity (10%)
-            temporal_score = self._calculate_temporal_proximity(case, ancestor, network)
-            score += 0.1 * temporal_score
-            
-            scores[ancestor] = score
+        # Citation strength (40%), precedential importance (30%),
+        # doctrinal similarity (20%), temporal proximity (10%)
+        doctrinal_similarity = 1.0 - self._calculate_doctrinal_distance(case, ancestors, network)
+        temporal_score = self._calculate_temporal_proximity(case, ancestors, network)
+        scores = (0.4 * strengths + 0.3 * network.precedential_weight[ancestors]
+                  + 0.2 * doctrinal_similarity + 0.1 * temporal_score)
         
         # Return ancestor with highest composite score
-        primary_ancestor = max(scores.items(), key=lambda x: x[1])[0]
-        logger.debug(f"Primary ancestor for {case}: {primary_ancestor} (score: {scores[primary_ancestor]:.3f})")
+        position = int(np.argmax(scores))
+        logger.debug(f"Primary ancestor for {network.case_ids[case]}: "
+                     f"{network.case_ids[ancestors[position]]} (score: {scores[position]:.3f})")
         
-        return primary_ancestor
+        return position
     
-    def _analyze_inheritance(self, child: str, parent: str, 
-                            network: nx.DiGraph) -> Tuple[List[str], List[str]]:
+    def _analyze_inheritance(self, child: int, parent: int, 
+                            network: CompiledCitationNetwork) -> Tuple[List[str], List[str]]:
         """
         Analyze doctrinal inheritance and mutations between cases.
         """
-        # Extract doctrinal elements from node attributes
-        child_attrs = network.nodes.get(child, {})
-        parent_attrs = network.nodes.get(parent, {})
-        
-        # Handle different formats of doctrinal elements
-        child_elements = self._extract_doctrinal_elements(child_attrs)
-        parent_elements = self._extract_doctrinal_elements(parent_attrs)
+        child_elements = network.element_bits[child]
+        parent_elements = network.element_bits[parent]
         
         # Calculate inheritance and mutations
-        inherited = list(child_elements & parent_elements)
-        mutations = list(child_elements - parent_elements)
+        inherited = network.element_names(child_elements & parent_elements)
+        mutations = network.element_names(child_elements & ~parent_elements)
         
-        logger.debug(f"Inheritance analysis {parent} -> {child}: "
+        logger.debug(f"Inheritance analysis {network.case_ids[parent]} -> {network.case_ids[child]}: "
                     f"{len(inherited)} inherited, {len(mutations)} mutations")
         
         return inherited, mutations
     
     def _extract_doctrinal_elements(self, attrs: Dict) -> Set[str]:
         """Extract doctrinal elements from case attributes."""
-        elements = set()
-        
-        # Try multiple possible attribute names
-        element_keys = ['doctrinal_elements', 'doctrine_tags', 'legal_principles', 
-                       'holdings', 'ratio_decidendi']
-        
-        for key in element_keys:
-            if key in attrs:
-                value = attrs[key]
-                if isinstance(value, (list, tuple)):
-                    elements.update(str(v) for v in value)
-                elif isinstance(value, str):
-                    # Handle comma-separated strings
-                    elements.update(v.strip() for v in value.split(',') if v.strip())
-                break
-        
-        # If no explicit doctrinal elements, infer from other attributes
-        if not elements and attrs:
-            # Use case characteristics as proxy doctrinal elements
-            for key, value in attrs.items():
-                if key in ['emergency_power', 'state_intervention', 'property_rights', 
-                          'due_process', 'constitutional_interpretation']:
-                    if value:
-                        elements.add(f"{key}:{value}")
-        
-        return elements
+        return extract_doctrinal_elements(attrs)
     
     def _calculate_fidelity(self, inherited: List[str], mutations: List[str]) -> float:
         """Calculate inheritance fidelity score."""
@@ -299,90 +461,46 @@ class RootFinder:
             else:
                 return "transformative" # Substantial change
     
-    def _get_citation_strength(self, citing_case: str, cited_case: str, 
-                              network: nx.DiGraph) -> float:
-        """Get citation strength between two cases."""
-        edge_data = network.get_edge_data(citing_case, cited_case, {})
-        return edge_data.get('weight', 1.0)
-    
-    def _calculate_doctrinal_distance(self, case1: str, case2: str, 
-                                     network: nx.DiGraph) -> float:
-        """Calculate doctrinal distance between two cases."""
-        attrs1 = network.nodes.get(case1, {})
-        attrs2 = network.nodes.get(case2, {})
-        
-        elements1 = self._extract_doctrinal_elements(attrs1)
-        elements2 = self._extract_doctrinal_elements(attrs2)
-        
-        if not elements1 and not elements2:
-            return 0.0
-        
-        if not elements1 or not elements2:
-            return 1.0
-        
-        # Calculate Jaccard distance (1 - Jaccard similarity)
-        intersection = len(elements1 & elements2)
-        union = len(elements1 | elements2)
-        
-        jaccard_similarity = intersection / union if union > 0 else 0
-        jaccard_distance = 1.0 - jaccard_similarity
+    def _calculate_doctrinal_distance(self, case: int, others: np.ndarray,
+                                     network: CompiledCitationNetwork) -> np.ndarray:
+        """Jaccard distance between a case and each of others, from doctrinal element bitsets."""
+        elements1 = network.element_bits[case]
+        distances = []
+        
+        for other in others.tolist():
+            elements2 = network.element_bits[other]
+            
+            if not elements1 and not elements2:
+                distances.append(0.0)
+            elif not elements1 or not elements2:
+                distances.append(1.0)
+            else:
+                # Calculate Jaccard distance (1 - Jaccard similarity)
+                intersection = popcount(elements1 & elements2)
+                union = popcount(elements1 | elements2)
+                distances.append(1.0 - intersection / union)
         
-        return jaccard_distance
+        return np.array(distances)
     
-    def _calculate_precedential_weight(self, case: str, network: nx.DiGraph) -> float:
-        """Calculate the precedential importance of a case."""
-        # Number of cases citing this case (in-degree)
-        in_degree = network.in_degree(case, weight='weight')
-        
-        # Normalize by network size
-        max_possible_citations = len(network.nodes) - 1
-        if max_possible_citations == 0:
-            return 0.0
-        
-        normalized_weight = min(in_degree / max_possible_citations, 1.0)
-        
-        # Apply court hierarchy boost if available
-        attrs = network.nodes.get(case, {})
-        court_level = attrs.get('court_level', 'Lower Court')
-        
-        hierarchy_multiplier = {
-            'Supreme Court': 1.0,
-            'Appeals Court': 0.8,
-            'Federal Court': 0.7,
-            'Provincial Supreme': 0.6,
-            'Lower Court': 0.5
-        }.get(court_level, 0.5)
-        
-        return normalized_weight * hierarchy_multiplier
+    def _calculate_precedential_weight(self, cases: np.ndarray,
+                                       network: CompiledCitationNetwork) -> np.ndarray:
+        """Precedential importance: normalized weighted in-degree times court hierarchy multiplier."""
+        return network.precedential_weight[cases]
     
-    def _calculate_temporal_proximity(self, case1: str, case2: str, 
-                                     network: nx.DiGraph) -> float:
-        """Calculate temporal proximity score between cases."""
-        attrs1 = network.nodes.get(case1, {})
-        attrs2 = network.nodes.get(case2, {})
+    def _calculate_temporal_proximity(self, case: int, others: np.ndarray,
+                                     network: CompiledCitationNetwork) -> np.ndarray:
+        """Temporal proximity between a case and each of others (0.5 where a date is missing)."""
+        # Whole days between cases (floor, as Timedelta.days), then years
+        days = (network.dates[case] - network.dates[others]) // _NANOSECONDS_PER_DAY
+        years_diff = np.abs(days / 365.25)
         
-        date1 = attrs1.get('date')
-        date2 = attrs2.get('date')
+        # Exponential decay: closer in time = higher score
+        proximity = np.minimum(np.exp(-0.1 * years_diff), 1.0)  # 10% decay per year
         
-        if not date1 or not date2:
-            return 0.5  # Default medium proximity
-        
-        try:
-            dt1 = pd.to_datetime(date1)
-            dt2 = pd.to_datetime(date2)
-            
-            years_diff = abs((dt1 - dt2).days / 365.25)
-            
-            # Exponential decay: closer in time = higher score
-            proximity = np.exp(-0.1 * years_diff)  # 10% decay per year
-            
-            return min(proximity, 1.0)
-            
-        except Exception:
-            return 0.5
+        return np.where(network.has_date[case] & network.has_date[others], proximity, 0.5)
     
     def calculate_peralta_dominance(self, all_cases: List[str], 
-                                   citation_network: nx.DiGraph,
+                                   citation_network: CitationNetwork,
                                    peralta_case_id: str = 'Peralta_1990') -> Dict[str, float]:
         """
         Calculate percentage of cases tracing back to Peralta and related metrics.
@@ -391,7 +509,7 @@ class RootFinder:
         -----------
         all_cases : List[str]
             List of all case IDs to analyze
-        citation_network : nx.DiGraph
+        citation_network : nx.DiGraph or CompiledCitationNetwork
             Citation network
         peralta_case_id : str
             Case ID for the Peralta decision
@@ -408,38 +526,42 @@ class RootFinder:
         generation_stats = defaultdict(int)
         fidelity_scores = []
         
-        for case in all_cases:
-            if case == peralta_case_id:
+        # Trace all genealogies in one batch, sharing ancestor chains
+        network = self.compile_network(citation_network)
+        cases = [case for case in all_cases if case != peralta_case_id]
+        genealogies = self.trace_genealogies(
+            [case for case in cases if case in network],
+            network
+        )
+        
+        for case in cases:
+            if case not in genealogies:
+                logger.warning(f"Error tracing genealogy for {case}: case not in citation network")
                 continue
+            
+            genealogy = genealogies[case]
+            case_ids = [node.case_id for node in genealogy]
+            
+            total_analyzed += 1
+            
+            if peralta_case_id in case_ids:
+                peralta_descendants += 1
                 
-            try:
-                genealogy = self.trace_genealogy(case, citation_network)
-                case_ids = [node.case_id for node in genealogy]
+                # Find Peralta in genealogy
+                peralta_generation = None
+                peralta_fidelity = None
                 
-                total_analyzed += 1
+                for node in genealogy:
+                    if node.case_id == peralta_case_id:
+                        peralta_generation = node.generation
+                        peralta_fidelity = node.inheritance_fidelity
+                        break
                 
-                if peralta_case_id in case_ids:
-                    peralta_descendants += 1
-                    
-                    # Find Peralta in genealogy
-                    peralta_generation = None
-                    peralta_fidelity = None
+                if peralta_generation is not None:
+                    generation_stats[peralta_generation] += 1
                     
-                    for node in genealogy:
-                        if node.case_id == peralta_case_id:
-                            peralta_generation = node.generation
-                            peralta_fidelity = node.inheritance_fidelity
-                            break
-                    
-                    if peralta_generation is not None:
-                        generation_stats[peralta_generation] += 1
-                        
-                    if peralta_fidelity is not None:
-                        fidelity_scores.append(peralta_fidelity)
-                        
-            except Exception as e:
-                logger.warning(f"Error tracing genealogy for {case}: {e}")
-                continue
+                if peralta_fidelity is not None:
+                    fidelity_scores.append(peralta_fidelity)
         
         # Calculate metrics
         dominance_rate = peralta_descendants / total_analyzed if total_analyzed > 0 else 0
@@ -459,7 +581,7 @@ class RootFinder:
         
         return results
     
-    def find_doctrinal_roots(self, cases: List[str], citation_network: nx.DiGraph,
+    def find_doctrinal_roots(self, cases: List[str], citation_network: CitationNetwork,
                            min_descendants: int = 5) -> Dict[str, Dict]:
         """
         Identify foundational cases that serve as doctrinal roots.
@@ -468,7 +590,7 @@ class RootFinder:
         -----------
         cases : List[str]
             Cases to analyze
-        citation_network : nx.DiGraph
+        citation_network : nx.DiGraph or CompiledCitationNetwork
             Citation network
         min_descendants : int
             Minimum number of descendant cases to be considered a root
@@ -482,9 +604,10 @@ class RootFinder:
         
         # Count descendants for each potential root
         descendant_counts = defaultdict(set)
+        genealogies = self.trace_genealogies(cases, citation_network)
         
         for case in cases:
-            genealogy = self.trace_genealogy(case, citation_network)
+            genealogy = genealogies[case]
             
             for node in genealogy:
                 descendant_counts[node.case_id].add(case)
@@ -500,7 +623,7 @@ class RootFinder:
                 
                 # Analyze all genealogies that include this root
                 for descendant in descendants:
-                    genealogy = self.trace_genealogy(descendant, citation_network)
+                    genealogy = genealogies[descendant]
                     
                     for node in genealogy:
                         if node.case_id == potential_root:
@@ -570,6 +693,7 @@ class RootFinder:
         logger.info(f"Genealogy exported to {output_path} ({format} format)")
         
     def clear_cache(self):
-        """Clear the genealogy cache."""
+        """Clear the genealogy cache and compiled networks."""
         self.genealogy_cache.clear()
+        self._compiled_networks.clear()
         logger.info("Genealogy cache cleared")
\ No newline at end of file